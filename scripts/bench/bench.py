@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Validator benchmark suite with a regression gate
+
+Times each validator phase separately on the deterministic corpus from
+corpus.py and stores the results as JSON:
+
+    hash               calculate_sha256() (DoD/PRD) / file_content_hash() (OKR)
+    validate_dod       validate_dod(path, use_cache=False) - includes its hash
+    validate_prd       validate_prd(path, use_cache=False) - includes its hash
+    validate_okr_form  validate_okr_form(data) on the parsed document, with an
+                       offline CapabilityIndex (no Brain); documents at or above
+                       validate-okr.py's STREAM_THRESHOLD are timed through
+                       validate_okr_stream() instead, as the CLI does
+
+Usage:
+    python3 scripts/bench/bench.py run [--profile quick] [--output results.json]
+    python3 scripts/bench/bench.py run --gate            # run, then compare
+    python3 scripts/bench/bench.py compare results.json [--baseline FILE]
+    python3 scripts/bench/bench.py run --output scripts/bench/baselines/quick.json
+
+Every phase is run --repeat times; the best run is compared. Timings are
+also stored divided by a fixed calibration workload measured in the same
+run, so a baseline recorded on one machine gates another. A phase
+regresses when its normalized time grows past --threshold (default 25%)
+and by more than --min-delta seconds (timer noise on tiny documents).
+
+The result cache is disabled for the whole run. Generated documents are
+kept in --corpus-dir (default: $TMPDIR/cecelia-bench-corpus) and reused.
+
+Exit codes:
+    0 - No regression (or no --gate)
+    1 - At least one phase regressed
+    2 - Error (unknown profile/case, missing baseline, etc.)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import corpus
+
+# Results are only comparable when scoring starts from scratch
+os.environ['CECELIA_VALIDATION_CACHE'] = '0'
+
+BENCH_DIR = Path(__file__).resolve().parent
+ENGINE_ROOT = BENCH_DIR.parents[1]
+sys.path.insert(0, str(ENGINE_ROOT / 'skills' / 'dev' / 'scripts'))
+
+from cecelia_validation.capabilities import CapabilityIndex  # noqa: E402
+from cecelia_validation.cli import load_validator  # noqa: E402
+
+RESULTS_FORMAT = 1
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA = 0.005
+
+# profile -> cases '<corpus kind>-<amount>' (bytes, or pr_plans for okr-graph)
+PROFILES = {
+    'smoke': ['dod-1K', 'prd-1K', 'okr-1K', 'okr-graph-100'],
+    'quick': ['dod-1K', 'dod-1M', 'dod-10M',
+              'prd-1K', 'prd-1M', 'prd-10M',
+              'okr-1K', 'okr-1M', 'okr-10M',
+              'okr-graph-1k', 'okr-graph-10k', 'okr-graph-100k'],
+    'full': ['dod-1K', 'dod-1M', 'dod-10M', 'dod-100M', 'dod-500M',
+             'prd-1K', 'prd-1M', 'prd-10M', 'prd-100M', 'prd-500M',
+             'okr-1K', 'okr-1M', 'okr-10M', 'okr-100M', 'okr-500M',
+             'okr-graph-1k', 'okr-graph-10k', 'okr-graph-100k'],
+}
+
+
+class BenchError(Exception):
+    """Invalid benchmark input (exit code 2)"""
+
+
+def parse_case(name: str) -> tuple:
+    """'dod-10M' -> ('dod', 10485760); 'okr-graph-100k' -> ('okr-graph', 100000)"""
+    kind, _, amount = name.rpartition('-')
+    if kind not in corpus.KINDS:
+        raise BenchError(f"unknown case: {name} (kinds: {', '.join(corpus.KINDS)})")
+    try:
+        if kind == 'okr-graph':
+            return kind, corpus.parse_count(amount)
+        return kind, corpus.parse_size(amount)
+    except ValueError as e:
+        raise BenchError(f"unknown case: {name} ({e})") from None
+
+
+def default_corpus_dir() -> Path:
+    return Path(tempfile.gettempdir()) / 'cecelia-bench-corpus'
+
+
+def corpus_file(corpus_dir, name: str, seed: int) -> Path:
+    """Generate a case's document unless an identical one is already cached"""
+    kind, amount = parse_case(name)
+    suffix = '.json' if kind.startswith('okr') else '.md'
+    path = Path(corpus_dir) / f"{name}.s{seed}.g{corpus.GENERATOR_VERSION}{suffix}"
+    if not path.exists():
+        corpus.generate(kind, amount, path, seed)
+    return path
+
+
+def calibrate(repeat: int = 7) -> float:
+    """Best time of a fixed hashing + string-scanning workload (machine speed)"""
+    blob = ('验证 checklist - [ ] Test: `bash t.sh`\n' * 65536).encode('utf-8')
+    text = blob.decode('utf-8')
+
+    def workload():
+        for _ in range(8):
+            hashlib.sha256(blob).hexdigest()
+        hits = 0
+        for line in text.split('\n'):
+            stripped = line.strip()
+            if stripped.startswith('- [') and 'Test:' in line:
+                hits += 1
+        json.dumps([{'line': i, 'text': text[i:i + 16]} for i in range(65536)], sort_keys=True)
+        return hits
+
+    return min(_time(workload) for _ in range(repeat))
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _measure(fn, repeat: int) -> dict:
+    runs = [_time(fn) for _ in range(repeat)]
+    return {'best': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+
+def _capability_index() -> CapabilityIndex:
+    return CapabilityIndex(f"cap-bench-{i:04d}" for i in range(corpus.CAPABILITY_POOL))
+
+
+def bench_case(name: str, path: Path, repeat: int) -> dict:
+    """Time every phase of one case's validator"""
+    kind, _ = parse_case(name)
+    phases = {}
+
+    if kind in ('dod', 'prd'):
+        validator = load_validator(kind)
+        validate = getattr(validator, f"validate_{kind}")
+        phases['hash'] = _measure(lambda: validator.calculate_sha256(path), repeat)
+        phases[f"validate_{kind}"] = _measure(lambda: validate(str(path), use_cache=False), repeat)
+        return {'kind': kind, 'bytes': path.stat().st_size, 'phases': phases}
+
+    okr = load_validator('okr')
+    index = _capability_index()
+    phases['hash'] = _measure(lambda: okr.file_content_hash(path), repeat)
+    if path.stat().st_size >= okr.STREAM_THRESHOLD:
+        def stream():
+            with open(path) as f:
+                okr.validate_okr_stream(f, use_cache=False, capability_index=index)
+        phases['validate_okr_stream'] = _measure(stream, repeat)
+    else:
+        with open(path) as f:
+            data = json.load(f)
+        phases['validate_okr_form'] = _measure(lambda: okr.validate_okr_form(data, index), repeat)
+    return {'kind': kind, 'bytes': path.stat().st_size, 'phases': phases}
+
+
+def run(cases, repeat: int = 3, seed: int = 0, corpus_dir=None, profile: str = None,
+        log=None) -> dict:
+    """
+    Benchmark cases and return the results document
+
+    Args:
+        cases: Case names ('dod-1M', 'okr-graph-10k', ...)
+        repeat: Runs per phase (the best is compared)
+        seed: Corpus seed
+        corpus_dir: Where generated documents are kept
+        profile: Profile name recorded in the results
+        log: Optional callable for progress lines
+
+    Returns:
+        dict (see RESULTS_FORMAT)
+    """
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_corpus_dir()
+    log = log or (lambda line: None)
+
+    for name in cases:
+        parse_case(name)
+
+    calibration = calibrate()
+    results = {
+        'format': RESULTS_FORMAT,
+        'profile': profile,
+        'seed': seed,
+        'repeat': repeat,
+        'generator_version': corpus.GENERATOR_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'machine': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'calibration_seconds': calibration,
+        'cases': {}
+    }
+
+    for name in cases:
+        path = corpus_file(corpus_dir, name, seed)
+        case = bench_case(name, path, repeat)
+        for phase in case['phases'].values():
+            phase['normalized'] = phase['best'] / calibration
+        results['cases'][name] = case
+        timings = ', '.join(f"{phase} {r['best'] * 1000:.1f}ms" for phase, r in case['phases'].items())
+        log(f"  {name:<16} {timings}")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+            min_delta: float = DEFAULT_MIN_DELTA) -> list:
+    """
+    Compare every (case, phase) present in both documents
+
+    Returns:
+        list of dicts: case, phase, baseline, current (best seconds), ratio
+        (normalized current / baseline) and regressed
+    """
+    # Baseline seconds scaled to this machine's speed
+    scale = results['calibration_seconds'] / baseline['calibration_seconds']
+    if baseline.get('seed') != results.get('seed') or \
+            baseline.get('generator_version') != results.get('generator_version'):
+        raise BenchError('baseline was recorded on a different corpus (seed/generator version)')
+
+    rows = []
+    for name, case in results['cases'].items():
+        base_case = baseline['cases'].get(name)
+        if not base_case:
+            continue
+        for phase, timing in case['phases'].items():
+            base = base_case['phases'].get(phase)
+            if not base:
+                continue
+            expected = base['best'] * scale
+            ratio = timing['best'] / expected if expected else 1.0
+            rows.append({
+                'case': name,
+                'phase': phase,
+                'baseline': base['best'],
+                'current': timing['best'],
+                'ratio': ratio,
+                'regressed': ratio > 1 + threshold and timing['best'] - expected > min_delta
+            })
+    return rows
+
+
+def print_comparison(rows, threshold: float):
+    print(f"{'case':<16} {'phase':<20} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for row in rows:
+        mark = '❌' if row['regressed'] else '✅'
+        print(f"{row['case']:<16} {row['phase']:<20} {row['baseline'] * 1000:>8.1f}ms "
+              f"{row['current'] * 1000:>8.1f}ms {row['ratio']:>6.2f}x {mark}")
+    regressed = [row for row in rows if row['regressed']]
+    print("")
+    if regressed:
+        print(f"❌ {len(regressed)} phase(s) slower than baseline by more than {threshold:.0%}")
+    else:
+        print(f"✅ No phase slower than baseline by more than {threshold:.0%} ({len(rows)} compared)")
+
+
+def load_json(path) -> dict:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise BenchError(f"cannot read {path}: {e}") from None
+
+
+def default_baseline(profile: str) -> Path:
+    return BENCH_DIR / 'baselines' / f"{profile}.json"
+
+
+def gate(results: dict, baseline_file, threshold: float, min_delta: float) -> int:
+    """Print the comparison against baseline_file; exit code 0/1"""
+    baseline = load_json(baseline_file)
+    rows = compare(results, baseline, threshold, min_delta)
+    print_comparison(rows, threshold)
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+def main_run(args) -> int:
+    cases = args.cases.split(',') if args.cases else PROFILES.get(args.profile)
+    if cases is None:
+        raise BenchError(f"unknown profile: {args.profile} ({', '.join(PROFILES)})")
+
+    print(f"Benchmarking {len(cases)} case(s), best of {args.repeat}")
+    results = run(cases, args.repeat, args.seed, args.corpus_dir, args.profile, log=print)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"\nResults saved to: {output}")
+
+    if not args.gate:
+        return 0
+    print("")
+    return gate(results, args.baseline or default_baseline(args.profile), args.threshold, args.min_delta)
+
+
+def main_compare(args) -> int:
+    results = load_json(args.results)
+    baseline = args.baseline or default_baseline(results.get('profile') or 'quick')
+    return gate(results, baseline, args.threshold, args.min_delta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validator benchmarks and regression gate')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def gate_options(p):
+        p.add_argument('--baseline', help='Baseline results (default: baselines/<profile>.json)')
+        p.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                       help=f'Allowed slowdown per phase (default: {DEFAULT_THRESHOLD})')
+        p.add_argument('--min-delta', type=float, default=DEFAULT_MIN_DELTA,
+                       help=f'Ignore slowdowns below this many seconds (default: {DEFAULT_MIN_DELTA})')
+
+    p_run = sub.add_parser('run', help='Run the benchmarks')
+    p_run.add_argument('--profile', default='quick', help=f"Case set: {', '.join(PROFILES)} (default: quick)")
+    p_run.add_argument('--cases', help='Comma-separated cases instead of a profile (e.g. dod-1M,okr-graph-10k)')
+    p_run.add_argument('--repeat', type=int, default=3, help='Runs per phase (default: 3)')
+    p_run.add_argument('--seed', type=int, default=0, help='Corpus seed (default: 0)')
+    p_run.add_argument('--corpus-dir', help='Generated documents (default: $TMPDIR/cecelia-bench-corpus)')
+    p_run.add_argument('--output', '-o', help='Write results JSON here')
+    p_run.add_argument('--gate', action='store_true', help='Compare against the baseline afterwards')
+    gate_options(p_run)
+
+    p_compare = sub.add_parser('compare', help='Compare saved results against a baseline')
+    p_compare.add_argument('results', help='Results JSON from `run --output`')
+    gate_options(p_compare)
+
+    args = parser.parse_args()
+    try:
+        code = main_run(args) if args.command == 'run' else main_compare(args)
+    except BenchError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        code = 2
+    sys.exit(code)
+
+
+if __name__ == '__main__':
+    main()
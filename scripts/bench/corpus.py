@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic corpus for the validator benchmarks
+
+Generates DoD / PRD markdown and OKR output.json documents of a target
+size (1 KB .. 500 MB), and OKR dependency graphs with a given number of
+pr_plans (up to 100k). The same (kind, size, seed) always produces the
+same bytes, so timings from different runs and machines compare the same
+work. Documents are written in blocks - nothing is held in memory whole.
+
+Usage:
+    python3 scripts/bench/corpus.py dod 10M -o .dod-bench.md
+    python3 scripts/bench/corpus.py prd 1K -o .prd-bench.md --seed 7
+    python3 scripts/bench/corpus.py okr 100M -o output.json
+    python3 scripts/bench/corpus.py okr-graph 100k -o output.json
+
+Sizes accept K/M/G suffixes (powers of 1024); okr-graph counts pr_plans
+(k = 1000).
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+# Bump when generated bytes change - baselines record it
+GENERATOR_VERSION = '1'
+
+KINDS = ('dod', 'prd', 'okr', 'okr-graph')
+
+# Capability IDs used by generated initiatives (bench.py builds an offline
+# CapabilityIndex from the same pool, so no Brain is needed)
+CAPABILITY_POOL = 1000
+
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+_COUNT_UNITS = {'': 1, 'K': 1000, 'M': 1000 ** 2}
+
+# Vocabulary - mixes the validators' keywords with neutral filler
+_WORDS_ZH = ['实现', '完成', '通过', '验证', '检查', '测试', '确保', '功能', '特性', '性能',
+             '文档', '版本', '问题', '需求', '用户', '场景', '目的', '方案', '架构', '技术',
+             '代码', '文件', '函数', '模块', '标准', '条件', '要求', '风险', '影响', '缓解',
+             '应对', '边界', '限制', '假设', '数据', '接口', '配置', '日志', '缓存', '服务']
+_WORDS_EN = ['bash', 'python', 'npm', 'git', 'grep', 'test', 'run', 'check', 'feature',
+             'performance', 'doc', 'README', 'CI', 'DevGate', 'version', 'api', 'config',
+             'handler', 'request', 'response', 'retry', 'timeout', 'schema', 'index']
+_COMMANDS = ['bash tests/{name}.sh', 'npm test -- --grep {name}', 'pytest tests/test_{name}.py',
+             "grep -q '{name}' README.md", 'python3 scripts/check_{name}.py']
+_PRD_SECTIONS = ['需求来源', '功能描述', '涉及文件', '成功标准', '技术方案', '边界条件', '风险评估']
+
+
+def parse_size(text: str) -> int:
+    """'1K' / '10M' / '500M' / '1G' / '2048' -> bytes"""
+    return _parse_scaled(text, _SIZE_UNITS)
+
+
+def parse_count(text: str) -> int:
+    """'1k' / '100k' / '250' -> count"""
+    return _parse_scaled(text, _COUNT_UNITS)
+
+
+def _parse_scaled(text: str, units: dict) -> int:
+    value = str(text).strip().upper().rstrip('B') or '0'
+    unit = value[-1] if value[-1] in units else ''
+    number = value[:-1] if unit else value
+    try:
+        return int(float(number) * units[unit])
+    except ValueError:
+        raise ValueError(f"invalid size: {text!r}") from None
+
+
+def format_size(n: int, units=None) -> str:
+    """Inverse of parse_size for exact multiples (labels such as 'dod-10M')"""
+    units = units or _SIZE_UNITS
+    for unit, factor in sorted(units.items(), key=lambda kv: -kv[1]):
+        if factor > 1 and n >= factor and n % factor == 0:
+            return f"{n // factor}{unit}"
+    return str(n)
+
+
+def _rng(kind: str, amount: int, seed: int) -> random.Random:
+    # String seeds are hashed with SHA-512 - stable across processes and platforms
+    return random.Random(f"{GENERATOR_VERSION}:{kind}:{amount}:{seed}")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(_WORDS_ZH) if rng.random() < 0.7 else rng.choice(_WORDS_EN))
+    return ' '.join(parts)
+
+
+class _SizedWriter:
+    """Text writer that tracks the encoded size written so far"""
+
+    def __init__(self, f):
+        self.f = f
+        self.size = 0
+
+    def write(self, text: str):
+        data = text.encode('utf-8')
+        self.f.write(data)
+        self.size += len(data)
+
+
+def _block(remaining: float) -> int:
+    """Pieces per write - single pieces near the target keep small documents small"""
+    return 64 if remaining > 64 * 1024 else 1
+
+
+def _dod_item(rng: random.Random, n: int) -> str:
+    mark = 'x' if rng.random() < 0.3 else ' '
+    lines = [f"- [{mark}] {_sentence(rng, rng.randint(4, 10))}"]
+    if rng.random() < 0.9:
+        command = rng.choice(_COMMANDS).format(name=f"case_{n}")
+        lines.append(f"  - Test: `{command}`")
+    if rng.random() < 0.2:
+        lines.append(f"  {_sentence(rng, rng.randint(8, 20))}")
+    return '\n'.join(lines) + '\n'
+
+
+def write_dod(out, size: int, seed: int = 0):
+    """DoD with frontmatter and checklist items (with Test fields) up to size bytes"""
+    rng = _rng('dod', size, seed)
+    w = _SizedWriter(out)
+    w.write(f"---\nid: bench-dod-{seed}\nversion: 1.0.0\ncreated: 2026-01-01\n---\n\n"
+            f"# DoD - benchmark ({format_size(size)})\n\n## 验收标准\n\n")
+    n = 0
+    while w.size < size:
+        block = []
+        for _ in range(_block(size - w.size)):
+            block.append(_dod_item(rng, n))
+            n += 1
+            if n % 200 == 0:
+                block.append(f"\n## 验收标准 {n // 200}\n\n")
+        w.write(''.join(block))
+
+
+def _prd_paragraph(rng: random.Random, section: str) -> str:
+    roll = rng.random()
+    if roll < 0.15:
+        return f"- [ ] {_sentence(rng, rng.randint(4, 10))}\n"
+    if roll < 0.25 and section == '风险评估':
+        return f"| 风险 | {_sentence(rng, 3)} | {rng.choice(['高', '中', '低'])} |\n"
+    if roll < 0.3:
+        return f"### {_sentence(rng, 2)}\n\n"
+    return _sentence(rng, rng.randint(10, 40)) + '\n\n'
+
+
+def write_prd(out, size: int, seed: int = 0):
+    """PRD with every required section, filler spread evenly across sections"""
+    rng = _rng('prd', size, seed)
+    w = _SizedWriter(out)
+    w.write(f"---\nid: bench-prd-{seed}\nversion: 1.0.0\ncreated: 2026-01-01\n---\n\n"
+            f"# PRD - benchmark ({format_size(size)})\n\n")
+    budget = max(size - w.size, 0) / len(_PRD_SECTIONS)
+    for number, section in enumerate(_PRD_SECTIONS, 1):
+        w.write(f"## {section}\n\n")
+        target = w.size + budget if number < len(_PRD_SECTIONS) else size
+        # At least one paragraph per section, even for tiny sizes
+        while True:
+            w.write(''.join(_prd_paragraph(rng, section) for _ in range(_block(target - w.size))))
+            if w.size >= target:
+                break
+
+
+def _pr_plan(rng: random.Random, sequence: int, deps_window: int) -> dict:
+    plan = {
+        'sequence': sequence,
+        'title': _sentence(rng, rng.randint(3, 6)),
+        'estimated_hours': rng.randint(1, 16),
+        'tasks': [{'title': _sentence(rng, rng.randint(3, 8))} for _ in range(rng.randint(1, 3))]
+    }
+    if sequence > 1:
+        low = max(1, sequence - deps_window)
+        plan['depends_on'] = sorted(set(rng.randint(low, sequence - 1)
+                                        for _ in range(rng.randint(1, 3))))
+    return plan
+
+
+def _initiative(rng: random.Random, number: int, plans: int, deps_window: int) -> dict:
+    from_stage = rng.randint(1, 3)
+    return {
+        'title': f"Initiative {number}: {_sentence(rng, 4)}",
+        'capability_id': f"cap-bench-{rng.randrange(CAPABILITY_POOL):04d}",
+        'from_stage': from_stage,
+        'to_stage': from_stage + rng.randint(1, 2),
+        'evidence_required': _sentence(rng, 6),
+        'pr_plans': [_pr_plan(rng, seq, deps_window) for seq in range(1, plans + 1)]
+    }
+
+
+def _write_okr(w: _SizedWriter, rng: random.Random, label: str, initiatives):
+    """Stream an output.json: header fields, then one initiative at a time"""
+    head = {
+        'objective': f"Benchmark objective ({label})",
+        'key_results': [{'title': _sentence(rng, 6), 'target': rng.randint(10, 100)}
+                        for _ in range(3)],
+    }
+    w.write(json.dumps(head, ensure_ascii=False, indent=2)[:-2] + ',\n  "initiatives": [')
+    first = True
+    for init in initiatives:
+        text = json.dumps(init, ensure_ascii=False, indent=2).replace('\n', '\n    ')
+        w.write(('\n    ' if first else ',\n    ') + text)
+        first = False
+    w.write('\n  ]\n}\n')
+
+
+def write_okr(out, size: int, seed: int = 0):
+    """OKR output.json of initiatives with 3-8 locally dependent pr_plans, up to size bytes"""
+    rng = _rng('okr', size, seed)
+    w = _SizedWriter(out)
+
+    def initiatives():
+        number = 0
+        while True:
+            yield _initiative(rng, number, rng.randint(3, 8), 3)
+            number += 1
+            if w.size >= size:
+                return
+
+    _write_okr(w, rng, format_size(size), initiatives())
+
+
+def write_okr_graph(out, plans: int, seed: int = 0, initiatives: int = 1):
+    """OKR output.json whose pr_plans (plans in total) form large dependency DAGs"""
+    rng = _rng('okr-graph', plans, seed)
+    w = _SizedWriter(out)
+    per_init, extra = divmod(plans, max(initiatives, 1))
+    # Wide dependency windows - long critical paths with many crossing edges
+    inits = (_initiative(rng, i, per_init + (1 if i < extra else 0), 64)
+             for i in range(max(initiatives, 1)))
+    _write_okr(w, rng, f"{format_size(plans, _COUNT_UNITS)} pr_plans", inits)
+
+
+def generate(kind: str, amount: int, path, seed: int = 0) -> Path:
+    """
+    Write one corpus document (atomically)
+
+    Args:
+        kind: 'dod', 'prd', 'okr' (amount = bytes) or 'okr-graph' (amount = pr_plans)
+        amount: Target size in bytes, or pr_plan count for okr-graph
+        path: Output file
+        seed: Corpus seed
+
+    Returns:
+        Path of the written file
+    """
+    writers = {'dod': write_dod, 'prd': write_prd, 'okr': write_okr, 'okr-graph': write_okr_graph}
+    if kind not in writers:
+        raise ValueError(f"unknown corpus kind: {kind}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, 'wb') as f:
+        writers[kind](f, amount, seed)
+    tmp.replace(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a deterministic benchmark document')
+    parser.add_argument('kind', choices=KINDS)
+    parser.add_argument('amount', help='Size (1K, 10M, 500M) or pr_plan count for okr-graph (100k)')
+    parser.add_argument('-o', '--output', required=True, help='Output file')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed (default: 0)')
+    args = parser.parse_args()
+
+    try:
+        amount = parse_count(args.amount) if args.kind == 'okr-graph' else parse_size(args.amount)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    path = generate(args.kind, amount, args.output, args.seed)
+    print(f"Generated {args.kind} {args.amount} -> {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env bash
+# ============================================================================
+# build-validators-zipapp.sh - 打包 validate-dod/prd/okr 为单文件 zipapp
+# ============================================================================
+#
+# 用法: bash scripts/build-validators-zipapp.sh [OUTPUT]
+#
+#   OUTPUT 默认 dist/cecelia-validate.pyz
+#
+# 运行:
+#   python3 dist/cecelia-validate.pyz dod .dod-xxx.md
+#   python3 dist/cecelia-validate.pyz prd .prd-xxx.md
+#   python3 dist/cecelia-validate.pyz okr output.json
+#
+# 模块以预编译 .pyc 打包（zipimport 无法写入字节码缓存），
+# Python 版本不一致时自动回退到源码。
+# ============================================================================
+
+set -euo pipefail
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+OUTPUT="${1:-$ENGINE_ROOT/dist/cecelia-validate.pyz}"
+
+STAGE="$(mktemp -d)"
+trap 'rm -rf "$STAGE"' EXIT
+
+cp -r "$ENGINE_ROOT/skills/dev/scripts/cecelia_validation" "$STAGE/"
+cp "$ENGINE_ROOT/skills/dev/scripts/validate-dod.py" "$STAGE/validate_dod.py"
+cp "$ENGINE_ROOT/skills/dev/scripts/validate-prd.py" "$STAGE/validate_prd.py"
+cp "$ENGINE_ROOT/skills/okr/scripts/validate-okr.py" "$STAGE/validate_okr.py"
+find "$STAGE" -name '__pycache__' -type d -prune -exec rm -rf {} +
+
+# Legacy .pyc next to sources - the only layout zipimport loads bytecode from
+python3 -m compileall -q -b "$STAGE"
+
+mkdir -p "$(dirname "$OUTPUT")"
+python3 -m zipapp "$STAGE" -o "$OUTPUT" -p '/usr/bin/env python3' -m 'cecelia_validation.cli:main'
+
+echo "✅ Built $OUTPUT"
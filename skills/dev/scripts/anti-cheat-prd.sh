@@ -1,127 +1,33 @@
 #!/usr/bin/env bash
-# PRD Anti-Cheat - 10-layer verification (reused from OKR stop-okr.sh architecture)
+# PRD Anti-Cheat - 11-layer verification (reused from OKR stop-okr.sh architecture)
 #
 # Prevents bypassing validation via:
 # - Manual score editing
 # - Report deletion
 # - Environment variable bypass
 # - SHA256 hash mismatch
+# - Editing the validator or its rule set (rulesets/prd.json)
+#
+# Git integrity check here; all layers run in one process: validate-prd.py --verify
 #
 # Exit codes:
 #   0 - All checks pass
 #   2 - Any check fails (blocks workflow, maintains Stop Hook loop)
 
-set -euo pipefail
-
-PRD_FILE="${1:-.prd-*.md}"
-REPORT_FILE=".prd-validation-report.json"
-
-# Resolve glob pattern
-PRD_FILE=$(ls $PRD_FILE 2>/dev/null | head -1 || echo "")
-
-if [[ -z "$PRD_FILE" ]]; then
-    echo "❌ Layer 1 FAIL: PRD file not found (pattern: .prd-*.md)" >&2
-    exit 2
-fi
-
-echo "🔒 PRD Anti-Cheat: 10-layer verification"
-echo ""
-
-# ===== Layer 1: File Exists =====
-echo "Layer 1: PRD file exists"
-if [[ ! -f "$PRD_FILE" ]]; then
-    echo "❌ FAIL: $PRD_FILE not found" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 2: Not Empty =====
-echo "Layer 2: PRD not empty"
-if [[ ! -s "$PRD_FILE" ]]; then
-    echo "❌ FAIL: $PRD_FILE is empty" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 3: Has Frontmatter =====
-echo "Layer 3: Has frontmatter"
-if ! head -1 "$PRD_FILE" | grep -q '^---$'; then
-    echo "❌ FAIL: Missing YAML frontmatter" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 4: Report Exists =====
-echo "Layer 4: Validation report exists"
-if [[ ! -f "$REPORT_FILE" ]]; then
-    echo "❌ FAIL: $REPORT_FILE not found" >&2
-    echo "   Run: python skills/dev/scripts/validate-prd.py \"$PRD_FILE\"" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 5: Report Not Empty =====
-echo "Layer 5: Report not empty"
-if [[ ! -s "$REPORT_FILE" ]]; then
-    echo "❌ FAIL: $REPORT_FILE is empty" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 6: Report Valid JSON =====
-echo "Layer 6: Report valid JSON"
-if ! jq empty "$REPORT_FILE" 2>/dev/null; then
-    echo "❌ FAIL: $REPORT_FILE is not valid JSON" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 7: Has Score Fields =====
-echo "Layer 7: Report has score fields"
-FORM_SCORE=$(jq -r '.form_score // "null"' "$REPORT_FILE")
-CONTENT_SCORE=$(jq -r '.content_score // "null"' "$REPORT_FILE")
-TOTAL_SCORE=$(jq -r '.total_score // "null"' "$REPORT_FILE")
-
-if [[ "$FORM_SCORE" == "null" ]] || [[ "$CONTENT_SCORE" == "null" ]] || [[ "$TOTAL_SCORE" == "null" ]]; then
-    echo "❌ FAIL: Missing score fields in report" >&2
-    echo "   form_score: $FORM_SCORE" >&2
-    echo "   content_score: $CONTENT_SCORE" >&2
-    echo "   total_score: $TOTAL_SCORE" >&2
-    exit 2
-fi
-echo "✅ PASS (form: $FORM_SCORE, content: $CONTENT_SCORE, total: $TOTAL_SCORE)"
-
-# ===== Layer 8: SHA256 Match =====
-echo "Layer 8: SHA256 hash match"
-REPORT_SHA=$(jq -r '.content_sha256 // "null"' "$REPORT_FILE")
-ACTUAL_SHA=$(sha256sum "$PRD_FILE" | awk '{print $1}')
-
-if [[ "$REPORT_SHA" != "$ACTUAL_SHA" ]]; then
-    echo "❌ FAIL: SHA256 mismatch (content modified after validation)" >&2
-    echo "   Report SHA: $REPORT_SHA" >&2
-    echo "   Actual SHA: $ACTUAL_SHA" >&2
-    echo "   Re-run: python skills/dev/scripts/validate-prd.py \"$PRD_FILE\"" >&2
-    exit 2
-fi
-echo "✅ PASS"
-
-# ===== Layer 9: Score >= 90 =====
-echo "Layer 9: Total score >= 90"
-if (( TOTAL_SCORE < 90 )); then
-    echo "❌ FAIL: Score $TOTAL_SCORE < 90" >&2
-    echo "   Read validation report for issues to fix" >&2
-    exit 2
-fi
-echo "✅ PASS"
+SCRIPTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd -P)"
 
-# ===== Layer 10: No Bypass Env =====
-echo "Layer 10: No bypass environment variables"
-if [[ "${SKIP_VALIDATION:-false}" == "true" ]]; then
-    echo "❌ FAIL: SKIP_VALIDATION=true detected (bypass not allowed)" >&2
-    exit 2
+# Validator and rule set integrity: refuse uncommitted edits (modified,
+# staged or new files) when they live in the current git repo
+REPO_ROOT=$(git rev-parse --show-toplevel 2>/dev/null || true)
+if [ -n "$REPO_ROOT" ] && [[ "$SCRIPTS_DIR" == "$(cd "$REPO_ROOT" && pwd -P)"* ]]; then
+    CHANGED=$(git status --porcelain -- "$SCRIPTS_DIR/validate-prd.py" "$SCRIPTS_DIR/cecelia_validation" \
+        ':(exclude,glob)**/__pycache__/**' 2>/dev/null)
+    if [ -n "$CHANGED" ]; then
+        echo "❌ ANTI-CHEAT: Validator or rule set has been modified!" >&2
+        echo "$CHANGED" | sed 's/^/   /' >&2
+        echo "   Fix: git checkout -- $SCRIPTS_DIR/validate-prd.py $SCRIPTS_DIR/cecelia_validation" >&2
+        exit 2
+    fi
 fi
-echo "✅ PASS"
 
-echo ""
-echo "🎉 All 10 layers passed - PRD quality verified"
-exit 0
+exec python3 "$SCRIPTS_DIR/validate-prd.py" --verify "${1:-.prd-*.md}"
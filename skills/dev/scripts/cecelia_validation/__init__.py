@@ -0,0 +1,22 @@
+"""
+Shared helpers for the Cecelia validation scripts
+
+validate-dod.py / validate-prd.py (skills/dev/scripts) and validate-okr.py
+(skills/okr/scripts) import from here. Skills are deployed side by side
+under ~/.claude/skills/, so the okr script reaches this package through
+its sibling dev skill.
+
+The in-process API (see api.py) is re-exported here, imported on first
+use so the scripts' own imports of this package stay cheap:
+
+    from cecelia_validation import validate_dod, validate_prd, validate_okr, validate_many
+"""
+
+__all__ = ['ValidationReport', 'validate_dod', 'validate_many', 'validate_okr', 'validate_prd']
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import api
+        return getattr(api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
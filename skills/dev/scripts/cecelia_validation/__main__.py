@@ -0,0 +1,3 @@
+from cecelia_validation.cli import main
+
+main()
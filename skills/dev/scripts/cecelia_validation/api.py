@@ -0,0 +1,159 @@
+"""
+In-process validator API
+
+    from cecelia_validation import validate_dod, validate_prd, validate_okr, validate_many
+
+    report = validate_dod(text, name='.dod-x.md')
+    report.total_score, report.passing, report.issues, report.to_dict()
+
+validate_dod / validate_prd / validate_okr score a document given as text
+or bytes (OKR also takes an already-parsed dict) and return a
+ValidationReport. They do no I/O: no result cache, no report file, no
+report store, no timings export. OKR capability_ids are checked against a
+CapabilityIndex snapshot when one is passed, otherwise they are reported
+unverified (never looked up in Brain).
+
+Scores, issues and hashes are exactly what the scripts write for the same
+bytes. The scripts are imported once per process (cli.load_validator), so
+their rule sets, compiled matchers and parsers are shared by every call;
+validate_many() scores a stream of documents that way, with no
+subprocess per document. Loading a script the first time reads its
+compiled rule set (see rules.py); scoring itself touches no files.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+
+from .cli import load_validator
+from .report import ValidationReport
+from .source import decode_text
+
+# Document name patterns used by validate_many() to pick a validator
+KIND_PATTERNS = (('dod', '.dod-*.md'), ('prd', '.prd-*.md'), ('okr', '*.json'))
+
+_validators = {}
+
+
+def _validator(kind: str):
+    module = _validators.get(kind)
+    if module is None:
+        module = _validators[kind] = load_validator(kind)
+    return module
+
+
+def _document(content) -> tuple:
+    """(sha256 of the raw bytes, text as the scripts read it) of str or bytes content"""
+    data = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+    return hashlib.sha256(data).hexdigest(), decode_text(data)
+
+
+def validate_dod(content, name: str = '<dod>') -> ValidationReport:
+    """
+    Score a DoD document
+
+    Args:
+        content: Markdown as str or bytes (bytes are hashed as-is, like the file)
+        name: Reported as dod_file
+
+    Raises:
+        ValueError: bytes that are not UTF-8
+    """
+    module = _validator('dod')
+    sha256, text = _document(content)
+    return ValidationReport.from_dict('dod', name, module.score_dod(name, sha256, text),
+                                      module.RULESET_VERSION)
+
+
+def validate_prd(content, name: str = '<prd>') -> ValidationReport:
+    """
+    Score a PRD document
+
+    Args:
+        content: Markdown as str or bytes (bytes are hashed as-is, like the file)
+        name: Reported as prd_file
+
+    Raises:
+        ValueError: bytes that are not UTF-8
+    """
+    module = _validator('prd')
+    sha256, text = _document(content)
+    return ValidationReport.from_dict('prd', name, module.score_prd(name, sha256, text),
+                                      module.RULESET_VERSION)
+
+
+def validate_okr(document, name: str = 'output.json', capability_index=None) -> ValidationReport:
+    """
+    Form-score an OKR output.json
+
+    Args:
+        document: JSON text/bytes, or the parsed object
+        capability_index: Optional CapabilityIndex to check capability_ids
+            against; without one they are reported unverified
+
+    Raises:
+        ValueError: Invalid JSON, or not a JSON object
+    """
+    # Imported here - only OKR scoring needs the capability helpers
+    from .capabilities import UnverifiedCapabilities
+
+    module = _validator('okr')
+    data = json.loads(document) if isinstance(document, (str, bytes, bytearray)) else document
+    if not isinstance(data, dict):
+        raise ValueError(f"{name}: OKR document must be a JSON object")
+
+    form_result = module.validate_okr_form(
+        data, capability_index if capability_index is not None else UnverifiedCapabilities())
+    report = module.build_report(form_result, module.calculate_content_hash(data),
+                                 capability_index=capability_index)
+    return ValidationReport.from_dict('okr', name, report, module.RULESET_VERSION)
+
+
+def kind_of(name: str) -> str:
+    """Validator for a document name ('.dod-*.md', '.prd-*.md', '*.json')"""
+    base = os.path.basename(name)
+    for kind, pattern in KIND_PATTERNS:
+        if fnmatch.fnmatchcase(base, pattern):
+            return kind
+    raise ValueError(f"cannot tell which validator applies to {name} (pass kind=)")
+
+
+def validate_many(documents, kind: str = None, capability_index=None):
+    """
+    Score many documents in this process, one at a time
+
+    Args:
+        documents: Iterable of file paths, or of (name, content) pairs where
+            content is anything the single-document function accepts
+        kind: 'dod' / 'prd' / 'okr' for every document (default: from each
+            name, see kind_of())
+        capability_index: Passed to validate_okr()
+
+    Yields:
+        ValidationReport per document, in input order. Unreadable or invalid
+        documents yield a report with .error set instead of raising.
+    """
+    for document in documents:
+        if isinstance(document, tuple):
+            name, content = document
+        else:
+            name, content = os.fspath(document), None
+
+        doc_kind = kind or ''
+        try:
+            doc_kind = doc_kind or kind_of(name)
+            if content is None:
+                with open(name, 'rb') as f:
+                    content = f.read()
+            if doc_kind == 'dod':
+                yield validate_dod(content, name)
+            elif doc_kind == 'prd':
+                yield validate_prd(content, name)
+            elif doc_kind == 'okr':
+                yield validate_okr(content, name, capability_index)
+            else:
+                raise ValueError(f"unknown validator: {doc_kind}")
+        except (OSError, ValueError) as e:
+            yield ValidationReport(doc_kind, name, error=str(e),
+                                   data={'error': str(e), 'total_score': 0})
@@ -0,0 +1,154 @@
+"""
+Batch mode - score many DoD/PRD files in one interpreter
+
+Files are discovered from a directory (recursive) or a glob, scored on a
+ProcessPoolExecutor and written as one report per file plus an aggregate
+report. Each worker calls the same validate function as the single-file
+path, so scores are identical.
+"""
+
+import glob
+import json
+import os
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+
+def discover_files(target: str, pattern: str) -> list:
+    """
+    Find files to validate
+
+    Args:
+        target: Directory (searched recursively for pattern) or glob
+        pattern: File name pattern used for directories, e.g. '.dod-*.md'
+
+    Returns:
+        Sorted list of file paths (strings)
+    """
+    target_path = Path(target)
+    if target_path.is_dir():
+        found = [
+            p for p in target_path.rglob(pattern)
+            if p.is_file() and '.git' not in p.parts
+        ]
+        return sorted(str(p) for p in found)
+
+    return sorted(p for p in glob.glob(target, recursive=True) if os.path.isfile(p))
+
+
+def _safe_validate(validate_fn, path: str) -> dict:
+    """Run validate_fn, turning unexpected exceptions into error reports"""
+    try:
+        return validate_fn(path)
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}", 'total_score': 0}
+
+
+def run_batch(validate_fn, files: list, jobs: int = None) -> list:
+    """
+    Validate files in parallel
+
+    Args:
+        validate_fn: Module-level validate function (must be picklable)
+        files: File paths to validate
+        jobs: Worker processes (default: CPU count, 1 = in-process)
+
+    Returns:
+        List of reports in the same order as files
+    """
+    jobs = jobs or os.cpu_count() or 1
+    worker = partial(_safe_validate, validate_fn)
+
+    if jobs == 1 or len(files) <= 1:
+        return [worker(f) for f in files]
+
+    # Imported lazily - multiprocessing is slow to import
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Larger chunks amortize pickling overhead on big corpora
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        return list(executor.map(worker, files, chunksize=chunksize))
+
+
+def report_name(path: str) -> str:
+    """
+    Flatten a file path into a unique report file name
+
+    Separators become '__' and literal underscores are escaped as '_u' first, so
+    'a/b.md' -> 'a__b.md.json' and 'a__b.md' -> 'a_u_ub.md.json' never collide.
+    Paths outside the working directory are absolute and keep their
+    leading separator ('__tmp__x.md.json'), apart from relative ones.
+    """
+    try:
+        rel = os.path.relpath(path)
+    except ValueError:
+        rel = os.path.abspath(path)
+    if rel.startswith('..'):
+        rel = os.path.abspath(path)
+    return rel.replace('_', '_u').replace(os.sep, '__') + '.json'
+
+
+def write_batch_reports(reports: list, files: list, report_dir: str,
+                        aggregate_file: str, meta: dict) -> dict:
+    """
+    Write one report per file into report_dir plus an aggregate report
+
+    Returns:
+        The aggregate report dict
+    """
+    out_dir = Path(report_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for path, report in zip(files, reports):
+        report_file = out_dir / report_name(path)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+        entries.append({
+            'file': path,
+            'total_score': report.get('total_score', 0),
+            'passing': report.get('passing', False),
+            'error': report.get('error'),
+            'report_file': str(report_file)
+        })
+
+    errors = sum(1 for e in entries if e['error'])
+    passed = sum(1 for e in entries if e['passing'])
+
+    aggregate = dict(meta)
+    aggregate.update({
+        'file_count': len(entries),
+        'passed_count': passed,
+        'failed_count': len(entries) - passed - errors,
+        'error_count': errors,
+        'all_passing': bool(entries) and passed == len(entries),
+        'report_dir': str(out_dir),
+        'files': entries,
+        'timestamp': datetime.now().isoformat()
+    })
+
+    with open(aggregate_file, 'w', encoding='utf-8') as f:
+        json.dump(aggregate, f, indent=2, ensure_ascii=False)
+
+    return aggregate
+
+
+def print_batch_summary(title: str, aggregate: dict, aggregate_file: str):
+    """Print a short batch summary"""
+    print(f"{title} Batch Validation:")
+    print(f"  Files: {aggregate['file_count']}")
+    print(f"  Passed: {aggregate['passed_count']}")
+    print(f"  Failed: {aggregate['failed_count']}")
+    print(f"  Errors: {aggregate['error_count']}")
+
+    for entry in aggregate['files']:
+        if entry['error']:
+            print(f"  ⚠️  {entry['file']}: {entry['error']}")
+        elif not entry['passing']:
+            print(f"  ❌ {entry['file']}: {entry['total_score']}/100")
+
+    print(f"\nAggregate report saved to: {aggregate_file}")
+    print(f"Per-file reports saved to: {aggregate['report_dir']}/")
@@ -0,0 +1,164 @@
+"""
+Content-addressed validation result cache
+
+Maps (validator, content hash, validator version, rule-set version) to a
+finished report, so re-validating unchanged content costs one hash plus
+one lookup. Entries are JSON files under ~/.cache/cecelia/validation
+(honours $XDG_CACHE_HOME). A hit refreshes the entry's mtime, which drives
+LRU eviction once the entry cap is exceeded; entries older than max_age
+are dropped. The eviction pass lists the whole directory, so it runs once
+per max_entries / 20 writes (counted across processes), not on every write;
+the cap is soft by at most that many entries.
+
+Environment:
+    CECELIA_VALIDATION_CACHE=0      Disable the cache
+    CECELIA_VALIDATION_CACHE_DIR    Override the cache directory
+
+Cache problems never fail a validation - any I/O or decode error is a miss.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MAX_AGE = 30 * 24 * 3600  # 30 days
+# Writes between eviction passes, as a fraction of the entry cap
+EVICT_FRACTION = 20
+WRITE_COUNTER = '.writes'
+
+
+def cache_enabled() -> bool:
+    """Cache is on unless CECELIA_VALIDATION_CACHE is 0/false/off"""
+    return os.environ.get('CECELIA_VALIDATION_CACHE', '1').lower() not in ('0', 'false', 'off', 'no')
+
+
+def default_cache_dir() -> Path:
+    """Resolve the cache directory"""
+    override = os.environ.get('CECELIA_VALIDATION_CACHE_DIR')
+    if override:
+        return Path(override)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'cecelia' / 'validation'
+
+
+class ResultCache:
+    """On-disk report cache with an LRU size cap and age eviction"""
+
+    def __init__(self, cache_dir=None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.evict_every = max(1, max_entries // EVICT_FRACTION)
+
+    @staticmethod
+    def make_key(validator: str, content_hash: str, validator_version: str,
+                 ruleset_version: str) -> str:
+        """Build the cache key for a validation result"""
+        raw = f"{validator}\0{content_hash}\0{validator_version}\0{ruleset_version}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, max_age: float = None):
+        """
+        Look up a cached report
+
+        Args:
+            key: Key from make_key()
+            max_age: Override the age limit for this lookup (seconds)
+
+        Returns:
+            Report dict, or None on miss
+        """
+        path = self._path(key)
+        limit = self.max_age if max_age is None else max_age
+        try:
+            if time.time() - path.stat().st_mtime > limit:
+                path.unlink()
+                return None
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+            # Touch on hit so eviction is least-recently-used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        return entry.get('report')
+
+    def put(self, key: str, report: dict, evict: bool = True):
+        """Store a report (atomic write), enforcing the size cap every evict_every writes
+
+        Bulk writers pass evict=False and call evict() once at the end.
+        """
+        path = self._path(key)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'report': report}, f, ensure_ascii=False)
+            os.replace(tmp, path)
+            if evict and self._eviction_due():
+                self.evict()
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _eviction_due(self) -> bool:
+        """Count one write; True (and reset) every evict_every writes
+
+        The counter is a file whose size is the number of writes since the
+        last eviction - appending a byte is atomic, so concurrent
+        validators share it without locking.
+        """
+        fd = os.open(self.cache_dir / WRITE_COUNTER, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, b'.')
+            if os.fstat(fd).st_size < self.evict_every:
+                return False
+            os.ftruncate(fd, 0)
+            return True
+        finally:
+            os.close(fd)
+
+    def evict(self):
+        """Drop expired entries, then least-recently-used ones above the cap"""
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if now - mtime > self.max_age:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            else:
+                entries.append((mtime, path))
+
+        excess = len(entries) - self.max_entries
+        if excess > 0:
+            entries.sort()
+            for _, path in entries[:excess]:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove every cached entry"""
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
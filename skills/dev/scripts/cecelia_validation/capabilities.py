@@ -0,0 +1,312 @@
+"""
+Capability existence lookups against the Brain API
+
+validate-okr.py needs to know whether each initiative's capability_id is
+registered. Lookups are deduplicated and sent concurrently through one
+pooled keep-alive session, bounded by an overall deadline. A circuit
+breaker trips after consecutive connection failures, so an unreachable
+Brain fails the remaining lookups immediately instead of one timeout each.
+
+CapabilityIndex is the offline alternative: a snapshot of registered IDs
+exported once from Brain (see refresh-capability-index.py), so existence
+checks become local set lookups with no network. UnverifiedCapabilities
+answers every ID as unverifiable, for callers that must do no I/O at all.
+
+`requests` is imported only when a live lookup is actually made, so
+offline and 2-layer validations don't pay for it at startup.
+
+Results use the same (exists, brain_available) tuples as
+check_capability_exists():
+    (True, True)   - capability exists
+    (False, True)  - capability doesn't exist
+    (False, False) - Brain unavailable, cannot verify
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_BRAIN_URL = 'http://localhost:5221'
+UNAVAILABLE = (False, False)
+
+
+def brain_url() -> str:
+    """Brain base URL ($BRAIN_URL, default localhost:5221)"""
+    return os.environ.get('BRAIN_URL', DEFAULT_BRAIN_URL).rstrip('/')
+
+
+def is_capability_id(value) -> bool:
+    """A non-empty string - anything else (a list, a number) is never looked up"""
+    return isinstance(value, str) and bool(value)
+
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures; stays open for the run"""
+
+    def __init__(self, threshold: int = 2):
+        self.threshold = threshold
+        self._failures = 0
+        self._open = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open = True
+
+    def trip(self):
+        with self._lock:
+            self._open = True
+
+
+class CapabilityLookup:
+    """Deduplicated, concurrent capability checks over a pooled session"""
+
+    def __init__(self, base_url: str = None, timeout: float = 2, deadline: float = 10,
+                 max_workers: int = 8, failure_threshold: int = 2):
+        self.base_url = (base_url or brain_url()).rstrip('/')
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.breaker = CircuitBreaker(failure_threshold)
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def check_one(self, capability_id, expires_at: float = None) -> tuple:
+        """Check a single capability (honours the breaker and deadline)"""
+        if self.breaker.is_open:
+            return UNAVAILABLE
+
+        timeout = self.timeout
+        if expires_at is not None:
+            timeout = min(timeout, expires_at - time.monotonic())
+            if timeout <= 0:
+                self.breaker.trip()
+                return UNAVAILABLE
+
+        try:
+            resp = self.session.get(
+                f'{self.base_url}/api/brain/capabilities/{capability_id}',
+                timeout=timeout
+            )
+        except Exception:
+            # Fail open - if Brain is down, cannot verify
+            self.breaker.record_failure()
+            return UNAVAILABLE
+
+        self.breaker.record_success()
+        return (resp.status_code == 200, True)
+
+    def check_many(self, capability_ids) -> dict:
+        """
+        Check many capabilities concurrently
+
+        Args:
+            capability_ids: Iterable of IDs (duplicates are queried once;
+                empty and non-string IDs are skipped, see is_capability_id)
+
+        Returns:
+            dict mapping capability_id -> (exists, brain_available)
+        """
+        unique = list(dict.fromkeys(c for c in capability_ids if is_capability_id(c)))
+        if not unique:
+            return {}
+
+        from concurrent.futures import ThreadPoolExecutor, wait
+
+        expires_at = time.monotonic() + self.deadline
+        results = {}
+
+        if len(unique) == 1 or self.max_workers <= 1:
+            for cap_id in unique:
+                results[cap_id] = self.check_one(cap_id, expires_at)
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique)))
+        try:
+            futures = {
+                executor.submit(self.check_one, cap_id, expires_at): cap_id
+                for cap_id in unique
+            }
+            done, not_done = wait(futures, timeout=max(0, expires_at - time.monotonic()))
+            for future in done:
+                results[futures[future]] = future.result()
+            if not_done:
+                # Deadline hit - anything still in flight counts as unavailable
+                self.breaker.trip()
+                for future in not_done:
+                    future.cancel()
+                    results[futures[future]] = UNAVAILABLE
+        finally:
+            executor.shutdown(wait=False)
+
+        return results
+
+
+INDEX_HEADER = '# cecelia-capability-index v1'
+
+
+class CapabilityIndex:
+    """
+    Offline snapshot of the capability registry
+
+    File format - a header followed by one sorted ID per line:
+
+        # cecelia-capability-index v1
+        # version: <16-hex digest of the ID list>
+        # exported_at: <ISO timestamp>
+        # source: <Brain URL>
+        cap-a
+        cap-b
+    """
+
+    def __init__(self, ids, version: str = None, exported_at: str = None,
+                 source: str = None, path: str = None):
+        self.ids = frozenset(ids)
+        self._content_digest = None
+        self.version = version or self.content_digest
+        self.exported_at = exported_at
+        self.source = source
+        self.path = path
+
+    @staticmethod
+    def digest(ids) -> str:
+        """Version derived from the sorted ID list"""
+        blob = '\n'.join(sorted(ids))
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:16]
+
+    @property
+    def content_digest(self) -> str:
+        """digest() of the IDs actually loaded - unlike version, never taken from the header"""
+        if self._content_digest is None:
+            self._content_digest = self.digest(self.ids)
+        return self._content_digest
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a snapshot file
+
+        Raises:
+            OSError: File can't be read
+            ValueError: Not a capability index
+        """
+        meta = {}
+        ids = []
+        with open(path, encoding='utf-8') as f:
+            if f.readline().rstrip('\n') != INDEX_HEADER:
+                raise ValueError(f"{path} is not a capability index (missing '{INDEX_HEADER}')")
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith('#'):
+                    key, _, value = line[1:].partition(':')
+                    meta[key.strip()] = value.strip()
+                else:
+                    ids.append(line)
+
+        return cls(ids, version=meta.get('version'), exported_at=meta.get('exported_at'),
+                   source=meta.get('source'), path=str(path))
+
+    def save(self, path):
+        """Write the snapshot atomically"""
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.tmp")
+        self.exported_at = self.exported_at or datetime.now().isoformat()
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(INDEX_HEADER + '\n')
+            f.write(f"# version: {self.version}\n")
+            f.write(f"# exported_at: {self.exported_at}\n")
+            if self.source:
+                f.write(f"# source: {self.source}\n")
+            for cap_id in sorted(self.ids):
+                f.write(cap_id + '\n')
+        os.replace(tmp, path)
+        self.path = str(path)
+
+    def __contains__(self, capability_id) -> bool:
+        return capability_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def check_many(self, capability_ids) -> dict:
+        """Same contract as CapabilityLookup.check_many(), answered locally"""
+        return {c: (c in self.ids, True) for c in capability_ids if is_capability_id(c)}
+
+    def describe(self) -> dict:
+        """Snapshot metadata recorded in validation reports"""
+        return {
+            'path': self.path,
+            'version': self.version,
+            'exported_at': self.exported_at,
+            'count': len(self.ids)
+        }
+
+
+class UnverifiedCapabilities:
+    """
+    Stand-in index that checks nothing - every ID comes back unverified
+
+    Used by the in-process API (api.py) when no snapshot is given, so
+    scoring never reaches the network: IDs are scored like an unreachable
+    Brain (points given, a warning issued).
+    """
+
+    version = 'unverified'
+
+    def check_many(self, capability_ids) -> dict:
+        return {c: UNAVAILABLE for c in capability_ids if is_capability_id(c)}
+
+
+def fetch_capability_ids(base_url: str = None, timeout: float = 10) -> list:
+    """
+    Export every registered capability ID from Brain
+
+    Accepts either a JSON list or an object wrapping one under
+    'capabilities' / 'data'; entries may be IDs or objects with 'id'.
+    """
+    import requests
+
+    url = f"{(base_url or brain_url()).rstrip('/')}/api/brain/capabilities"
+    resp = requests.get(url, timeout=timeout)
+    resp.raise_for_status()
+    payload = resp.json()
+
+    if isinstance(payload, dict):
+        payload = payload.get('capabilities', payload.get('data', []))
+
+    ids = []
+    for entry in payload:
+        cap_id = entry.get('id') if isinstance(entry, dict) else entry
+        if cap_id:
+            ids.append(str(cap_id))
+    return ids
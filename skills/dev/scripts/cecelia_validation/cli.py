@@ -0,0 +1,332 @@
+"""
+Single entry point for all three validators
+
+    python3 -m cecelia_validation <dod|prd|okr> [args...]
+    python3 cecelia-validate.pyz <dod|prd|okr> [args...]
+    python3 -m cecelia_validation history <file>... [--format csv|ndjson]
+    python3 -m cecelia_validation reports <lowest|issues|file|hash|stats|import> ...
+
+Arguments after the validator name are passed through unchanged, so
+`dod .dod-x.md` behaves exactly like `validate-dod.py .dod-x.md`. The
+zipapp (scripts/build-validators-zipapp.sh) bundles the scripts as
+importable modules; from a source checkout they are run from disk.
+
+`history` scores every git revision of DoD/PRD files (see history.py);
+`reports` queries the SQLite report store (see store.py).
+
+DocumentCli is the command line validate-dod.py and validate-prd.py
+share: the scripts supply scoring and the rule set, everything else
+(single file, --batch, --changed-since, --watch, --verify) runs here.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import runpy
+import sys
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+from .cache import ResultCache, cache_enabled
+from .source import file_sha256, open_lines
+from .store import record_reports
+from .timings import Timings, export_timings, phase, recording, timings_enabled, write_report
+
+# name -> (bundled module, script path relative to skills/dev/scripts)
+VALIDATORS = {
+    'dod': ('validate_dod', 'validate-dod.py'),
+    'prd': ('validate_prd', 'validate-prd.py'),
+    'okr': ('validate_okr', '../../okr/scripts/validate-okr.py'),
+}
+
+
+def script_path(name: str) -> Path:
+    """Source path of a validator script in a checkout / deployed skills tree"""
+    scripts_dir = Path(__file__).resolve().parent.parent
+    return (scripts_dir / VALIDATORS[name][1]).resolve()
+
+
+def load_validator(name: str):
+    """
+    Import a validator as a module (without running its main())
+
+    Used by long-lived callers (the validation daemon) that keep the rule
+    tables and matchers loaded across requests.
+    """
+    module_name = VALIDATORS[name][0]
+    if importlib.util.find_spec(module_name) is not None:
+        return importlib.import_module(module_name)
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path(name))
+    module = importlib.util.module_from_spec(spec)
+    # Registered so batch-mode workers can unpickle its functions
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class DocumentCli:
+    """
+    Command line of a Markdown document validator (DoD / PRD)
+
+    Args:
+        kind: 'dod' / 'prd' - names the pattern (.dod-*.md), report files
+            (.dod-validation-report.json, ...) and script (validate-dod.py)
+        label: Display name, e.g. 'DoD'
+        version: VALIDATION_VERSION of the script
+        rules: The script's compiled RuleSet
+        score: score(name, content_sha256, text or lines) -> report
+        validate: The script's module-level validate function (batch
+            workers unpickle it by name); it calls validate_file()
+        summary: Extra (label, report key) lines for the single-file summary
+    """
+
+    def __init__(self, kind: str, label: str, version: str, rules, score, validate, summary=()):
+        self.kind = kind
+        self.label = label
+        self.version = version
+        self.rules = rules
+        self.score = score
+        self.validate = validate
+        self.summary = summary
+        self.pattern = f'.{kind}-*.md'
+        self.report_file = f'.{kind}-validation-report.json'
+        self.batch_file = f'.{kind}-validation-batch.json'
+        self.report_dir = f'.{kind}-validation-reports'
+        self.script = f'skills/dev/scripts/validate-{kind}.py'
+
+    def validate_file(self, path: str, use_cache: bool = True) -> dict:
+        """
+        Score one file, served from the result cache when its content is unchanged
+
+        Returns:
+            dict with validation report
+        """
+        doc_path = Path(path)
+
+        if not doc_path.exists():
+            return {
+                'error': f"{self.label} file not found: {path}",
+                'total_score': 0
+            }
+
+        # Hash the raw bytes - the document itself is never held in memory
+        with phase('hash'):
+            content_sha256 = file_sha256(doc_path)
+
+        cache = ResultCache() if use_cache and cache_enabled() else None
+        # Cache entries are invalidated whenever the rule file changes
+        cache_key = ResultCache.make_key(self.kind, content_sha256, self.version, self.rules.sha256)
+        if cache:
+            with phase('cache_lookup'):
+                cached = cache.get(cache_key)
+            if cached and cached.get('content_sha256') == content_sha256:
+                cached[f'{self.kind}_file'] = str(path)
+                cached['timestamp'] = datetime.now().isoformat()
+                return cached
+
+        # One lazy pass over the lines
+        with open_lines(doc_path) as lines:
+            report = self.score(path, content_sha256, lines)
+
+        if cache:
+            cache.put(cache_key, report)
+
+        return report
+
+    def record(self, entries):
+        """Record (file, report) pairs in the report store (when enabled)"""
+        record_reports(self.kind, entries, self.version, self.rules.version, self.rules.sha256)
+
+    def main_batch(self, args):
+        """Validate all files matching --batch and write per-file + aggregate reports"""
+        # Imported here - process pool machinery is only needed in batch mode
+        from .batch import discover_files, print_batch_summary, run_batch, write_batch_reports
+
+        files = discover_files(args.batch, self.pattern)
+        if not files:
+            print(f"Error: no {self.label} files found for: {args.batch}", file=sys.stderr)
+            sys.exit(2)
+
+        reports = run_batch(partial(self.validate, use_cache=not args.no_cache), files, args.jobs)
+
+        aggregate = write_batch_reports(reports, files, args.report_dir, self.batch_file, {
+            'batch': args.batch,
+            'jobs': args.jobs,
+            'validation_version': self.version
+        })
+        self.record(zip(files, reports))
+        print_batch_summary(self.label, aggregate, self.batch_file)
+
+        if aggregate['error_count']:
+            sys.exit(2)
+        sys.exit(0 if aggregate['all_passing'] else 1)
+
+    def main_changed(self, args):
+        """Validate the files changed since --changed-since, straight from git"""
+        # Imported here - git plumbing is only needed in CI mode
+        from .batch import print_batch_summary, write_batch_reports
+        from .gitsource import GitError, validate_changed
+
+        try:
+            result = validate_changed(self.kind, self.score, self.version, self.rules.sha256,
+                                      args.changed_since, self.pattern, use_cache=not args.no_cache)
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+
+        if not result['files']:
+            print(f"No {self.label} files changed since {args.changed_since}")
+            sys.exit(0)
+
+        aggregate = write_batch_reports(result['reports'], result['files'], args.report_dir, self.batch_file, {
+            'changed_since': args.changed_since,
+            'base': result['base'],
+            'head': result['head'],
+            'blobs_scored': result['blobs_scored'],
+            'blobs_reused': result['blobs_reused'],
+            'validation_version': self.version
+        })
+        self.record(zip(result['files'], result['reports']))
+        print_batch_summary(self.label, aggregate, self.batch_file)
+        print(f"Blobs scored: {result['blobs_scored']}, reused from earlier runs: {result['blobs_reused']}")
+
+        if aggregate['error_count']:
+            sys.exit(2)
+        sys.exit(0 if aggregate['all_passing'] else 1)
+
+    def main_watch(self, args):
+        """Rescore files as they are saved until interrupted (--watch)"""
+        # Imported here - the file watcher is only needed in watch mode
+        from .watch import watch
+
+        sys.exit(watch(args.watch, self.pattern, partial(self.validate, use_cache=not args.no_cache),
+                       self.report_file, args.report_dir,
+                       debounce=args.debounce / 1000, poll=args.poll,
+                       on_report=lambda path, report: self.record([(path, report)])))
+
+    def main_verify(self, args):
+        """Run the 11-layer anti-cheat verification (replaces anti-cheat-<kind>.sh)"""
+        # Imported here - only the Stop Hook verification path needs it
+        from .verify import verify
+
+        sys.exit(verify(self.label, args.verify, self.pattern, self.report_file,
+                        self.script, self.rules.sha256))
+
+    def parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(description=f'{self.label} validation (90-point scoring)')
+        parser.add_argument('file', nargs='?', metavar=f'{self.kind}_file',
+                            help=f'{self.label} file to validate')
+        parser.add_argument('--batch', metavar='DIR|GLOB',
+                            help=f'Validate every matching file (directories are searched for {self.pattern})')
+        parser.add_argument('--jobs', type=int, default=None,
+                            help='Worker processes for --batch (default: CPU count)')
+        parser.add_argument('--report-dir', default=self.report_dir,
+                            help='Directory for per-file reports in --batch / --changed-since / --watch mode')
+        parser.add_argument('--no-cache', action='store_true',
+                            help='Always rescore (skip the content-addressed result cache)')
+        parser.add_argument('--verify', nargs='?', const=self.pattern, metavar='FILE|GLOB',
+                            help='Verify the existing report against FILE (11-layer anti-cheat, exit 0/2)')
+        parser.add_argument('--changed-since', metavar='REF',
+                            help=f'Validate only {self.pattern} files changed on HEAD since its merge-base '
+                                 f'with REF (read from git objects, results keyed on blob id)')
+        parser.add_argument('--timings', action='store_true',
+                            help='Record per-phase wall/CPU time in the report and the Prometheus textfile '
+                                 '(also CECELIA_VALIDATION_TIMINGS=1)')
+        parser.add_argument('--watch', nargs='?', const=self.pattern, metavar='FILE|DIR|GLOB',
+                            help='Keep running and rescore on every save (inotify, polling fallback)')
+        parser.add_argument('--debounce', type=int, default=150, metavar='MS',
+                            help='Collapse writes within MS milliseconds into one rescore '
+                                 '(--watch, default: 150)')
+        parser.add_argument('--poll', action='store_true',
+                            help='--watch by polling file mtimes instead of inotify')
+        return parser
+
+    def main(self, argv=None):
+        parser = self.parser()
+        args = parser.parse_args(argv)
+
+        if args.watch:
+            self.main_watch(args)
+
+        if args.verify:
+            self.main_verify(args)
+
+        if args.changed_since:
+            self.main_changed(args)
+
+        if args.batch:
+            self.main_batch(args)
+
+        if not args.file:
+            parser.error(f'a {self.label} file or --batch is required')
+
+        timings = Timings() if timings_enabled(args.timings) else None
+        with recording(timings):
+            report = self.validate(args.file, use_cache=not args.no_cache)
+
+        # Check for errors
+        if 'error' in report:
+            print(f"Error: {report['error']}", file=sys.stderr)
+            sys.exit(2)
+
+        write_report(self.report_file, report, timings, indent=2, ensure_ascii=False)
+        if timings:
+            export_timings(self.kind, report['passing'], timings)
+        self.record([(args.file, report)])
+
+        # Print summary
+        print(f"{self.label} Validation Report:")
+        print(f"  Form Score: {report['form_score']}/40")
+        print(f"  Content Score: {report['content_score']}/60")
+        print(f"  Total Score: {report['total_score']}/100")
+        for label, key in self.summary:
+            print(f"  {label}: {report[key]}")
+        print(f"  Status: {'✅ PASS' if report['passing'] else '❌ FAIL'}")
+
+        if not report['passing']:
+            print(f"\nIssues to fix:")
+            for issue in report['form_issues'] + report['content_issues']:
+                print(f"  - {issue}")
+
+        if timings:
+            print(f"\nTimings: {timings.summary()}")
+
+        print(f"\nReport saved to: {self.report_file}")
+
+        # Exit code
+        sys.exit(0 if report['passing'] else 1)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == 'history':
+        # Imported here - git history replay is a separate tool
+        from .history import main as history_main
+        history_main(argv[1:])
+        return
+    if argv and argv[0] == 'reports':
+        # Imported here - the report store query tool is separate too
+        from .store import main as reports_main
+        reports_main(argv[1:])
+        return
+
+    if not argv or argv[0] not in VALIDATORS:
+        print(f"Usage: cecelia-validate <{'|'.join(VALIDATORS)}> [args...]", file=sys.stderr)
+        print("       cecelia-validate history <file>... [--format csv|ndjson]", file=sys.stderr)
+        print("       cecelia-validate reports <lowest|issues|file|hash|stats|import> ...", file=sys.stderr)
+        sys.exit(2)
+
+    name, args = argv[0], argv[1:]
+    module, script = VALIDATORS[name]
+    sys.argv = [name] + args
+
+    if importlib.util.find_spec(module) is not None:
+        runpy.run_module(module, run_name='__main__', alter_sys=True)
+    else:
+        runpy.run_path(str(script_path(name)), run_name='__main__')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Thin client for the validation daemon
+
+    python3 validate-client.py <dod|prd|okr> [args...]
+
+Forwards the invocation to a running daemon (see daemon.py) and replays
+its stdout, stderr and exit code. When no daemon is listening - or
+CECELIA_VALIDATION_DAEMON=0 - the validator runs in-process instead, so
+callers can always use the client and results never depend on whether
+the daemon is up.
+
+Only stdlib modules that a bare interpreter already loads are imported
+before the daemon answers; the validators themselves are imported only
+on fallback.
+"""
+
+import json
+import os
+import socket
+import sys
+
+from cecelia_validation.endpoint import forwarded_env, socket_path
+
+DISABLED_VALUES = ('0', 'false', 'off', 'no')
+
+
+def daemon_enabled() -> bool:
+    return os.environ.get('CECELIA_VALIDATION_DAEMON', '1').lower() not in DISABLED_VALUES
+
+
+def call_daemon(argv: list, timeout: float = 60):
+    """
+    Run a validation on the daemon
+
+    Returns:
+        Response dict, or None if the daemon isn't reachable
+    """
+    path = socket_path()
+    if not os.path.exists(path):
+        return None
+
+    payload = {
+        'validator': argv[0],
+        'argv': argv[1:],
+        'cwd': os.getcwd(),
+        'env': forwarded_env()
+    }
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        sock.sendall((json.dumps(payload, ensure_ascii=False) + '\n').encode('utf-8'))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b'\n'):
+                break
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+    try:
+        response = json.loads(b''.join(chunks))
+    except ValueError:
+        return None
+    # Daemon-side failure (e.g. validator failed to load) - run locally instead
+    if 'error' in response:
+        return None
+    return response
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    if argv and daemon_enabled():
+        response = call_daemon(argv)
+        if response is not None:
+            sys.stdout.write(response.get('stdout', ''))
+            sys.stderr.write(response.get('stderr', ''))
+            sys.exit(response.get('exit_code', 1))
+
+    # Fallback: run the validator in this process
+    from cecelia_validation.cli import main as run_local
+    run_local(argv)
+
+
+if __name__ == '__main__':
+    main()
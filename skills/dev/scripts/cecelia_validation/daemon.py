@@ -0,0 +1,321 @@
+"""
+Persistent validation daemon
+
+Keeps the validators (rule tables, keyword matchers, result cache) loaded
+in one long-lived process and answers requests over a local Unix socket,
+so hook callers skip interpreter start and module import.
+
+Protocol - one JSON object per line, one request per connection:
+
+    -> {"validator": "dod", "argv": [".dod-x.md"], "cwd": "/repo", "env": {...}}
+    <- {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+    -> {"command": "ping"}
+    <- {"ok": true, "pid": 123, "validators": [...]}
+
+    -> {"command": "shutdown"}
+    <- {"ok": true}
+
+A validator request runs exactly what the script's main() would run
+(including writing its report into cwd), so results are identical to an
+in-process run. Requests are served one at a time: main() relies on the
+process-wide cwd, argv and stdout. --watch and --batch requests are
+refused with an error response (the client then runs them in-process),
+so they never hold up other callers.
+
+Socket path (see endpoint.py): $CECELIA_VALIDATION_SOCKET, else
+$XDG_RUNTIME_DIR/cecelia-validation.sock, else
+~/.cache/cecelia/validation.sock.
+"""
+
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from cecelia_validation.cli import VALIDATORS, load_validator, script_path
+from cecelia_validation.endpoint import forwarded_env, socket_path
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+# Package modules the daemon itself runs on - everything else is reloaded
+# (including cli, which holds the DoD/PRD command line; the daemon keeps
+# the VALIDATORS / load_validator it imported at start-up)
+DAEMON_MODULES = ('cecelia_validation', 'cecelia_validation.daemon', 'cecelia_validation.endpoint')
+
+# Arguments the daemon won't run: they never return (--watch) or would hold
+# the single request slot for long (--batch) - the client runs them in-process
+BLOCKING_ARGS = ('--watch', '--batch')
+
+
+def _package_stamp() -> tuple:
+    """(path, mtime) of every package module and rule file"""
+    stamp = []
+    for directory in (PACKAGE_DIR, PACKAGE_DIR / 'rulesets'):
+        try:
+            with os.scandir(directory) as entries:
+                stamp.extend((entry.path, entry.stat().st_mtime_ns) for entry in entries
+                             if entry.is_file() and entry.name.endswith(('.py', '.json', '.yaml', '.yml')))
+        except OSError:
+            pass  # bundled (zipapp) - never changes
+    return tuple(sorted(stamp))
+
+
+class ValidatorRegistry:
+    """Loaded validator modules, reloaded when their code or rules change on disk
+
+    A validator is reloaded when its script's mtime or its rule file's
+    sha256 changes; a change to any cecelia_validation module or rule
+    file reloads the package modules and every validator.
+    """
+
+    def __init__(self):
+        self._modules = {}
+        self._stamp = _package_stamp()
+
+    def _key(self, name):
+        try:
+            mtime = script_path(name).stat().st_mtime
+        except OSError:
+            mtime = None  # bundled (zipapp) - never changes
+        try:
+            with open(PACKAGE_DIR / 'rulesets' / f'{name}.json', 'rb') as f:
+                rules = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            rules = None  # no rule file (okr) or bundled
+        return mtime, rules
+
+    def _reload_package(self):
+        for module in [m for m in sys.modules
+                       if m.startswith('cecelia_validation.') and m not in DAEMON_MODULES]:
+            del sys.modules[module]
+        self._modules.clear()
+
+    def get(self, name):
+        stamp = _package_stamp()
+        if stamp != self._stamp:
+            self._reload_package()
+            self._stamp = stamp
+
+        key = self._key(name)
+        entry = self._modules.get(name)
+        if entry is None or entry[1] != key:
+            # Drop the cached module so load_validator() executes the script again
+            sys.modules.pop(VALIDATORS[name][0], None)
+            entry = (load_validator(name), key)
+            self._modules[name] = entry
+        return entry[0]
+
+    def preload(self):
+        for name in VALIDATORS:
+            try:
+                self.get(name)
+            except Exception:
+                # e.g. okr skill not deployed - load lazily on first request
+                pass
+
+
+def run_validator(module, name: str, argv: list, cwd: str, env: dict) -> dict:
+    """Run a validator's main() as if invoked from the command line"""
+    out, err = io.StringIO(), io.StringIO()
+    saved_cwd = os.getcwd()
+    saved_argv = sys.argv
+    saved_env = forwarded_env()
+
+    exit_code = 0
+    try:
+        os.chdir(cwd)
+        sys.argv = [VALIDATORS[name][1].rsplit('/', 1)[-1]] + list(argv)
+        for key in saved_env:
+            os.environ.pop(key, None)
+        os.environ.update(env)
+
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                module.main()
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        for key in forwarded_env():
+            os.environ.pop(key, None)
+        os.environ.update(saved_env)
+
+    return {'exit_code': exit_code, 'stdout': out.getvalue(), 'stderr': err.getvalue()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.dispatch(request)
+        except Exception as e:
+            response = {'error': f"{type(e).__name__}: {e}"}
+        self.wfile.write((json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8'))
+
+
+class ValidationDaemon(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server - requests are serialized"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.registry = ValidatorRegistry()
+        self.registry.preload()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            self.path.unlink()
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.path, 0o600)
+
+    def dispatch(self, request: dict) -> dict:
+        command = request.get('command')
+        if command == 'ping':
+            return {'ok': True, 'pid': os.getpid(), 'validators': sorted(VALIDATORS)}
+        if command == 'shutdown':
+            # shutdown() blocks until serve_forever() returns - ask from another thread
+            import threading
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'ok': True}
+
+        name = request.get('validator')
+        if name not in VALIDATORS:
+            return {'error': f"Unknown validator: {name}"}
+        argv = request.get('argv', [])
+        blocking = [arg for arg in argv if isinstance(arg, str) and arg.split('=', 1)[0] in BLOCKING_ARGS]
+        if blocking:
+            return {'error': f"{blocking[0].split('=', 1)[0]} is not run by the daemon (run the validator directly)"}
+        module = self.registry.get(name)
+        return run_validator(module, name, argv,
+                             request.get('cwd') or os.getcwd(), request.get('env', {}))
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def request(payload: dict, path: Path = None, timeout: float = 60) -> dict:
+    """Send one request to the daemon (raises OSError if it isn't running)"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path or socket_path()))
+        sock.sendall((json.dumps(payload, ensure_ascii=False) + '\n').encode('utf-8'))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b'\n'):
+                break
+    finally:
+        sock.close()
+
+    if not chunks:
+        raise ConnectionError('daemon closed the connection')
+    return json.loads(b''.join(chunks))
+
+
+def is_running(path: Path = None) -> bool:
+    try:
+        return request({'command': 'ping'}, path, timeout=2).get('ok', False)
+    except (OSError, ValueError):
+        return False
+
+
+def serve(path: Path = None):
+    """Run the daemon in the foreground"""
+    path = Path(path or socket_path())
+    server = ValidationDaemon(path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def start(path: Path = None, wait: float = 5) -> bool:
+    """Start the daemon in the background (no-op if already running)"""
+    import subprocess
+    import time
+
+    path = Path(path or socket_path())
+    if is_running(path):
+        return True
+
+    package_parent = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ, CECELIA_VALIDATION_SOCKET=str(path))
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (package_parent, env.get('PYTHONPATH')) if p)
+    subprocess.Popen(
+        [sys.executable, '-m', 'cecelia_validation.daemon', 'serve'],
+        env=env, start_new_session=True,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running(path):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def stop(path: Path = None) -> bool:
+    try:
+        return request({'command': 'shutdown'}, path, timeout=5).get('ok', False)
+    except (OSError, ValueError):
+        return False
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else 'status'
+    path = Path(socket_path())
+
+    if command == 'serve':
+        serve(path)
+    elif command == 'start':
+        if start(path):
+            print(f"✅ Validation daemon running ({path})")
+        else:
+            print(f"❌ Validation daemon failed to start ({path})", file=sys.stderr)
+            sys.exit(1)
+    elif command == 'stop':
+        print("✅ Validation daemon stopped" if stop(path) else "Validation daemon not running")
+    elif command == 'status':
+        if is_running(path):
+            print(f"✅ Validation daemon running ({path})")
+        else:
+            print(f"Validation daemon not running ({path})")
+            sys.exit(1)
+    else:
+        print("Usage: validate-daemon.py <start|stop|status|serve>", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Iterative dependency-graph analysis
+
+Used for OKR pr_plans (depends_on -> sequence) but independent of them:
+nodes are dense integer ids with an optional weight (e.g. estimated
+hours), edges point from a node to what it depends on.
+
+analyze() is one iterative Tarjan SCC pass plus one pass over the
+components, O(V + E) with no recursion, so 100k-long dependency chains
+are fine. Tarjan emits components dependencies-first, which is directly
+a topological execution order; components with more than one node (or a
+self-loop) are the cycles.
+"""
+
+
+class DependencyGraph:
+    """Directed graph: edge node -> dependency"""
+
+    def __init__(self):
+        self.edges = []
+        self.weights = []
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def add_node(self, weight=0) -> int:
+        """Add a node and return its id"""
+        self.edges.append([])
+        self.weights.append(weight)
+        return len(self.edges) - 1
+
+    def add_edge(self, node: int, dependency: int):
+        self.edges[node].append(dependency)
+
+    def edge_count(self) -> int:
+        return sum(len(deps) for deps in self.edges)
+
+    def strongly_connected_components(self) -> list:
+        """
+        Tarjan's algorithm with an explicit work stack
+
+        Returns:
+            List of components (lists of node ids); every component comes
+            after all components it depends on
+        """
+        edges = self.edges
+        n = len(edges)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+
+            while work:
+                v, i = work[-1]
+                deps = edges[v]
+                if i < len(deps):
+                    work[-1] = (v, i + 1)
+                    w = deps[i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+
+                # All dependencies of v visited - "return" to the caller
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+
+        return components
+
+    def analyze(self) -> dict:
+        """
+        Cycles, execution order and critical path
+
+        Cycles are collapsed into one step when computing the critical
+        path (a cycle of k nodes counts as k nodes / their summed weight).
+
+        Returns:
+            dict with:
+                cycles: node-id lists (sorted), one per cyclic component
+                order: all node ids, dependencies before dependents
+                critical_path: node ids of the longest chain (by node count),
+                    in execution order
+                critical_path_length: number of nodes on that chain
+                critical_path_weight: largest summed weight over any chain
+        """
+        edges = self.edges
+        weights = self.weights
+        components = self.strongly_connected_components()
+
+        component_of = [0] * len(edges)
+        for ci, component in enumerate(components):
+            for v in component:
+                component_of[v] = ci
+
+        depth = [0] * len(components)
+        total_weight = [0] * len(components)
+        next_component = [-1] * len(components)
+        cycles = []
+        order = []
+
+        for ci, component in enumerate(components):
+            if len(component) > 1 or component[0] in edges[component[0]]:
+                cycles.append(sorted(component))
+
+            best, best_depth, best_weight = -1, 0, 0
+            for v in component:
+                order.append(v)
+                for w in edges[v]:
+                    cw = component_of[w]
+                    if cw == ci:
+                        continue
+                    # Dependencies were emitted earlier, so already final
+                    if depth[cw] > best_depth:
+                        best, best_depth = cw, depth[cw]
+                    if total_weight[cw] > best_weight:
+                        best_weight = total_weight[cw]
+
+            depth[ci] = len(component) + best_depth
+            total_weight[ci] = sum(weights[v] for v in component) + best_weight
+            next_component[ci] = best
+
+        chain = []
+        if components:
+            ci = max(range(len(components)), key=depth.__getitem__)
+            while ci != -1:
+                chain.append(ci)
+                ci = next_component[ci]
+        critical_path = [v for ci in reversed(chain) for v in sorted(components[ci])]
+
+        return {
+            'cycles': cycles,
+            'order': order,
+            'critical_path': critical_path,
+            'critical_path_length': len(critical_path),
+            'critical_path_weight': max(total_weight, default=0)
+        }
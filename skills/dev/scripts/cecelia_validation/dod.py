@@ -0,0 +1,153 @@
+"""
+Single-pass DoD document model
+
+parse_dod() walks the document line by line exactly once and records
+everything the DoD checks need: checklist items with their attached Test
+fields, frontmatter, code-span count, non-empty line count and the
+keyword hits of the content matcher. validate-dod.py scores from the
+model only, so adding a check never adds another scan of the text.
+
+The rules mirror the original per-check scans exactly:
+    - lines are content.split('\\n') (a trailing '\\r' is stripped by the checks);
+      an iterable of lines such as source.iter_lines() is read lazily instead
+    - an item is a stripped line starting with '- [ ]' or '- [x]'
+    - an item has a Test field if 'Test:' occurs on its line or the next two
+    - code spans are counted like re.findall(r'`[^`]+`', content), which
+      may cross line breaks
+    - keywords never contain '\\n', so per-line matcher scans OR-ed
+      together equal one scan of the whole text
+"""
+
+import re
+
+CHECKBOX_RE = re.compile(r'^- \[[ x]\]')
+TEST_MARKER = 'Test:'
+# 'Test:' counts on the item line and the next TEST_WINDOW - 1 lines
+TEST_WINDOW = 3
+
+
+class DodItem:
+    """One checklist item"""
+
+    __slots__ = ('line', 'text', 'checked', 'test')
+
+    def __init__(self, line: int, text: str, checked: bool):
+        self.line = line        # 0-based line number
+        self.text = text        # item text after the checkbox
+        self.checked = checked
+        self.test = None        # text after 'Test:' if attached
+
+    @property
+    def has_test(self) -> bool:
+        return self.test is not None
+
+    def to_dict(self) -> dict:
+        return {'line': self.line + 1, 'text': self.text, 'checked': self.checked, 'test': self.test}
+
+
+class DodModel:
+    """Everything the DoD form/content checks read"""
+
+    def __init__(self):
+        self.items = []
+        self.frontmatter = {}
+        self.line_count = 0
+        self.non_empty_lines = 0  # excluding '---' lines
+        self.code_spans = 0
+        self.keyword_mask = 0
+
+    @property
+    def checklist_count(self) -> int:
+        return len(self.items)
+
+    @property
+    def items_with_test(self) -> int:
+        return sum(1 for item in self.items if item.test is not None)
+
+
+def parse_dod(content, matcher=None) -> DodModel:
+    """
+    Build a DodModel in one pass over content
+
+    Args:
+        content: DoD markdown, or an iterable of its lines (without '\\n')
+        matcher: Optional KeywordMatcher - hits are stored in model.keyword_mask
+
+    Returns:
+        DodModel
+    """
+    model = DodModel()
+    items = model.items
+
+    # Items whose Test window is still open (at most TEST_WINDOW)
+    pending = []
+
+    # Frontmatter: a leading '---' line up to the next '---' line
+    in_frontmatter = False
+
+    # Code-span scanner state, carried across lines
+    span_open = False
+    span_chars = 0
+    code_spans = 0
+
+    keyword_mask = 0
+    non_empty = 0
+
+    lines = content.split('\n') if isinstance(content, str) else content
+    number = -1
+    for number, line in enumerate(lines):
+        stripped = line.strip()
+
+        # Frontmatter
+        if number == 0 and stripped == '---':
+            in_frontmatter = True
+        elif in_frontmatter:
+            if stripped == '---':
+                in_frontmatter = False
+            else:
+                key, sep, value = stripped.partition(':')
+                if sep and key:
+                    model.frontmatter[key.strip()] = value.strip()
+
+        if stripped and not stripped.startswith('---'):
+            non_empty += 1
+
+        # Checklist items and their Test fields
+        if pending and pending[0].line <= number - TEST_WINDOW:
+            pending = [item for item in pending if item.line > number - TEST_WINDOW]
+        if CHECKBOX_RE.match(stripped):
+            item = DodItem(number, stripped[5:].strip(), stripped[3] == 'x')
+            items.append(item)
+            pending.append(item)
+        if pending and TEST_MARKER in line:
+            test = line.split(TEST_MARKER, 1)[1].strip()
+            for item in pending:
+                item.test = test
+            pending = []
+
+        # Code spans: `[^`]+` - an opening backtick needs >= 1 other char
+        # (newlines included) before the closing one
+        if span_open and number:
+            span_chars += 1  # the '\n' that ended the previous line
+        segments = line.split('`')
+        if span_open:
+            span_chars += len(segments[0])
+        for segment in segments[1:]:
+            if not span_open:
+                span_open = True
+                span_chars = 0
+            elif span_chars:
+                code_spans += 1
+                span_open = False
+            # else: '``' - the second backtick opens instead
+            if span_open:
+                span_chars += len(segment)
+
+        if matcher is not None:
+            keyword_mask = matcher.scan(line, keyword_mask)
+
+    model.line_count = number + 1
+    model.non_empty_lines = non_empty
+    model.code_spans = code_spans
+    model.keyword_mask = keyword_mask
+    return model
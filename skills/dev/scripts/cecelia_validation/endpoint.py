@@ -0,0 +1,28 @@
+"""
+Where the validation daemon listens and what a request carries
+
+Shared by daemon.py and client.py. The client runs on every hook call
+before the daemon answers, so this module imports nothing but os.
+"""
+
+import os
+
+# Client environment forwarded into each request (everything else is the daemon's)
+FORWARDED_ENV_PREFIXES = ('CECELIA_', 'BRAIN_URL', 'SKIP_VALIDATION', 'XDG_CACHE_HOME')
+
+
+def socket_path() -> str:
+    """Resolve the daemon socket path"""
+    override = os.environ.get('CECELIA_VALIDATION_SOCKET')
+    if override:
+        return override
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'cecelia-validation.sock')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'cecelia', 'validation.sock')
+
+
+def forwarded_env(environ=None) -> dict:
+    """Subset of the environment that influences validation"""
+    environ = os.environ if environ is None else environ
+    return {k: v for k, v in environ.items() if k.startswith(FORWARDED_ENV_PREFIXES)}
@@ -0,0 +1,189 @@
+"""
+Git object store as a validation source
+
+--changed-since REF validates only the documents a branch changed: the
+paths and blob ids come from `git diff-tree` between merge-base(REF, HEAD)
+and HEAD (what `git diff REF...HEAD` shows), and content is read straight
+from the object store through one `git cat-file --batch` process - no
+checkout, no working-tree reads.
+
+Results are keyed on the git blob id in the result cache (see
+cecelia_validation.cache), so a blob that was ever scored is never read
+or scored again: validating a PR costs its diff, not the repository.
+"""
+
+import fnmatch
+import hashlib
+import posixpath
+import subprocess
+from datetime import datetime
+
+from .cache import ResultCache, cache_enabled
+from .source import decode_text
+
+# Regular files only (no symlinks / submodules)
+_FILE_MODES = ('100644', '100755')
+
+
+class GitError(Exception):
+    """A git command failed (not a repository, unknown ref, missing object)"""
+
+
+def git(args, cwd=None) -> bytes:
+    """Run git and return stdout (raises GitError)"""
+    try:
+        proc = subprocess.run(['git'] + list(args), cwd=cwd, capture_output=True)
+    except OSError as e:
+        raise GitError(f"cannot run git: {e}") from None
+    if proc.returncode != 0:
+        message = proc.stderr.decode('utf-8', 'replace').strip() or f"git {args[0]} failed"
+        raise GitError(message)
+    return proc.stdout
+
+
+def rev_parse(rev: str, cwd=None) -> str:
+    return git(['rev-parse', '--verify', '--quiet', f'{rev}^{{commit}}'], cwd).decode().strip()
+
+
+def changed_blobs(ref: str, pattern: str, head: str = 'HEAD', cwd=None) -> tuple:
+    """
+    Documents added or modified on head since its merge-base with ref
+
+    Args:
+        ref: Base ref (branch, tag or commit)
+        pattern: File name pattern, e.g. '.dod-*.md' (matched against the base name)
+        head: Head revision
+        cwd: Repository directory
+
+    Returns:
+        tuple: (base commit, head commit, [(path, blob id), ...] sorted by path);
+               paths are relative to the repository root
+
+    Raises:
+        GitError: Not a repository, unknown ref, or no common history
+    """
+    git(['rev-parse', '--git-dir'], cwd)  # "not a git repository"
+    commits = []
+    for rev in (ref, head):
+        try:
+            commits.append(rev_parse(rev, cwd))
+        except GitError:
+            raise GitError(f"unknown revision: {rev}") from None
+    ref_commit, head_commit = commits
+    base = git(['merge-base', ref_commit, head_commit], cwd).decode().strip()
+
+    out = git(['diff-tree', '-r', '-z', '--no-renames', '--diff-filter=AMT', base, head_commit], cwd)
+    fields = out.split(b'\0')
+    blobs = []
+    # Raw -z records: ":<old mode> <new mode> <old id> <new id> <status>\0<path>\0"
+    for meta, path in zip(fields[0::2], fields[1::2]):
+        parts = meta.decode('ascii').lstrip(':').split()
+        if len(parts) != 5 or parts[1] not in _FILE_MODES:
+            continue
+        path = path.decode('utf-8', 'surrogateescape')
+        if fnmatch.fnmatch(posixpath.basename(path), pattern):
+            blobs.append((path, parts[3]))
+    return base, head_commit, sorted(blobs)
+
+
+class CatFile:
+    """One `git cat-file --batch` process: request an object, read it back"""
+
+    def __init__(self, cwd=None):
+        try:
+            self.proc = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=cwd,
+                                         stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        except OSError as e:
+            raise GitError(f"cannot run git: {e}") from None
+
+    def read(self, oid: str) -> bytes:
+        """Raw content of one object (raises GitError if it does not exist)"""
+        # Without --buffer, git flushes each reply - one request in flight, no deadlock
+        self.proc.stdin.write(oid.encode('ascii') + b'\n')
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline().split()
+        if len(header) != 3:
+            raise GitError(f"object not found: {oid}")
+        data = self.proc.stdout.read(int(header[2]))
+        self.proc.stdout.read(1)  # trailing newline
+        return data
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait()
+        self.proc.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def validate_changed(validator: str, score, version: str, ruleset: str, ref: str, pattern: str,
+                     use_cache: bool = True, cwd=None) -> dict:
+    """
+    Validate every document changed since ref, scoring only unseen blobs
+
+    Args:
+        validator: 'dod' or 'prd' (reports carry the path in '<validator>_file')
+        score: score(path, content_sha256, text) -> report
+        version: Validator version (part of the blob cache key)
+        ruleset: Rule-set version (part of the blob cache key)
+        ref: Base ref
+        pattern: File name pattern, e.g. '.dod-*.md'
+        use_cache: Look blob ids up in / store them into the result cache
+
+    Returns:
+        dict: base, head, files (paths), reports (same order),
+              blobs_scored, blobs_reused
+
+    Raises:
+        GitError: See changed_blobs()
+    """
+    base, head, blobs = changed_blobs(ref, pattern, cwd=cwd)
+    cache = ResultCache() if use_cache and cache_enabled() else None
+
+    seen = {}  # blob id -> report (the same content may sit at several paths)
+    reports = []
+    scored = reused = 0
+    cat = None
+    try:
+        for path, oid in blobs:
+            key = ResultCache.make_key(f'{validator}-blob', oid, version, ruleset)
+            report = seen.get(oid)
+            if report is None and cache:
+                report = cache.get(key)
+            if report is not None:
+                reused += 1
+            else:
+                cat = cat or CatFile(cwd)
+                data = cat.read(oid)
+                try:
+                    report = score(path, hashlib.sha256(data).hexdigest(), decode_text(data))
+                except UnicodeDecodeError as e:
+                    report = {'error': f"{type(e).__name__}: {e}", 'total_score': 0}
+                scored += 1
+                if cache and 'error' not in report:
+                    cache.put(key, report, evict=False)
+            seen[oid] = report
+            report = dict(report)
+            report[f'{validator}_file'] = path
+            report['git_blob'] = oid
+            report['timestamp'] = datetime.now().isoformat()
+            reports.append(report)
+    finally:
+        if cat:
+            cat.close()
+    if cache and scored:
+        cache.evict()
+
+    return {
+        'base': base,
+        'head': head,
+        'files': [path for path, _ in blobs],
+        'reports': reports,
+        'blobs_scored': scored,
+        'blobs_reused': reused
+    }
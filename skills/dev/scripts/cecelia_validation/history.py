@@ -0,0 +1,274 @@
+"""
+Score history of DoD/PRD files over their git history
+
+    python3 -m cecelia_validation history <file>... [--rev REV] [--format csv|ndjson]
+
+One `git log` lists every revision of the files with its blob id; each
+distinct blob is read once through a single `git cat-file --batch` pipe
+and scored once in a process pool (blobs already in the result cache
+from an earlier run or --changed-since are not read at all). Output is
+one row per (commit, file) in commit order, oldest first - no checkout,
+no validator process per revision.
+
+The validator is chosen by file name (.dod-*.md / .prd-*.md) unless
+--kind is given.
+"""
+
+import argparse
+import csv
+import fnmatch
+import hashlib
+import json
+import os
+import posixpath
+import sys
+import threading
+from datetime import datetime, timezone
+
+from .cache import ResultCache, cache_enabled
+from .cli import load_validator
+from .gitsource import GitError, git
+from .source import decode_text
+
+KIND_PATTERNS = {'dod': '.dod-*.md', 'prd': '.prd-*.md'}
+FIELDS = ['commit', 'committed_at', 'file', 'blob', 'total_score', 'form_score',
+          'content_score', 'passing', 'error']
+
+
+def kind_of(path: str, default: str = None):
+    """'dod' / 'prd' from the file name, else default"""
+    name = posixpath.basename(path)
+    for kind, pattern in KIND_PATTERNS.items():
+        if fnmatch.fnmatch(name, pattern):
+            return kind
+    return default
+
+
+def revisions(paths, rev: str = 'HEAD', first_parent: bool = False, cwd=None) -> list:
+    """
+    Every added/modified version of paths reachable from rev
+
+    Returns:
+        list of (commit, commit time, path, blob id), oldest commit first;
+        paths are relative to the repository root
+    """
+    args = ['log', '-z', '--raw', '--no-abbrev', '--no-renames', '--diff-filter=AMT',
+            '--reverse', '--format=%x01%H %ct']
+    if first_parent:
+        args.append('--first-parent')
+    out = git(args + [rev, '--'] + list(paths), cwd)
+
+    rows = []
+    commit = committed = None
+    tokens = iter(out.split(b'\0'))
+    for token in tokens:
+        token = token.lstrip(b'\n')
+        if token.startswith(b'\x01'):
+            commit, committed = token[1:].decode('ascii').split()
+        elif token.startswith(b':'):
+            # ":<old mode> <new mode> <old id> <new id> <status>" then the path
+            meta = token[1:].decode('ascii').split()
+            path = next(tokens).decode('utf-8', 'surrogateescape')
+            if meta[1] in ('100644', '100755'):
+                rows.append((commit, int(committed), path, meta[3]))
+    return rows
+
+
+def read_blobs(oids, cwd=None):
+    """Yield (oid, bytes) for oids through one buffered `git cat-file --batch` pipe"""
+    # Imported here - only history needs a streaming pipe
+    import subprocess
+
+    proc = subprocess.Popen(['git', 'cat-file', '--batch', '--buffer'], cwd=cwd,
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    # Requests are written from a thread so a full stdout pipe never blocks them
+    def feed():
+        try:
+            for oid in oids:
+                proc.stdin.write(oid.encode('ascii') + b'\n')
+        except BrokenPipeError:
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        for oid in oids:
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                raise GitError(f"object not found: {oid}")
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)
+            yield oid, data
+    finally:
+        proc.stdout.close()
+        writer.join()
+        proc.wait()
+
+
+def _score_blob(job) -> dict:
+    """Worker: score one blob's bytes (validator modules are loaded once per process)"""
+    kind, path, data = job
+    validator = load_validator(kind)
+    try:
+        score = getattr(validator, f"score_{kind}")
+        return score(path, hashlib.sha256(data).hexdigest(), decode_text(data))
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}", 'total_score': 0}
+
+
+def score_history(paths, rev: str = 'HEAD', kind: str = None, jobs: int = None,
+                  first_parent: bool = False, use_cache: bool = True, cwd=None) -> dict:
+    """
+    Score every historical version of paths
+
+    Args:
+        paths: Files (pathspecs) to follow
+        rev: Revision whose history is walked
+        kind: 'dod' / 'prd' for every file (default: by file name)
+        jobs: Worker processes (default: CPU count, 1 = in-process)
+        first_parent: Follow only the first parent of merges
+        use_cache: Reuse / store blob-id results in the result cache
+
+    Returns:
+        dict: rows (one per commit and file, oldest first), revisions,
+              blobs (distinct), blobs_scored, blobs_reused, skipped (paths
+              whose validator could not be determined)
+
+    Raises:
+        GitError: Not a repository or unknown revision
+    """
+    history = revisions(paths, rev, first_parent, cwd)
+    cache = ResultCache() if use_cache and cache_enabled() else None
+
+    # Distinct (kind, blob) pairs - the same content is scored once
+    results = {}
+    keys = {}
+    skipped = set()
+    pending = {}
+    for _, _, path, oid in history:
+        blob_kind = kind or kind_of(path)
+        if blob_kind is None:
+            skipped.add(path)
+            continue
+        if (blob_kind, oid) in results or (blob_kind, oid) in pending:
+            continue
+        validator = load_validator(blob_kind)
+        key = ResultCache.make_key(f'{blob_kind}-blob', oid, validator.VALIDATION_VERSION,
+                                   validator.RULESET_VERSION)
+        keys[(blob_kind, oid)] = key
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            results[(blob_kind, oid)] = cached
+        else:
+            pending[(blob_kind, oid)] = path
+    reused = len(results)
+
+    if pending:
+        order = list(pending)
+        jobs_iter = ((blob_kind, pending[(blob_kind, oid)], data)
+                     for (blob_kind, oid), (_, data) in zip(order, read_blobs([oid for _, oid in order], cwd)))
+        for pair, report in zip(order, _map(_score_blob, jobs_iter, len(order), jobs)):
+            results[pair] = report
+            if cache and 'error' not in report:
+                cache.put(keys[pair], report, evict=False)
+        if cache:
+            cache.evict()
+
+    rows = []
+    for commit, committed, path, oid in history:
+        blob_kind = kind or kind_of(path)
+        if blob_kind is None:
+            continue
+        report = results[(blob_kind, oid)]
+        rows.append({
+            'commit': commit,
+            'committed_at': datetime.fromtimestamp(committed, timezone.utc).isoformat(),
+            'file': path,
+            'blob': oid,
+            'total_score': report.get('total_score', 0),
+            'form_score': report.get('form_score'),
+            'content_score': report.get('content_score'),
+            'passing': report.get('passing', False),
+            'error': report.get('error')
+        })
+
+    return {
+        'rows': rows,
+        'revisions': len(rows),
+        'blobs': reused + len(pending),
+        'blobs_scored': len(pending),
+        'blobs_reused': reused,
+        'skipped': sorted(skipped)
+    }
+
+
+def _map(fn, items, count: int, jobs: int = None):
+    """fn over items, in order - in a process pool when worthwhile"""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or count <= 1:
+        return map(fn, items)
+
+    # Imported lazily - multiprocessing is slow to import
+    from concurrent.futures import ProcessPoolExecutor
+
+    def run():
+        with ProcessPoolExecutor(max_workers=min(jobs, count)) as executor:
+            yield from executor.map(fn, items, chunksize=max(1, count // (jobs * 4)))
+    return run()
+
+
+def write_rows(rows, fmt: str, out):
+    """Write rows as CSV (with header) or NDJSON"""
+    if fmt == 'ndjson':
+        for row in rows:
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+        return
+    writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator='\n')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({k: ('' if v is None else v) for k, v in row.items()})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='cecelia-validate history',
+        description='Score every historical version of DoD/PRD files (time series)')
+    parser.add_argument('files', nargs='+', help='Files to follow (.dod-*.md / .prd-*.md)')
+    parser.add_argument('--rev', default='HEAD', help='Revision whose history is walked (default: HEAD)')
+    parser.add_argument('--kind', choices=sorted(KIND_PATTERNS),
+                        help='Validator for every file (default: by file name)')
+    parser.add_argument('--format', choices=['csv', 'ndjson'], default='csv', help='Output format (default: csv)')
+    parser.add_argument('--output', '-o', help='Write the series here (default: stdout)')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--first-parent', action='store_true', help='Follow only the first parent of merges')
+    parser.add_argument('--no-cache', action='store_true', help='Score every blob (skip the result cache)')
+    args = parser.parse_args(argv)
+
+    try:
+        result = score_history(args.files, args.rev, args.kind, args.jobs, args.first_parent,
+                               use_cache=not args.no_cache)
+    except GitError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write_rows(result['rows'], args.format, f)
+    else:
+        write_rows(result['rows'], args.format, sys.stdout)
+
+    for path in result['skipped']:
+        print(f"Warning: {path} is not a .dod-*.md / .prd-*.md file (use --kind)", file=sys.stderr)
+    print(f"History: {result['revisions']} revision(s), {result['blobs']} distinct blob(s), "
+          f"{result['blobs_scored']} scored, {result['blobs_reused']} from cache", file=sys.stderr)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""
+Incremental parsing of one large array inside a JSON object
+
+OKR decompositions keep almost all of their bulk in a single top-level
+array (initiatives[]). iter_members() walks the top-level object from a
+file object in chunks and yields that array's elements one at a time, so
+peak memory is bounded by the largest element rather than the document.
+Every other top-level member is decoded whole.
+
+CanonicalHash reproduces sha256(json.dumps(doc, sort_keys=True)) from
+the same events without ever building the document. Serialized array
+elements are spooled (to disk past a few MB) because top-level keys that
+sort before the array may still arrive after it.
+
+Only the standard library is used - element decoding is json's own C
+scanner, so values (and therefore hashes) match json.load exactly.
+"""
+
+import hashlib
+import json
+import tempfile
+
+CHUNK_SIZE = 1 << 16
+SPOOL_MAX_MEMORY = 8 << 20
+
+_WHITESPACE = ' \t\n\r'
+# Characters that can follow a complete value in valid JSON
+_VALUE_END = _WHITESPACE + ',:]}'
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Chunked text buffer with a read position"""
+
+    def __init__(self, fp, chunk_size: int = CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        if self.eof:
+            return False
+        # Drop the consumed prefix so the buffer holds at most one value
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        data = self.fp.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def error(self, msg: str):
+        raise json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunk_size):
+                return ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                end = None
+            # A value not followed by a delimiter may be truncated (12|3, 1.5|e3)
+            if end is not None and (self.eof or (end < len(self.buf) and self.buf[end] in _VALUE_END)):
+                self.pos = end
+                return value
+            # Read at least as much again - keeps retries linear overall
+            if not self._fill(max(self.chunk_size, len(self.buf) - self.pos)):
+                if end is not None:
+                    self.pos = end
+                    return value
+                # Re-raise with json's own message and position
+                _decoder.raw_decode(self.buf, self.pos)
+
+
+def iter_members(fp, array_key: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Walk a top-level JSON object, streaming one array member
+
+    Args:
+        fp: Text file object positioned at the document
+        array_key: Top-level key whose array value is streamed
+
+    Yields:
+        ('member', key, value) for every other top-level member (and for
+            array_key when its value is not an array)
+        ('array', array_key, None) when array_key's array starts
+        ('item', index, value) for each element of that array
+
+    Raises:
+        json.JSONDecodeError: Malformed JSON, a non-object document, or
+            array_key appearing more than once
+    """
+    reader = _Reader(fp, chunk_size)
+    reader.expect('{')
+    seen_key = False
+
+    if reader.peek() == '}':
+        reader.pos += 1
+    else:
+        while True:
+            if reader.peek() != '"':
+                reader.error('Expecting property name enclosed in double quotes')
+            key = reader.value()
+            reader.expect(':')
+
+            if key == array_key:
+                # json.load would keep the last one - too late once streamed
+                if seen_key:
+                    reader.error(f"Duplicate '{array_key}' key")
+                seen_key = True
+
+            if key == array_key and reader.peek() == '[':
+                reader.pos += 1
+                yield ('array', key, None)
+                index = 0
+                if reader.peek() == ']':
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield ('item', index, reader.value())
+                        index += 1
+                        char = reader.peek()
+                        reader.pos += 1
+                        if char == ']':
+                            break
+                        if char != ',':
+                            reader.pos -= 1
+                            reader.error("Expecting ',' delimiter")
+            else:
+                yield ('member', key, reader.value())
+
+            char = reader.peek()
+            reader.pos += 1
+            if char == '}':
+                break
+            if char != ',':
+                reader.pos -= 1
+                reader.error("Expecting ',' delimiter")
+
+    if reader.peek() != '':
+        reader.error('Extra data')
+
+
+class CanonicalHash:
+    """
+    sha256 of json.dumps(doc, sort_keys=True), fed from iter_members() events
+
+    Usage:
+        h = CanonicalHash('initiatives')
+        for kind, key, value in iter_members(fp, 'initiatives'):
+            h.update(kind, key, value)
+        h.hexdigest()
+    """
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.members = {}
+        self.has_array = False
+        self.item_count = 0
+        self._spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY, mode='w+b')
+
+    def update(self, kind: str, key, value):
+        if kind == 'array':
+            self.has_array = True
+        elif kind == 'item':
+            if self.item_count:
+                self._spool.write(b', ')
+            self._spool.write(json.dumps(value, sort_keys=True).encode())
+            self.item_count += 1
+        else:
+            self.members[key] = value
+
+    def _member_text(self, key) -> bytes:
+        return f"{json.dumps(key)}: {json.dumps(self.members[key], sort_keys=True)}".encode()
+
+    def hexdigest(self) -> str:
+        digest = hashlib.sha256()
+        keys = set(self.members)
+        if self.has_array:
+            keys.add(self.array_key)
+
+        digest.update(b'{')
+        for i, key in enumerate(sorted(keys)):
+            if i:
+                digest.update(b', ')
+            if self.has_array and key == self.array_key:
+                digest.update(f"{json.dumps(key)}: [".encode())
+                self._spool.seek(0)
+                for chunk in iter(lambda: self._spool.read(CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                digest.update(b']')
+            else:
+                digest.update(self._member_text(key))
+        digest.update(b'}')
+        return digest.hexdigest()
+
+    def close(self):
+        self._spool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
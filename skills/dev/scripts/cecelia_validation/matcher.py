@@ -0,0 +1,123 @@
+"""
+Single-pass multi-keyword matcher (Aho-Corasick)
+
+The content scorers only need to know *which* keywords occur in a
+document. Instead of one `kw in content` scan per keyword, the keyword
+table is compiled once into an automaton and every hit is collected in a
+single linear pass, so scoring cost no longer grows with the number of
+keywords. Matching is case-sensitive, same as `in`.
+
+tables() / from_tables() round-trip the built automaton as plain lists
+and dicts, so compiled rule sets (see rules.py) can be cached on disk.
+"""
+
+from collections import deque
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a fixed keyword table"""
+
+    def __init__(self, keywords):
+        # Deduplicate while keeping order - each keyword owns one bit
+        self.keywords = [kw for kw in dict.fromkeys(keywords) if kw]
+        self._bits = {kw: 1 << i for i, kw in enumerate(self.keywords)}
+        self._full_mask = (1 << len(self.keywords)) - 1
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [0]
+
+        for kw in self.keywords:
+            state = 0
+            for ch in kw:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(0)
+                    self._goto[state][ch] = nxt
+                state = nxt
+            self._out[state] |= self._bits[kw]
+
+        # Breadth-first failure links; outputs inherit from the fail state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    @classmethod
+    def from_tables(cls, keywords, goto, fail, out) -> 'KeywordMatcher':
+        """Rebuild a matcher from tables() without recompiling the automaton"""
+        matcher = cls.__new__(cls)
+        matcher.keywords = list(keywords)
+        matcher._bits = {kw: 1 << i for i, kw in enumerate(matcher.keywords)}
+        matcher._full_mask = (1 << len(matcher.keywords)) - 1
+        matcher._goto = list(goto)
+        matcher._fail = list(fail)
+        matcher._out = list(out)
+        return matcher
+
+    def tables(self) -> tuple:
+        """The automaton as (keywords, goto, fail, out) - plain, marshal-able data"""
+        return self.keywords, self._goto, self._fail, self._out
+
+    def scan(self, text: str, found: int = 0) -> int:
+        """
+        Scan text once
+
+        Args:
+            found: Mask from earlier scans (e.g. previous lines) to extend
+
+        Returns:
+            Bitmask of matched keywords (stops early once all are found)
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        full = self._full_mask
+        if found == full:
+            return found
+
+        state = 0
+        for ch in text:
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt if nxt is not None else 0
+
+            if out[state]:
+                found |= out[state]
+                if found == full:
+                    break
+        return found
+
+    def find(self, text: str) -> set:
+        """Return the set of keywords that occur in text"""
+        return self.hits(self.scan(text))
+
+    def hits(self, mask: int) -> set:
+        """Convert a scan() bitmask back to keywords"""
+        return {kw for kw, bit in self._bits.items() if mask & bit}
+
+    def mask(self, keywords) -> int:
+        """Bitmask covering every keyword of a table"""
+        found = 0
+        for kw in keywords:
+            found |= self._bits[kw]
+        return found
+
+    def count(self, mask: int, keywords) -> int:
+        """Number of keywords from a table present in mask"""
+        return sum(1 for kw in keywords if mask & self._bits[kw])
+
+    def has_any(self, mask: int, keywords) -> bool:
+        """True if any keyword from a table is present in mask"""
+        return any(mask & self._bits[kw] for kw in keywords)
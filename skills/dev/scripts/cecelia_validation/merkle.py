@@ -0,0 +1,106 @@
+"""
+Merkle subtree hashes and per-document incremental state
+
+A document is hashed as a tree: every subtree that can be scored on its
+own (an OKR initiative, each of its pr_plans) gets its own hash, and a
+parent hashes its children's hashes. Editing one initiative changes only
+that initiative's hash (and the root), so a re-run can look every other
+subtree up in the state of the previous run and re-score just the change.
+
+The state lives next to the result cache (see cache.default_cache_dir),
+one file per document path, and is only a cache: any I/O or decode error,
+or a validator/rule-set version change, simply means nothing is reused.
+It never replaces the whole-document content hash used for anti-cheat.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .cache import default_cache_dir
+
+# Leaves and nodes are hashed in separate domains, so a leaf can never
+# collide with a node built from the same bytes
+_LEAF = b'\x00'
+_NODE = b'\x01'
+
+
+def leaf_hash(value) -> str:
+    """Hash of one JSON value (canonical: sorted keys)"""
+    blob = json.dumps(value, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(_LEAF + blob).hexdigest()
+
+
+def node_hash(children) -> str:
+    """Hash of an ordered list of child hashes"""
+    digest = hashlib.sha256(_NODE)
+    for child in children:
+        digest.update(child.encode('ascii'))
+    return digest.hexdigest()
+
+
+def state_path(document, cache_dir=None) -> Path:
+    """State file of a document (keyed by its absolute path)"""
+    base = Path(cache_dir) if cache_dir else default_cache_dir()
+    key = hashlib.sha256(str(Path(document).resolve()).encode('utf-8')).hexdigest()[:16]
+    return base / 'state' / f"{key}.json"
+
+
+class IncrementalState:
+    """Results of the previous run, keyed by subtree hash
+
+    lookup() reads the previous run, store() records the current one;
+    save() replaces the previous run with the current one. Tables are
+    plain dicts of JSON values; stats holds counters for the report.
+    """
+
+    def __init__(self, path, version: str):
+        self.path = Path(path)
+        self.version = version
+        self.previous = {}
+        self.current = {}
+        self.root = None
+        self.stats = {}
+
+    @classmethod
+    def load(cls, path, version: str) -> 'IncrementalState':
+        state = cls(path, version)
+        try:
+            with open(state.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return state
+        if isinstance(saved, dict) and saved.get('version') == version \
+                and isinstance(saved.get('tables'), dict):
+            state.previous = saved['tables']
+        return state
+
+    def lookup(self, table: str, key: str):
+        """Previous value for key, or None"""
+        return self.previous.get(table, {}).get(key)
+
+    def count(self, name: str, n: int = 1):
+        self.stats[name] = self.stats.get(name, 0) + n
+
+    def store(self, table: str, key: str, value):
+        self.current.setdefault(table, {})[key] = value
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.current)
+
+    def save(self):
+        """Persist the current run (atomic write); errors are ignored"""
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'root': self.root, 'tables': self.current},
+                          f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
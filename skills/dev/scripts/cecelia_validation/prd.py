@@ -0,0 +1,178 @@
+"""
+PRD section index
+
+index_prd() walks the document once and maps every heading (`#`..`######`
+lines and `**bold**`-only lines) to the character range it covers - from
+its line up to the next heading of the same or a higher level. Required
+sections are resolved during the same pass, so validate-prd.py checks
+them with dictionary lookups and can score content heuristics (risk
+keywords) only inside the section they belong to.
+
+Section *presence* follows the original per-section regexes exactly:
+    ##\\s*<name> | ###\\s*<name> | **<name>**
+anywhere in the text - '##' may appear mid-line and the whitespace after
+it may span line breaks.
+
+The same pass also collects what content scoring needs (keyword hits for
+the whole document and per scanned section, checkbox count), so a PRD
+given as lazily read lines (source.iter_lines()) is never held in memory.
+Keywords and checkboxes never span a line break, so per-line scans equal
+scans of the whole text or of a section's range.
+"""
+
+import re
+
+CHECKBOX_RE = re.compile(r'- \[[ x]\]')
+
+
+class Heading:
+    """One heading and the content range it covers"""
+
+    __slots__ = ('title', 'level', 'start', 'end')
+
+    def __init__(self, title: str, level: int, start: int):
+        self.title = title
+        self.level = level  # 1-6 for '#' headings, 7 for **bold** lines
+        self.start = start
+        self.end = None     # set when the next same-or-higher heading starts
+
+    def to_dict(self) -> dict:
+        return {'title': self.title, 'level': self.level, 'start': self.start, 'end': self.end}
+
+
+# Closes at the next heading of any level (section named outside a heading line)
+_MENTION_LEVEL = 99
+BOLD_LEVEL = 7
+
+
+class PrdIndex:
+    """Headings, required-section ranges and line counts of one PRD"""
+
+    def __init__(self, content: str = None):
+        self.content = content    # None when indexed from lines
+        self.headings = []
+        self.sections = {}        # required section -> [Heading, ...]
+        self.non_empty_lines = 0  # excluding '---' lines
+        self.checkbox_count = 0
+        self.keyword_mask = 0     # matcher hits over the whole document
+        self.section_masks = {}   # scanned section -> matcher hits inside it
+
+    def has(self, section: str) -> bool:
+        return section in self.sections
+
+    def ranges(self, section: str) -> list:
+        """(start, end) character ranges of a required section"""
+        return [(h.start, h.end) for h in self.sections.get(section, [])]
+
+    def text(self, section: str) -> str:
+        """Text of every occurrence of a section, joined by newlines"""
+        if self.content is None:
+            raise ValueError('section text needs an index built from the full content')
+        return '\n'.join(self.content[start:end] for start, end in self.ranges(section))
+
+
+def _heading_of(stripped: str):
+    """(level, title) if a stripped line is a heading, else None"""
+    if stripped.startswith('#'):
+        level = len(stripped) - len(stripped.lstrip('#'))
+        if level <= 6:
+            return level, stripped[level:].strip()
+    elif len(stripped) > 4 and stripped.startswith('**') and stripped.endswith('**') \
+            and '**' not in stripped[2:-2]:
+        return BOLD_LEVEL, stripped[2:-2].strip()
+    return None
+
+
+def index_prd(content, section_names, matcher=None, scan_sections=()) -> PrdIndex:
+    """
+    Build a PrdIndex in one pass over content
+
+    Args:
+        content: PRD markdown, or an iterable of its lines (without '\\n')
+        section_names: Required section names to resolve
+        matcher: Optional KeywordMatcher - hits go to index.keyword_mask
+        scan_sections: Sections (among section_names) whose own hits are
+            kept in index.section_masks
+
+    Returns:
+        PrdIndex
+    """
+    is_text = isinstance(content, str)
+    index = PrdIndex(content if is_text else None)
+    section_names = list(section_names)
+    bold_markers = [(name, f'**{name}**') for name in section_names]
+
+    scanned = {}  # open Heading -> scanned section names it stands for
+    section_masks = {name: 0 for name in scan_sections}
+    keyword_mask = 0
+    checkboxes = 0
+
+    open_headings = []
+    pending_hash = False  # '##' followed only by whitespace up to the line break
+    offset = 0
+    non_empty = 0
+
+    for line in (content.split('\n') if is_text else content):
+        line_start = offset
+        offset += len(line) + 1
+        stripped = line.strip()
+
+        if stripped and not stripped.startswith('---'):
+            non_empty += 1
+
+        heading = None
+        parsed = _heading_of(stripped)
+        if parsed:
+            level, title = parsed
+            while open_headings and open_headings[-1].level >= level:
+                open_headings.pop().end = line_start
+            heading = Heading(title, level, line_start)
+            index.headings.append(heading)
+            open_headings.append(heading)
+
+        # Required sections named on this line
+        found = []
+        if pending_hash and stripped:
+            found.extend(name for name in section_names if line.lstrip().startswith(name))
+            pending_hash = False
+        pos = line.find('##')
+        while pos != -1:
+            rest = line[pos + 2:].lstrip()
+            if rest:
+                found.extend(name for name in section_names if rest.startswith(name))
+            else:
+                pending_hash = True
+            pos = line.find('##', pos + 1)
+        if '**' in line:
+            found.extend(name for name, marker in bold_markers if marker in line)
+
+        for name in dict.fromkeys(found):
+            if heading is not None and heading.title.lstrip('#').strip().startswith(name):
+                section = heading
+            else:
+                section = Heading(name, _MENTION_LEVEL, line_start)
+                open_headings.append(section)
+            index.sections.setdefault(name, []).append(section)
+            if name in section_masks:
+                scanned.setdefault(section, []).append(name)
+
+        # Content scans - the line belongs to every section still open
+        if '- [' in line:
+            checkboxes += len(CHECKBOX_RE.findall(line))
+        if matcher is not None:
+            line_mask = matcher.scan(line)
+            keyword_mask |= line_mask
+            if scanned:
+                for heading in open_headings:
+                    for name in scanned.get(heading, ()):
+                        section_masks[name] |= line_mask
+
+    end = max(offset - 1, 0)
+    for heading in open_headings:
+        heading.end = end
+
+    index.non_empty_lines = non_empty
+    index.checkbox_count = checkboxes
+    index.keyword_mask = keyword_mask
+    index.section_masks = section_masks
+    return index
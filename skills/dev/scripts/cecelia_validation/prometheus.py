@@ -0,0 +1,144 @@
+"""
+Prometheus textfile export of validation timings
+
+Each timed run adds to cumulative counters and histograms in one textfile
+that node_exporter's textfile collector scrapes:
+
+    cecelia_validation_runs_total{validator,result}
+    cecelia_validation_phase_seconds{validator,phase}          (histogram, wall time)
+    cecelia_validation_phase_cpu_seconds_total{validator,phase}
+
+The file is read back, updated and replaced atomically under an flock,
+so concurrent hooks never lose a run and the collector never sees a
+partial file.
+
+Environment:
+    CECELIA_VALIDATION_TEXTFILE   Textfile path (default:
+                                  <cache dir>/metrics/cecelia_validation.prom)
+"""
+
+import fcntl
+import os
+import re
+from pathlib import Path
+
+from .cache import default_cache_dir
+
+# Wall-time histogram buckets (seconds)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+RUNS = 'cecelia_validation_runs_total'
+PHASE = 'cecelia_validation_phase_seconds'
+PHASE_CPU = 'cecelia_validation_phase_cpu_seconds_total'
+
+# family -> (type, help, sample names)
+FAMILIES = {
+    RUNS: ('counter', 'Timed validation runs by result', [RUNS]),
+    PHASE: ('histogram', 'Wall time per validation phase',
+             [f'{PHASE}_bucket', f'{PHASE}_sum', f'{PHASE}_count']),
+    PHASE_CPU: ('counter', 'CPU time per validation phase', [PHASE_CPU]),
+}
+
+_SAMPLE_RE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[^}]*\})?\s+(\S+)$')
+_LABEL_RE = re.compile(r'(\w+)="([^"]*)"')
+
+
+def default_textfile() -> Path:
+    override = os.environ.get('CECELIA_VALIDATION_TEXTFILE')
+    if override:
+        return Path(override)
+    return default_cache_dir() / 'metrics' / 'cecelia_validation.prom'
+
+
+def _labels(**labels) -> tuple:
+    return tuple(labels.items())
+
+
+def _format_le(bound) -> str:
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def parse_samples(text: str) -> dict:
+    """(name, labels) -> value for every sample line (comments skipped)"""
+    samples = {}
+    for line in text.splitlines():
+        match = _SAMPLE_RE.match(line.strip())
+        if not match or line.startswith('#'):
+            continue
+        name, labels, value = match.groups()
+        try:
+            samples[(name, tuple(_LABEL_RE.findall(labels or '')))] = float(value)
+        except ValueError:
+            continue
+    return samples
+
+
+def render(samples: dict) -> str:
+    """Textfile content: families in a fixed order, samples sorted by labels"""
+    lines = []
+    for family, (kind, help_text, names) in FAMILIES.items():
+        family_samples = [(key, value) for key, value in samples.items() if key[0] in names]
+        if not family_samples:
+            continue
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+
+        def order(item):
+            (name, labels), _ = item
+            plain = tuple((k, v) for k, v in labels if k != 'le')
+            le = dict(labels).get('le')
+            return plain, names.index(name), float(le) if le else 0.0
+
+        for (name, labels), value in sorted(family_samples, key=order):
+            label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+            number = int(value) if value == int(value) else value
+            lines.append(f"{name}{{{label_text}}} {number}")
+    return '\n'.join(lines) + '\n'
+
+
+def add_run(samples: dict, validator: str, result: str, timings) -> dict:
+    """Add one run's phase timings to samples (in place)"""
+    def inc(name, labels, amount):
+        samples[(name, labels)] = samples.get((name, labels), 0) + amount
+
+    inc(RUNS, _labels(validator=validator, result=result), 1)
+    for phase, (wall, cpu, calls) in timings.phases.items():
+        base = _labels(validator=validator, phase=phase)
+        for bound in BUCKETS + (float('inf'),):
+            inc(f'{PHASE}_bucket', base + (('le', _format_le(bound)),), 1 if wall <= bound else 0)
+        inc(f'{PHASE}_sum', base, wall)
+        inc(f'{PHASE}_count', base, 1)
+        inc(PHASE_CPU, base, cpu)
+    return samples
+
+
+def export_run(validator: str, result: str, timings, path=None) -> Path:
+    """
+    Add one timed run to the textfile
+
+    Args:
+        validator: 'dod', 'prd' or 'okr'
+        result: 'pass' or 'fail'
+        timings: cecelia_validation.timings.Timings of the run
+        path: Textfile (default: default_textfile())
+
+    Returns:
+        Path of the textfile
+
+    Raises:
+        OSError: Textfile directory not writable
+    """
+    path = Path(path) if path else default_textfile()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            samples = parse_samples(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            samples = {}
+        add_run(samples, validator, result, timings)
+        # Same directory, so os.replace is atomic for the collector
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(render(samples), encoding='utf-8')
+        os.replace(tmp, path)
+    return path
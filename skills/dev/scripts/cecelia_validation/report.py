@@ -0,0 +1,100 @@
+"""
+Validation report assembly and the typed report object
+
+assemble_report() builds the DoD/PRD report dict both scripts write (same
+keys, same order). ValidationReport is the typed view of any validator's
+report returned by the in-process API (see api.py); .data keeps the exact
+dict the script would have written.
+"""
+
+from datetime import datetime
+
+PASS_SCORE = 90
+
+
+def assemble_report(file_field: str, path, form_result: dict, content_result: dict,
+                    content_sha256: str, version: str, rules) -> dict:
+    """
+    DoD/PRD validation report
+
+    Args:
+        file_field: 'dod_file' / 'prd_file'
+        form_result: validate_form() result - keys besides form_score and
+            form_issues (e.g. checklist_count) are reported as-is
+        content_result: validate_content() result
+        rules: The RuleSet that scored the document
+    """
+    form_score = form_result['form_score']
+    content_score = content_result['content_score']
+    total_score = form_score + content_score
+
+    report = {
+        file_field: str(path),
+        'form_score': form_score,
+        'content_score': content_score,
+        'total_score': total_score,
+        'passing': total_score >= PASS_SCORE,
+    }
+    for key, value in form_result.items():
+        if key not in ('form_score', 'form_issues'):
+            report[key] = value
+    report.update({
+        'form_issues': form_result['form_issues'],
+        'content_issues': content_result['content_issues'],
+        'content_sha256': content_sha256,
+        'timestamp': datetime.now().isoformat(),
+        'validation_version': version,
+        'ruleset_version': rules.version,
+        'ruleset_sha256': rules.sha256
+    })
+    return report
+
+
+class ValidationReport:
+    """One validator's result: scores, issues and the report dict behind them"""
+
+    __slots__ = ('kind', 'name', 'form_score', 'content_score', 'total_score', 'passing',
+                 'form_issues', 'content_issues', 'content_hash', 'ruleset', 'error', 'data')
+
+    def __init__(self, kind: str, name: str, form_score: int = 0, content_score: int = 0,
+                 total_score: int = 0, passing: bool = False, form_issues=(), content_issues=(),
+                 content_hash: str = None, ruleset: str = None, error: str = None, data: dict = None):
+        self.kind = kind                      # 'dod' | 'prd' | 'okr'
+        self.name = name                      # file name or caller's label
+        self.form_score = form_score
+        self.content_score = content_score
+        self.total_score = total_score
+        self.passing = passing
+        self.form_issues = list(form_issues)
+        self.content_issues = list(content_issues)
+        self.content_hash = content_hash      # content_sha256 (DoD/PRD), content_hash (OKR)
+        self.ruleset = ruleset                # rule-set version the score depends on
+        self.error = error                    # set instead of scores when validation failed
+        self.data = data if data is not None else {}
+
+    @classmethod
+    def from_dict(cls, kind: str, name: str, report: dict, ruleset: str = None) -> 'ValidationReport':
+        """Typed view of a report dict written by validate-dod/prd/okr.py"""
+        if 'error' in report:
+            return cls(kind, name, error=report['error'], ruleset=ruleset, data=report)
+        if kind == 'okr':
+            return cls(kind, name, report['form_score'], report['content_score'], report['total'],
+                       report['passed'], report['issues'], (), report['content_hash'], ruleset,
+                       data=report)
+        return cls(kind, name, report['form_score'], report['content_score'], report['total_score'],
+                   report['passing'], report['form_issues'], report['content_issues'],
+                   report['content_sha256'], report.get('ruleset_sha256', ruleset), data=report)
+
+    @property
+    def issues(self) -> list:
+        return self.form_issues + self.content_issues
+
+    def to_dict(self) -> dict:
+        """The report exactly as the validator script writes it"""
+        return dict(self.data)
+
+    def __repr__(self):
+        if self.error:
+            return f"<ValidationReport {self.kind} {self.name!r} error={self.error!r}>"
+        return (f"<ValidationReport {self.kind} {self.name!r} total={self.total_score} "
+                f"passing={self.passing}>")
@@ -0,0 +1,328 @@
+"""
+Declarative scoring rule sets, compiled once and cached on disk
+
+The DoD/PRD scoring rules (keyword tables, points per keyword, caps, form
+thresholds and issue messages) live in versioned rule files under
+rulesets/ instead of the validator code, so tuning them no longer means
+editing the scripts. A rule set is compiled into one KeywordMatcher plus
+per-criterion bit masks; the compiled form is written to
+<cache dir>/rulesets/ keyed by the rule file's SHA256, so start-up loads a
+ready automaton instead of rebuilding it. The SHA256 is recorded in every
+report and keys the result cache.
+
+Rule file (JSON; YAML too when PyYAML is installed):
+    {"name": "dod", "version": "1", "form": [check, ...], "content": [criterion, ...]}
+
+Form checks read attributes of the parsed model, in order:
+    {"check": "min", "metric": "non_empty_lines", "min": 20, "points": 10, "issue": ...}
+    {"check": "ratio", "metric": "items_with_test", "of": "checklist_count",
+     "min": 0.5, "points": 10, "issue": ...}      int(points * ratio), skipped when `of` is 0
+    {"check": "sections", "sections": {"需求来源": 5, ...}, "issue": ...}
+
+Content criteria score keyword hits, capped at max:
+    {"name": "risk",
+     "keywords": [...], "per_keyword": 2,        per distinct keyword found
+     "areas": {"功能": [...]}, "per_area": 4,    per area with any keyword found
+     "bonus": "checkbox_count",                  plus a model metric
+     "markers": [...], "marker_points": 5,       plus once if any marker is found
+     "sections": ["风险评估"],                    only hits inside these sections
+     "max": 15, "issue": ...}                    issue when the score is below max
+
+Issues are str.format() templates over the check's fields plus `value`
+(form), `section` (sections) or `score` (content).
+
+Environment:
+    CECELIA_VALIDATION_CACHE=0   Compile in memory, never touch the cache dir
+
+Cache problems never fail a validation - an unreadable artifact is rebuilt.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from pathlib import Path
+
+from .cache import cache_enabled, default_cache_dir
+from .matcher import KeywordMatcher
+
+# Bump when the compiled layout changes - older artifacts are then ignored
+COMPILER_VERSION = 1
+
+RULESETS_DIR = os.path.join(os.path.dirname(__file__), 'rulesets')
+
+FORM_CHECKS = {
+    'min': ('metric', 'min', 'points', 'issue'),
+    'ratio': ('metric', 'of', 'min', 'points', 'issue'),
+    'sections': ('sections', 'issue'),
+}
+
+
+class RuleSetError(ValueError):
+    """Unreadable or invalid rule file"""
+
+
+def _require(condition, message: str):
+    if not condition:
+        raise RuleSetError(message)
+
+
+def _read(path: str) -> bytes:
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        # Bundled in the zipapp - read through the package's zipimporter
+        loader = globals().get('__loader__')
+        if not hasattr(loader, 'get_data'):
+            raise
+        return loader.get_data(path)
+
+
+def parse_rules(raw: bytes, path: str) -> dict:
+    """Decode a rule file (JSON, or YAML when PyYAML is installed)"""
+    try:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                # Imported here - only YAML rule files need it, and only on a cache miss
+                import yaml
+            except ImportError:
+                raise RuleSetError(f"{path}: PyYAML is required for YAML rule files") from None
+            data = yaml.safe_load(raw)
+        else:
+            data = json.loads(raw.decode('utf-8'))
+    except RuleSetError:
+        raise
+    except Exception as e:
+        raise RuleSetError(f"{path}: {e}") from None
+    _require(isinstance(data, dict), f"{path}: rule file must be an object")
+    return data
+
+
+def _check_template(where: str, template, **fields):
+    _require(isinstance(template, str), f"{where}: issue must be a string")
+    try:
+        template.format(**fields)
+    except (KeyError, IndexError, ValueError) as e:
+        raise RuleSetError(f"{where}: bad issue template {template!r} ({e})") from None
+
+
+def compile_ruleset(data: dict, sha256: str) -> dict:
+    """
+    Validate a parsed rule file and compile it
+
+    Returns:
+        Compiled rule set - plain lists/dicts/ints only, so it can be
+        marshalled to disk and loaded without recompiling
+    """
+    name = data.get('name')
+    _require(isinstance(name, str) and name, "rule set needs a name")
+    _require(isinstance(data.get('version'), (str, int)), f"{name}: rule set needs a version")
+    form = data.get('form', [])
+    content = data.get('content', [])
+    _require(isinstance(form, list) and isinstance(content, list),
+             f"{name}: form and content must be lists")
+
+    sections = {}
+    compiled_form = []
+    for i, check in enumerate(form):
+        where = f"{name}: form[{i}]"
+        _require(isinstance(check, dict) and check.get('check') in FORM_CHECKS,
+                 f"{where}: check must be one of {', '.join(FORM_CHECKS)}")
+        missing = [key for key in FORM_CHECKS[check['check']] if key not in check]
+        _require(not missing, f"{where}: missing {', '.join(missing)}")
+        if check['check'] == 'sections':
+            _require(isinstance(check['sections'], dict) and all(
+                isinstance(points, int) for points in check['sections'].values()),
+                f"{where}: sections must map names to points")
+            sections.update(check['sections'])
+            _check_template(where, check['issue'], section='', points=0, **check)
+        else:
+            _check_template(where, check['issue'], value=0, **check)
+        compiled_form.append(dict(check))
+
+    keywords = []
+    for i, criterion in enumerate(content):
+        where = f"{name}: content[{i}]"
+        _require(isinstance(criterion, dict) and isinstance(criterion.get('max'), int),
+                 f"{where}: criterion needs an integer max")
+        for key in ('keywords', 'markers'):
+            _require(isinstance(criterion.get(key, []), list), f"{where}: {key} must be a list")
+        areas = criterion.get('areas', {})
+        _require(isinstance(areas, dict) and all(isinstance(v, list) for v in areas.values()),
+                 f"{where}: areas must map names to keyword lists")
+        unknown = [s for s in criterion.get('sections', []) if s not in sections]
+        _require(not unknown, f"{where}: sections not in the required sections: {', '.join(unknown)}")
+        _check_template(where, criterion.get('issue'), score=0, **criterion)
+        table = criterion.get('keywords', []) + criterion.get('markers', [])
+        for area in areas.values():
+            table += area
+        _require(all(isinstance(kw, str) and kw for kw in table),
+                 f"{where}: keywords must be non-empty strings")
+        keywords += table
+
+    # One automaton for every criterion - a document is scanned once
+    matcher = KeywordMatcher(keywords)
+    compiled_content = []
+    for criterion in content:
+        compiled_content.append({
+            'name': criterion.get('name', ''),
+            'keyword_mask': matcher.mask(criterion.get('keywords', [])),
+            'per_keyword': criterion.get('per_keyword', 0),
+            'area_masks': [matcher.mask(area) for area in criterion.get('areas', {}).values()],
+            'per_area': criterion.get('per_area', 0),
+            'bonus': criterion.get('bonus', ''),
+            'marker_mask': matcher.mask(criterion.get('markers', [])),
+            'marker_points': criterion.get('marker_points', 0),
+            'sections': list(criterion.get('sections', [])),
+            'max': criterion['max'],
+            'issue': criterion['issue'],
+        })
+
+    return {
+        'compiler': COMPILER_VERSION,
+        'sha256': sha256,
+        'name': name,
+        'version': str(data['version']),
+        'sections': sections,
+        'form': compiled_form,
+        'content': compiled_content,
+        'matcher': list(matcher.tables()),
+    }
+
+
+class RuleSet:
+    """A compiled rule set: the content matcher plus form/content score tables"""
+
+    def __init__(self, compiled: dict):
+        self.name = compiled['name']
+        self.version = compiled['version']
+        self.sha256 = compiled['sha256']
+        self.matcher = KeywordMatcher.from_tables(*compiled['matcher'])
+        # Required section -> points (resolved by the PRD index)
+        self.sections = compiled['sections']
+        self.form = compiled['form']
+        self.content = compiled['content']
+        # Sections whose own keyword hits a criterion reads
+        self.scan_sections = list(dict.fromkeys(
+            section for criterion in self.content for section in criterion['sections']))
+
+    def score_form(self, model):
+        """Score the form checks against a parsed model - (score, issues)"""
+        score = 0
+        issues = []
+        for check in self.form:
+            kind = check['check']
+            if kind == 'sections':
+                for section, points in check['sections'].items():
+                    if model.has(section):
+                        score += points
+                    else:
+                        issues.append(check['issue'].format(section=section, points=points))
+                continue
+
+            value = getattr(model, check['metric'])
+            if kind == 'ratio':
+                total = getattr(model, check['of'])
+                if not total:
+                    continue
+                value = value / total
+            if value >= check['min']:
+                score += int(check['points'] * value) if kind == 'ratio' else check['points']
+            else:
+                issues.append(check['issue'].format(value=value, **check))
+        return score, issues
+
+    def score_content(self, model):
+        """Score the content criteria from a model's keyword hits - (score, issues)"""
+        score = 0
+        issues = []
+        for criterion in self.content:
+            hits = model.keyword_mask
+            if criterion['sections']:
+                hits = 0
+                for section in criterion['sections']:
+                    hits |= model.section_masks[section]
+
+            points = criterion['per_keyword'] * bin(hits & criterion['keyword_mask']).count('1')
+            if criterion['area_masks']:
+                points += criterion['per_area'] * sum(1 for mask in criterion['area_masks'] if hits & mask)
+            if criterion['bonus']:
+                points += getattr(model, criterion['bonus'])
+            if hits & criterion['marker_mask']:
+                points += criterion['marker_points']
+
+            points = min(criterion['max'], points)
+            score += points
+            if points < criterion['max']:
+                issues.append(criterion['issue'].format(score=points, max=criterion['max']))
+        return score, issues
+
+
+def compiled_path(cache_dir: Path, name: str, sha256: str) -> Path:
+    """On-disk location of a compiled rule set (marshal is Python-version specific)"""
+    tag = sys.implementation.cache_tag or 'py'
+    return cache_dir / 'rulesets' / f"{name}-{sha256[:16]}.{tag}-c{COMPILER_VERSION}.marshal"
+
+
+def _load_compiled(path: Path, sha256: str):
+    try:
+        # loads() of the whole file - load() reads a file object in tiny chunks
+        with open(path, 'rb') as f:
+            compiled = marshal.loads(f.read())
+        if isinstance(compiled, dict) and compiled.get('sha256') == sha256 \
+                and compiled.get('compiler') == COMPILER_VERSION:
+            return RuleSet(compiled)
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+
+def _store_compiled(path: Path, compiled: dict):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as f:
+            f.write(marshal.dumps(compiled))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_ruleset(name_or_path: str, cache_dir=None) -> RuleSet:
+    """
+    Load a rule set, compiling it only when no cached artifact matches
+
+    Args:
+        name_or_path: Bundled rule set name ('dod', 'prd') or a rule file path
+        cache_dir: Override the cache directory
+
+    Raises:
+        RuleSetError: The rule file is missing or invalid
+    """
+    if os.sep in name_or_path or name_or_path.endswith(('.json', '.yaml', '.yml')):
+        path = name_or_path
+    else:
+        path = os.path.join(RULESETS_DIR, f"{name_or_path}.json")
+    try:
+        raw = _read(path)
+    except OSError as e:
+        raise RuleSetError(f"cannot read rule file {path}: {e}") from None
+    sha256 = hashlib.sha256(raw).hexdigest()
+    stem = os.path.basename(path).split('.', 1)[0]
+
+    artifact = None
+    if cache_enabled():
+        artifact = compiled_path(Path(cache_dir) if cache_dir else default_cache_dir(), stem, sha256)
+        rules = _load_compiled(artifact, sha256)
+        if rules is not None:
+            return rules
+
+    compiled = compile_ruleset(parse_rules(raw, path), sha256)
+    if artifact is not None:
+        _store_compiled(artifact, compiled)
+    return RuleSet(compiled)
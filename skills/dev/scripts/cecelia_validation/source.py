@@ -0,0 +1,52 @@
+"""
+Streaming access to validated documents
+
+The Markdown validators never hold a document in memory: the content hash
+is computed from the raw bytes in fixed-size chunks (byte-identical to
+`sha256sum`, which the anti-cheat layer compares against), and parsing
+iterates lines lazily through the text layer's buffer.
+
+iter_lines() yields exactly what `path.read_text().split('\\n')` would -
+universal newlines included - so parsers see the same lines either way.
+"""
+
+import hashlib
+from contextlib import contextmanager
+from functools import partial
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path) -> str:
+    """SHA256 of a file's raw bytes, read in chunks"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(partial(f.read, CHUNK_SIZE), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def iter_lines(fp):
+    """Lines of a text file object without their '\\n', like fp.read().split('\\n')"""
+    line = ''
+    for line in fp:
+        yield line[:-1] if line.endswith('\n') else line
+    # split() also yields the (empty) text after a final newline
+    if not line or line.endswith('\n'):
+        yield ''
+
+
+def decode_text(data: bytes, encoding: str = 'utf-8') -> str:
+    """Text of raw bytes exactly as open(path, encoding=...).read() returns it"""
+    text = data.decode(encoding)
+    # Universal newlines, like text-mode reads
+    return text.replace('\r\n', '\n').replace('\r', '\n') if '\r' in text else text
+
+
+@contextmanager
+def open_lines(path, encoding: str = 'utf-8'):
+    """Open a document and iterate its lines lazily (universal newlines)"""
+    with open(path, encoding=encoding) as f:
+        yield iter_lines(f)
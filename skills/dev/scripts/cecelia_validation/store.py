@@ -0,0 +1,441 @@
+"""
+Local SQLite report store
+
+Every report file is overwritten by the next run; with the store enabled
+each report is also recorded - file, content hash, validator and rule-set
+version (plus the rule file's SHA256 for DoD/PRD), scores, issues and
+timings - in one SQLite database shared by all worktrees, so history can
+be queried instead of crawled.
+
+Enabled by:
+    CECELIA_VALIDATION_STORE=1          <cache dir>/reports.sqlite3
+    CECELIA_VALIDATION_STORE=<path>     an explicit database
+
+Queries (python3 -m cecelia_validation reports ...):
+    lowest --since 7d       lowest scores in a time window
+    issues --since 7d       most common issues (numbers normalized away)
+    file <path>             score history of one file
+    hash <sha256>           runs of one content hash
+    stats                   row counts per validator
+    import <report.json>... record existing report files
+
+The database runs in WAL mode (readers never block the validator) and a
+run's reports are written in one transaction. Issue counts are kept in a
+per-day rollup table (as are report counts for `stats`), so "most
+common issue this week" reads a few hundred rows however many reports are
+stored; windows are rounded to whole UTC days for those two queries.
+
+Store problems never fail a validation - they only warn.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from .cache import default_cache_dir
+
+SCHEMA_VERSION = 2
+
+# ruleset_version is the validator's rule-set version for every validator;
+# DoD/PRD also record the rule file's SHA256 (OKR has no rule file)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    validator TEXT NOT NULL,
+    file TEXT,
+    content_hash TEXT,
+    git_blob TEXT,
+    validation_version TEXT,
+    ruleset_version TEXT,
+    ruleset_sha256 TEXT,
+    total_score NUMERIC,
+    form_score NUMERIC,
+    content_score NUMERIC,
+    passing INTEGER,
+    error TEXT,
+    recorded_at REAL NOT NULL,
+    cwd TEXT,
+    timings TEXT,
+    report TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_file ON reports (file, recorded_at);
+CREATE INDEX IF NOT EXISTS reports_hash ON reports (content_hash);
+CREATE INDEX IF NOT EXISTS reports_time ON reports (recorded_at);
+CREATE INDEX IF NOT EXISTS reports_score ON reports (total_score, recorded_at DESC);
+CREATE INDEX IF NOT EXISTS reports_validator_score ON reports (validator, total_score, recorded_at DESC);
+CREATE TABLE IF NOT EXISTS report_days (
+    day INTEGER NOT NULL,
+    validator TEXT NOT NULL,
+    reports INTEGER NOT NULL,
+    passing INTEGER NOT NULL,
+    score_sum REAL NOT NULL,
+    PRIMARY KEY (day, validator)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY,
+    pattern TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS report_issues (
+    report_id INTEGER NOT NULL,
+    issue_id INTEGER NOT NULL,
+    PRIMARY KEY (report_id, issue_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS report_issues_issue ON report_issues (issue_id);
+CREATE TABLE IF NOT EXISTS issue_days (
+    day INTEGER NOT NULL,
+    validator TEXT NOT NULL,
+    issue_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, validator, issue_id)
+) WITHOUT ROWID;
+"""
+
+# Numbers and quoted names vary per document; the issue behind them does not
+_NUMBER = re.compile(r'\d+(?:\.\d+)?%?')
+_QUOTED = re.compile(r'"[^"]*"|\'[^\']*\'')
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+# A time window with fewer reports than this is sorted directly; a larger
+# one is answered by walking the score index
+SMALL_WINDOW = 20000
+
+
+def store_path():
+    """Database path from CECELIA_VALIDATION_STORE, or None when disabled"""
+    value = os.environ.get('CECELIA_VALIDATION_STORE', '').strip()
+    if value.lower() in ('', '0', 'false', 'off', 'no'):
+        return None
+    if value.lower() in ('1', 'true', 'on', 'yes'):
+        return default_store_path()
+    return Path(value)
+
+
+def default_store_path() -> Path:
+    return default_cache_dir() / 'reports.sqlite3'
+
+
+def issue_pattern(issue: str) -> str:
+    """'Too few checklist items: 3 (need ≥5)' -> 'Too few checklist items: N (need ≥N)'"""
+    return _NUMBER.sub('N', _QUOTED.sub('"…"', issue))
+
+
+def parse_since(value: str) -> float:
+    """'7d' / '12h' / '30m' / '2w' -> seconds"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*', value or '')
+    if not match:
+        raise ValueError(f"invalid duration: {value!r} (e.g. 7d, 12h, 2w)")
+    return float(match.group(1)) * _UNITS[match.group(2) or 's']
+
+
+def report_issues(report: dict) -> list:
+    """Issue strings of a DoD/PRD (form + content) or OKR report"""
+    issues = list(report.get('form_issues') or []) + list(report.get('content_issues') or [])
+    issues += list(report.get('issues') or [])
+    return [i for i in issues if isinstance(i, str)]
+
+
+class ReportStore:
+    """SQLite database of validation reports (WAL, batched writes)"""
+
+    def __init__(self, path=None):
+        # Imported here - validators only load sqlite3 when the store is enabled
+        import sqlite3
+
+        self.path = Path(path) if path else default_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path), timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        schema_version = self.db.execute('PRAGMA user_version').fetchone()[0]
+        if schema_version != SCHEMA_VERSION:
+            with self.db:
+                if schema_version == 1:
+                    self._migrate_v1()
+                self.db.executescript(SCHEMA)
+                self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._issue_ids = {}
+
+    def _migrate_v1(self):
+        """v1 stored the rule file's SHA256 as ruleset_version for DoD/PRD - split it out"""
+        self.db.execute('ALTER TABLE reports ADD COLUMN ruleset_sha256 TEXT')
+        self.db.execute("UPDATE reports SET ruleset_sha256 = ruleset_version, "
+                        "ruleset_version = json_extract(report, '$.ruleset_version') "
+                        "WHERE validator IN ('dod', 'prd')")
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _issue_id(self, pattern: str) -> int:
+        issue_id = self._issue_ids.get(pattern)
+        if issue_id is None:
+            self.db.execute('INSERT OR IGNORE INTO issues (pattern) VALUES (?)', (pattern,))
+            issue_id = self.db.execute('SELECT id FROM issues WHERE pattern = ?', (pattern,)).fetchone()[0]
+            self._issue_ids[pattern] = issue_id
+        return issue_id
+
+    def record(self, validator: str, entries, version: str = None, ruleset_version: str = None,
+               ruleset_sha256: str = None, recorded_at: float = None) -> int:
+        """
+        Record reports in one transaction
+
+        Args:
+            validator: 'dod' / 'prd' / 'okr'
+            entries: (file, report) pairs
+            version: Validator version (default: the report's validation_version)
+            ruleset_version: Rule-set version (default: the report's ruleset_version)
+            ruleset_sha256: Rule file SHA256 (default: the report's ruleset_sha256)
+            recorded_at: Unix time (default: now)
+
+        Returns:
+            Number of reports recorded
+        """
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        day = int(recorded_at // 86400)
+        cwd = os.getcwd()
+        days = {}  # validator -> [reports, passing, score sum]
+        count = 0
+        with self.db:
+            for file, report in entries:
+                cursor = self.db.execute(
+                    'INSERT INTO reports (validator, file, content_hash, git_blob, validation_version, '
+                    'ruleset_version, ruleset_sha256, total_score, form_score, content_score, passing, error, '
+                    'recorded_at, cwd, timings, report) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (validator,
+                     os.path.abspath(file) if file else None,
+                     report.get('content_sha256') or report.get('content_hash'),
+                     report.get('git_blob'),
+                     version or report.get('validation_version'),
+                     ruleset_version or report.get('ruleset_version'),
+                     ruleset_sha256 or report.get('ruleset_sha256'),
+                     report.get('total_score', report.get('total')),
+                     report.get('form_score'),
+                     report.get('content_score'),
+                     int(bool(report.get('passing', report.get('passed', False)))),
+                     report.get('error'),
+                     recorded_at,
+                     cwd,
+                     json.dumps(report['timings']) if report.get('timings') else None,
+                     json.dumps(report, ensure_ascii=False)))
+                issue_ids = {self._issue_id(issue_pattern(issue)) for issue in report_issues(report)}
+                self.db.executemany('INSERT INTO report_issues (report_id, issue_id) VALUES (?, ?)',
+                                    [(cursor.lastrowid, issue_id) for issue_id in issue_ids])
+                self.db.executemany(
+                    'INSERT INTO issue_days (day, validator, issue_id, count) VALUES (?, ?, ?, 1) '
+                    'ON CONFLICT (day, validator, issue_id) DO UPDATE SET count = count + 1',
+                    [(day, validator, issue_id) for issue_id in issue_ids])
+                totals = days.setdefault(validator, [0, 0, 0.0])
+                totals[0] += 1
+                totals[1] += int(bool(report.get('passing', report.get('passed', False))))
+                totals[2] += report.get('total_score', report.get('total')) or 0
+                count += 1
+            self.db.executemany(
+                'INSERT INTO report_days (day, validator, reports, passing, score_sum) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (day, validator) DO UPDATE SET reports = reports + excluded.reports, '
+                'passing = passing + excluded.passing, score_sum = score_sum + excluded.score_sum',
+                [(day, v, n, p, total) for v, (n, p, total) in days.items()])
+        return count
+
+    def lowest(self, since: float = None, validator: str = None, limit: int = 10) -> list:
+        """Lowest-scoring reports recorded in the last `since` seconds"""
+        clauses, params = [], []
+        index = 'reports_validator_score' if validator else 'reports_score'
+        if since is not None:
+            start = time.time() - since
+            clauses.append('recorded_at >= ?')
+            params.append(start)
+            # Few reports in the window: read them by time and sort; many: walk
+            # the score index until `limit` of them fall inside the window
+            probe = self.db.execute('SELECT COUNT(*) FROM (SELECT 1 FROM reports INDEXED BY reports_time '
+                                    'WHERE recorded_at >= ? LIMIT ?)', (start, SMALL_WINDOW)).fetchone()[0]
+            if probe < SMALL_WINDOW:
+                index = 'reports_time'
+        if validator:
+            clauses.append('validator = ?')
+            params.append(validator)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self._rows(f'SELECT recorded_at, validator, total_score, passing, file, content_hash '
+                          f'FROM reports INDEXED BY {index} {where} '
+                          f'ORDER BY total_score, recorded_at DESC LIMIT ?', params + [limit])
+
+    def common_issues(self, since: float = None, validator: str = None, limit: int = 10) -> list:
+        """Most frequent issue patterns (reports affected) in the last `since` seconds"""
+        clauses, params = [], []
+        if since is not None:
+            clauses.append('day >= ?')
+            params.append(int((time.time() - since) // 86400))
+        if validator:
+            clauses.append('validator = ?')
+            params.append(validator)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self._rows(f'SELECT SUM(count) AS reports, pattern FROM issue_days '
+                          f'JOIN issues ON issues.id = issue_id {where} '
+                          f'GROUP BY issue_id ORDER BY reports DESC, pattern LIMIT ?', params + [limit])
+
+    def file_history(self, file: str, limit: int = 20) -> list:
+        """Most recent reports of one file"""
+        return self._rows('SELECT recorded_at, validator, total_score, passing, content_hash '
+                          'FROM reports WHERE file = ? ORDER BY recorded_at DESC LIMIT ?',
+                          [os.path.abspath(file), limit])
+
+    def by_hash(self, content_hash: str, limit: int = 20) -> list:
+        """Reports of one content hash (any file)"""
+        return self._rows('SELECT recorded_at, validator, total_score, passing, file '
+                          'FROM reports WHERE content_hash = ? ORDER BY recorded_at DESC LIMIT ?',
+                          [content_hash, limit])
+
+    def stats(self) -> list:
+        """Reports, passing count, mean score and first/last UTC day per validator"""
+        return self._rows('SELECT validator, SUM(reports) AS reports, SUM(passing) AS passing, '
+                          'ROUND(SUM(score_sum) / SUM(reports), 1) AS mean_score, '
+                          'MIN(day) AS first_day, MAX(day) AS last_day '
+                          'FROM report_days GROUP BY validator ORDER BY validator', [])
+
+    def _rows(self, sql: str, params: list) -> list:
+        cursor = self.db.execute(sql, params)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+
+def record_reports(validator: str, entries, version: str = None, ruleset_version: str = None,
+                   ruleset_sha256: str = None):
+    """Record a run's (file, report) pairs when the store is enabled (problems only warn)"""
+    path = store_path()
+    if path is None:
+        return
+    # Imported here - sqlite3.Error is only needed once the store is enabled
+    import sqlite3
+
+    try:
+        with ReportStore(path) as store:
+            store.record(validator, [(f, r) for f, r in entries if 'error' not in r], version,
+                         ruleset_version, ruleset_sha256)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: cannot record reports in {path}: {e}", file=sys.stderr)
+
+
+def _guess_validator(report: dict):
+    if 'dod_file' in report:
+        return 'dod', report['dod_file']
+    if 'prd_file' in report:
+        return 'prd', report['prd_file']
+    if 'content_hash' in report and 'passed' in report:
+        return 'okr', None
+    return None, None
+
+
+def _format_cell(name: str, value) -> str:
+    if value is None:
+        return '-'
+    if name == 'recorded_at':
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(value))
+    if name.endswith('_day'):
+        return time.strftime('%Y-%m-%d', time.gmtime(value * 86400))
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def print_rows(rows: list, as_json: bool = False, out=None):
+    """Rows as NDJSON or a tab-separated table with a header"""
+    out = out or sys.stdout
+    if as_json:
+        for row in rows:
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+        return
+    if not rows:
+        return
+    out.write('\t'.join(rows[0]) + '\n')
+    for row in rows:
+        out.write('\t'.join(_format_cell(k, v) for k, v in row.items()) + '\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='cecelia-validate reports',
+                                     description='Query the SQLite report store')
+    parser.add_argument('--db', help='Database (default: $CECELIA_VALIDATION_STORE or '
+                                     '<cache dir>/reports.sqlite3)')
+    parser.add_argument('--json', action='store_true', help='One JSON object per row')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in (('lowest', 'Lowest scores'), ('issues', 'Most common issues')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--since', help='Time window, e.g. 7d, 12h (default: all time)')
+        command.add_argument('--validator', choices=['dod', 'prd', 'okr'])
+        command.add_argument('--limit', type=int, default=10)
+    command = commands.add_parser('file', help='Score history of one file')
+    command.add_argument('path')
+    command.add_argument('--limit', type=int, default=20)
+    command = commands.add_parser('hash', help='Runs of one content hash')
+    command.add_argument('content_hash')
+    command.add_argument('--limit', type=int, default=20)
+    commands.add_parser('stats', help='Reports per validator')
+    command = commands.add_parser('import', help='Record existing report files')
+    command.add_argument('reports', nargs='+')
+    args = parser.parse_args(argv)
+
+    # Imported here - sqlite3.Error is only needed by the query tool
+    import sqlite3
+
+    path = Path(args.db) if args.db else (store_path() or default_store_path())
+    if args.command != 'import' and not path.exists():
+        print(f"Error: no report store at {path} (set CECELIA_VALIDATION_STORE)", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        with ReportStore(path) as store:
+            if args.command == 'import':
+                sys.exit(_import(store, args.reports))
+            try:
+                since = parse_since(args.since) if getattr(args, 'since', None) else None
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(2)
+            if args.command == 'lowest':
+                rows = store.lowest(since, args.validator, args.limit)
+            elif args.command == 'issues':
+                rows = store.common_issues(since, args.validator, args.limit)
+            elif args.command == 'file':
+                rows = store.file_history(args.path, args.limit)
+            elif args.command == 'hash':
+                rows = store.by_hash(args.content_hash, args.limit)
+            else:
+                rows = store.stats()
+    except sqlite3.Error as e:
+        print(f"Error: {path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print_rows(rows, args.json)
+    sys.exit(0)
+
+
+def _import(store: ReportStore, paths) -> int:
+    """Record report files (recorded_at = file mtime); returns the exit code"""
+    status = 0
+    for report_path in paths:
+        try:
+            with open(report_path, encoding='utf-8') as f:
+                report = json.load(f)
+            mtime = os.path.getmtime(report_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: skipping {report_path}: {e}", file=sys.stderr)
+            status = 2
+            continue
+        validator, file = _guess_validator(report) if isinstance(report, dict) else (None, None)
+        if validator is None:
+            print(f"Warning: skipping {report_path}: not a validation report", file=sys.stderr)
+            status = 2
+            continue
+        if file and not os.path.isabs(file):
+            file = os.path.join(os.path.dirname(os.path.abspath(report_path)), file)
+        store.record(validator, [(file, report)], recorded_at=mtime)
+    return status
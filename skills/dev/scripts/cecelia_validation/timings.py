@@ -0,0 +1,116 @@
+"""
+Opt-in per-phase timing of a validation run
+
+    with recording(Timings()) as timings:
+        with phase('hash'):
+            ...
+
+phase() records wall and CPU time into the Timings being recorded in the
+current context, and costs one context-variable lookup when nothing is
+being recorded - validators mark their phases unconditionally. Phases may
+nest (check_capability_exists runs inside validate_form); each phase's
+totals include its nested phases.
+
+Enabled by a validator's --timings flag or:
+    CECELIA_VALIDATION_TIMINGS=1
+
+The numbers go into the report's `timings` block (see write_report) and
+are added to a Prometheus textfile (see cecelia_validation.prometheus).
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+_current = ContextVar('cecelia_validation_timings', default=None)
+
+
+def timings_enabled(flag: bool = False) -> bool:
+    """--timings given, or CECELIA_VALIDATION_TIMINGS is 1/true/on"""
+    return flag or os.environ.get('CECELIA_VALIDATION_TIMINGS', '0').lower() in ('1', 'true', 'on', 'yes')
+
+
+class Timings:
+    """Wall/CPU seconds and call counts per phase, in first-seen order"""
+
+    def __init__(self):
+        self.phases = {}  # name -> [wall, cpu, calls]
+        self._start = (time.perf_counter(), time.process_time())
+
+    @contextmanager
+    def phase(self, name: str):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(name, [0.0, 0.0, 0])
+            totals[0] += time.perf_counter() - wall
+            totals[1] += time.process_time() - cpu
+            totals[2] += 1
+
+    def to_dict(self) -> dict:
+        """Report block: per-phase milliseconds plus the run total so far"""
+        wall, cpu = self._start
+        return {
+            'phases': {
+                name: {'wall_ms': round(w * 1000, 3), 'cpu_ms': round(c * 1000, 3), 'calls': n}
+                for name, (w, c, n) in self.phases.items()
+            },
+            'total_wall_ms': round((time.perf_counter() - wall) * 1000, 3),
+            'total_cpu_ms': round((time.process_time() - cpu) * 1000, 3)
+        }
+
+    def summary(self) -> str:
+        """One line for the console: 'hash 1.2ms, parse 30.0ms, ...'"""
+        return ', '.join(f"{name} {w * 1000:.1f}ms" for name, (w, _, _) in self.phases.items())
+
+
+@contextmanager
+def recording(timings):
+    """Make timings (or None) the target of phase() within the block"""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def phase(name: str):
+    """Time a phase into the Timings being recorded (no-op otherwise)"""
+    timings = _current.get()
+    return timings.phase(name) if timings is not None else nullcontext()
+
+
+def write_report(path, report: dict, timings=None, **dump_kwargs):
+    """
+    Write a JSON report, recording the write itself as 'write_report'
+
+    With timings, the report gets a `timings` block; the file is written
+    once more so the block includes the first write's cost.
+    """
+    def dump():
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, **dump_kwargs)
+
+    if timings is None:
+        dump()
+        return
+    report['timings'] = timings.to_dict()
+    with timings.phase('write_report'):
+        dump()
+    report['timings'] = timings.to_dict()
+    dump()
+
+
+def export_timings(validator: str, passed: bool, timings):
+    """Add the run to the Prometheus textfile (problems only warn)"""
+    # Imported here - only timed runs write the textfile
+    from .prometheus import export_run
+
+    try:
+        export_run(validator, 'pass' if passed else 'fail', timings)
+    except OSError as e:
+        print(f"Warning: cannot write timings textfile: {e}", file=sys.stderr)
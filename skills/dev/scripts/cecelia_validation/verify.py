@@ -0,0 +1,171 @@
+"""
+11-layer anti-cheat verification of a DoD/PRD validation report
+
+Replaces the ls/head/grep/jq/sha256sum pipeline of anti-cheat-dod.sh and
+anti-cheat-prd.sh: the document and the report are each read once, the
+document is hashed once (raw bytes, same as sha256sum), and layers 1-10
+print the same messages the shell version did. Layer 11 checks the report
+was scored with the bundled rule set (rulesets/*.json live outside the
+scripts, so the report records their sha256).
+
+Exit codes:
+    0 - All checks pass
+    2 - Any check fails (blocks workflow, maintains Stop Hook loop)
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+
+PASS_SCORE = 90
+
+
+class VerifyFailed(Exception):
+    """A layer failed - args are the lines to print on stderr"""
+
+
+def _fail(*lines):
+    raise VerifyFailed(*lines)
+
+
+def _jq_raw(report, key: str) -> str:
+    """Mimic jq -r '.key // "null"' (null and false fall back)"""
+    value = report.get(key) if isinstance(report, dict) else None
+    if value is None or value is False:
+        return 'null'
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def resolve(pattern: str) -> str:
+    """First match of a file pattern (like `ls $pattern | head -1`), '' if none"""
+    matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else \
+        ([pattern] if os.path.exists(pattern) else [])
+    return matches[0] if matches else ''
+
+
+def _layers(kind: str, path: str, report_file: str, script: str, ruleset_sha256: str):
+    """Run layers 1-11, yielding each layer's PASS detail (raises VerifyFailed)"""
+    print(f"Layer 1: {kind} file exists")
+    if not os.path.isfile(path):
+        _fail(f"❌ FAIL: {path} not found")
+    with open(path, 'rb') as f:
+        data = f.read()
+    yield ''
+
+    print(f"Layer 2: {kind} not empty")
+    if not data:
+        _fail(f"❌ FAIL: {path} is empty")
+    yield ''
+
+    print("Layer 3: Has frontmatter")
+    if data.split(b'\n', 1)[0] != b'---':
+        _fail("❌ FAIL: Missing YAML frontmatter")
+    yield ''
+
+    print("Layer 4: Validation report exists")
+    if not os.path.isfile(report_file):
+        _fail(f"❌ FAIL: {report_file} not found",
+              f"   Run: python {script} \"{path}\"")
+    with open(report_file, 'rb') as f:
+        raw_report = f.read()
+    yield ''
+
+    print("Layer 5: Report not empty")
+    if not raw_report:
+        _fail(f"❌ FAIL: {report_file} is empty")
+    yield ''
+
+    print("Layer 6: Report valid JSON")
+    try:
+        report = json.loads(raw_report)
+    except ValueError:
+        _fail(f"❌ FAIL: {report_file} is not valid JSON")
+    yield ''
+
+    print("Layer 7: Report has score fields")
+    form_score = _jq_raw(report, 'form_score')
+    content_score = _jq_raw(report, 'content_score')
+    total_score = _jq_raw(report, 'total_score')
+    if 'null' in (form_score, content_score, total_score):
+        _fail("❌ FAIL: Missing score fields in report",
+              f"   form_score: {form_score}",
+              f"   content_score: {content_score}",
+              f"   total_score: {total_score}")
+    yield f" (form: {form_score}, content: {content_score}, total: {total_score})"
+
+    print("Layer 8: SHA256 hash match")
+    report_sha = _jq_raw(report, 'content_sha256')
+    actual_sha = hashlib.sha256(data).hexdigest()
+    if report_sha != actual_sha:
+        _fail("❌ FAIL: SHA256 mismatch (content modified after validation)",
+              f"   Report SHA: {report_sha}",
+              f"   Actual SHA: {actual_sha}",
+              f"   Re-run: python {script} \"{path}\"")
+    yield ''
+
+    print(f"Layer 9: Total score >= {PASS_SCORE}")
+    try:
+        passing = int(total_score) >= PASS_SCORE
+    except ValueError:
+        passing = False
+    if not passing:
+        _fail(f"❌ FAIL: Score {total_score} < {PASS_SCORE}",
+              "   Read validation report for issues to fix")
+    yield ''
+
+    print("Layer 10: No bypass environment variables")
+    if os.environ.get('SKIP_VALIDATION', 'false') == 'true':
+        _fail("❌ FAIL: SKIP_VALIDATION=true detected (bypass not allowed)")
+    yield ''
+
+    print("Layer 11: Rule set matches the bundled rules")
+    report_rules = _jq_raw(report, 'ruleset_sha256')
+    if report_rules != ruleset_sha256:
+        _fail("❌ FAIL: Rule set mismatch (report not scored with the bundled rules)",
+              f"   Report rule set:  {report_rules}",
+              f"   Bundled rule set: {ruleset_sha256}",
+              f"   Re-run: python {script} \"{path}\"")
+    yield ''
+
+
+def verify(kind: str, pattern: str, default_pattern: str, report_file: str, script: str,
+           ruleset_sha256: str) -> int:
+    """
+    Run the 11-layer verification and print its progress
+
+    Args:
+        kind: 'DoD' or 'PRD' (used in messages)
+        pattern: Document path or glob (first match is verified)
+        default_pattern: Pattern named in the "not found" message
+        report_file: Validation report written by the validator
+        script: Validator path suggested in re-run hints
+        ruleset_sha256: sha256 of the bundled rule file the report must name
+
+    Returns:
+        Exit code (0 pass, 2 fail)
+    """
+    path = resolve(pattern)
+    if not path:
+        print(f"❌ Layer 1 FAIL: {kind} file not found (pattern: {default_pattern})", file=sys.stderr)
+        return 2
+
+    print(f"🔒 {kind} Anti-Cheat: 11-layer verification")
+    print("")
+
+    try:
+        for detail in _layers(kind, path, report_file, script, ruleset_sha256):
+            print(f"✅ PASS{detail}")
+    except VerifyFailed as e:
+        # Keep stdout/stderr interleaving identical to the shell version
+        sys.stdout.flush()
+        for line in e.args:
+            print(line, file=sys.stderr)
+        return 2
+
+    print("")
+    print(f"🎉 All 11 layers passed - {kind} quality verified")
+    return 0
@@ -0,0 +1,318 @@
+"""
+--watch: keep a validator warm and rescore documents as they are saved
+
+validate-dod.py / validate-prd.py --watch TARGET score TARGET once and keep
+running. Changes are picked up with inotify (Linux, through libc - no extra
+dependency) or, where that is unavailable or with --poll, by polling each
+file's mtime/size/inode. A burst of writes (editors truncate, write and
+rename) is collapsed: rescoring waits until the watched files have been
+quiet for the debounce window. Only files that changed are rescored,
+in-process and through the result cache, and a report is only rewritten
+when the content hash changed - atomically, so a reader (the Stop Hook)
+never sees a half-written report.
+
+TARGET is a file (reported to the validator's usual report file), or a
+directory / glob (one report per file in --report-dir, as in --batch).
+Files matching a directory or glob target are picked up as they appear.
+"""
+
+import glob
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from .batch import discover_files, report_name
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct('iIII')  # wd, mask, cookie, len - then len bytes of name
+
+# Returned by a watcher when events were lost - rescore everything
+OVERFLOW = object()
+
+DEFAULT_DEBOUNCE = 0.15
+DEFAULT_POLL_INTERVAL = 0.5
+# A burst that never goes quiet is still rescored after this many windows
+MAX_DEBOUNCE_WINDOWS = 10
+
+
+class WatchTarget:
+    """A watched file, directory (recursive) or glob"""
+
+    def __init__(self, target: str, pattern: str):
+        self.target = target
+        self.pattern = pattern
+        if os.path.isfile(target):
+            self.mode = 'file'
+        elif os.path.isdir(target):
+            self.mode = 'dir'
+        else:
+            self.mode = 'glob'
+
+    def files(self) -> list:
+        """Files currently matching the target"""
+        if self.mode == 'file':
+            return [self.target] if os.path.isfile(self.target) else []
+        return discover_files(self.target, self.pattern)
+
+    def dirs(self) -> list:
+        """Directories whose entries can change the matching files"""
+        if self.mode == 'file':
+            return [os.path.dirname(self.target) or '.']
+        if self.mode == 'dir':
+            base, recursive = self.target, True
+        else:
+            # Fixed prefix of the glob; walk below it if a directory part is a pattern
+            parts = self.target.split(os.sep)
+            fixed = 0
+            while fixed < len(parts) - 1 and not glob.has_magic(parts[fixed]):
+                fixed += 1
+            base = os.sep.join(parts[:fixed]) or ('/' if self.target.startswith(os.sep) else '.')
+            recursive = fixed < len(parts) - 1
+            if not os.path.isdir(base):
+                return []
+        if not recursive:
+            return [base]
+        found = []
+        for root, subdirs, _ in os.walk(base):
+            subdirs[:] = [d for d in subdirs if d != '.git']
+            found.append(root)
+        return found
+
+
+class InotifyWatcher:
+    """Directory watches through inotify(7), called through libc with ctypes"""
+
+    name = 'inotify'
+
+    def __init__(self):
+        # Imported here - only watch mode needs ctypes
+        import ctypes
+
+        self._ctypes = ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}  # watch descriptor -> directory
+
+    def add(self, directory: str):
+        if directory in self.dirs.values():
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = self._ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch {directory}: {os.strerror(errno)}")
+        self.dirs[wd] = directory
+
+    def read(self, timeout=None) -> set:
+        """Paths changed within timeout seconds (None: wait for the first change)"""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + EVENT.size <= len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b'\0')
+            offset += EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.add(OVERFLOW)
+            elif mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+            elif wd in self.dirs and name:
+                changed.add(os.path.join(self.dirs[wd], os.fsdecode(name)))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollWatcher:
+    """Fallback: compare (mtime, size, inode) of the target's files every interval"""
+
+    name = 'polling'
+
+    def __init__(self, target: WatchTarget, interval: float = DEFAULT_POLL_INTERVAL):
+        self.target = target
+        self.interval = interval
+        self.stats = self._snapshot()
+
+    def _snapshot(self) -> dict:
+        stats = {}
+        for path in self.target.files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return stats
+
+    def add(self, directory: str):
+        pass
+
+    def read(self, timeout=None) -> set:
+        """Paths changed within timeout seconds (None: wait for the first change)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._snapshot()
+            changed = {path for path in snapshot.keys() | self.stats.keys()
+                       if snapshot.get(path) != self.stats.get(path)}
+            self.stats = snapshot
+            if changed:
+                return changed
+            wait = self.interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return set()
+            time.sleep(wait)
+
+    def close(self):
+        pass
+
+
+def write_json_atomic(path, data: dict):
+    """Write JSON to a temp file next to path, then rename it over path"""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _print_result(path: str, report: dict, elapsed: float):
+    stamp = datetime.now().strftime('%H:%M:%S')
+    if 'error' in report:
+        print(f"[{stamp}] {path}: ❌ error: {report['error']}", flush=True)
+        return
+    status = '✅ PASS' if report.get('passing') else '❌ FAIL'
+    print(f"[{stamp}] {path}: {report['total_score']}/100 {status} ({elapsed * 1000:.0f}ms)")
+    if not report.get('passing'):
+        for issue in report.get('form_issues', []) + report.get('content_issues', []):
+            print(f"    - {issue}")
+    sys.stdout.flush()
+
+
+def watch(target: str, pattern: str, validate, report_file: str, report_dir: str,
+          debounce: float = DEFAULT_DEBOUNCE, poll: bool = False,
+          poll_interval: float = DEFAULT_POLL_INTERVAL, on_report=None) -> int:
+    """
+    Score every file of target, then rescore changed files until interrupted
+
+    Args:
+        target: File, directory or glob
+        pattern: File name pattern for directory targets, e.g. '.dod-*.md'
+        validate: path -> report (the validator's cached validate function)
+        report_file: Report path when target is a single file
+        report_dir: Per-file report directory for directory / glob targets
+        debounce: Quiet window (seconds) that ends a burst of writes
+        poll: Poll instead of using inotify
+        on_report: Optional callback(path, report) after a report is written
+
+    Returns:
+        Exit code (0 after SIGINT / SIGTERM)
+    """
+    watched = WatchTarget(target, pattern)
+    watcher = None
+    if not poll:
+        try:
+            watcher = InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}) - polling every {poll_interval}s", file=sys.stderr)
+    if watcher is None:
+        watcher = PollWatcher(watched, poll_interval)
+
+    last = {}  # absolute path -> content hash of the last report written
+
+    def rescore(paths):
+        for path in paths:
+            started = time.perf_counter()
+            report = validate(path)
+            key = os.path.abspath(path)
+            content = report.get('content_sha256')
+            if 'error' not in report and content and last.get(key) == content:
+                continue  # saved without changes
+            if watched.mode == 'file':
+                out = report_file
+            else:
+                os.makedirs(report_dir, exist_ok=True)
+                out = os.path.join(report_dir, report_name(path))
+            try:
+                write_json_atomic(out, report)
+            except OSError as e:
+                print(f"⚠️  cannot write {out}: {e}", file=sys.stderr)
+                continue
+            last[key] = content
+            if on_report:
+                on_report(path, report)
+            _print_result(path, report, time.perf_counter() - started)
+
+    def add_watches():
+        for directory in watched.dirs():
+            try:
+                watcher.add(directory)
+            except OSError as e:
+                print(f"⚠️  cannot watch {directory}: {e}", file=sys.stderr)
+
+    # SIGTERM ends the loop like Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        add_watches()
+        files = watched.files()
+        rescore(files)
+        print(f"👀 Watching {len(files)} file(s) via {watcher.name} "
+              f"(debounce {debounce * 1000:.0f}ms) - Ctrl-C to stop", flush=True)
+
+        while True:
+            changed = watcher.read(None)
+            # Collapse the burst: wait for a quiet window (bounded)
+            deadline = time.monotonic() + debounce * MAX_DEBOUNCE_WINDOWS
+            while time.monotonic() < deadline:
+                more = watcher.read(debounce)
+                if not more:
+                    break
+                changed |= more
+
+            add_watches()
+            files = watched.files()
+            if OVERFLOW not in changed:
+                # Changed files, plus never-scored ones (e.g. created before a
+                # new subdirectory's watch was added)
+                wanted = {os.path.abspath(path) for path in changed}
+                files = [path for path in files
+                         if os.path.abspath(path) in wanted or os.path.abspath(path) not in last]
+            rescore(files)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        watcher.close()
+    return 0
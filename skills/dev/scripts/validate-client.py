@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Validation client - runs a validator on the validation daemon when one is
+running, otherwise in-process. Output and exit codes are identical either way.
+
+Usage:
+    python validate-client.py <dod|prd|okr> [args...]
+
+    e.g. python validate-client.py dod .dod-feature.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from cecelia_validation.client import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
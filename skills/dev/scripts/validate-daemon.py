@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Validation daemon control - keeps the validators loaded in one process and
+serves validate-client.py over a Unix socket.
+
+Usage:
+    python validate-daemon.py start    # start in the background
+    python validate-daemon.py stop
+    python validate-daemon.py status   # exit 1 if not running
+    python validate-daemon.py serve    # run in the foreground
+
+Socket: $CECELIA_VALIDATION_SOCKET (default $XDG_RUNTIME_DIR/cecelia-validation.sock)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from cecelia_validation.daemon import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,48 @@ Scores DoD quality using form_score (40) + content_score (60).
 Generates .dod-validation-report.json with SHA256 hash for anti-cheat.
 
 Usage:
-    python validate-dod.py <dod-file>
+    python validate-dod.py <dod-file> [--timings]
+    python validate-dod.py --batch <dir|glob> [--jobs N] [--report-dir DIR]
+    python validate-dod.py --verify [dod-file|glob]
+    python validate-dod.py --changed-since <ref> [--report-dir DIR]
+    python validate-dod.py --watch [dod-file|dir|glob] [--debounce MS] [--poll]
+
+Batch mode scores every matching file (.dod-*.md when given a directory)
+in a process pool and writes one report per file into --report-dir plus
+an aggregate .dod-validation-batch.json.
+
+--verify checks an existing .dod-validation-report.json against the
+document (11-layer anti-cheat, used by the Stop Hook) and exits 0 when
+every layer passes, 2 otherwise.
+
+--changed-since scores the .dod-*.md files HEAD added or modified since
+its merge-base with <ref>, reading them from the git object store (no
+checkout). Results are cached by blob id, so only never-seen blobs are
+scored; reports are written like --batch.
+
+--timings (or CECELIA_VALIDATION_TIMINGS=1) records wall and CPU time per
+phase (hash, parse, validate_form, validate_content, write_report) in the
+report's `timings` block and adds the run to a Prometheus textfile (see
+cecelia_validation.timings / cecelia_validation.prometheus).
+
+With CECELIA_VALIDATION_STORE set, every report (single, --batch and
+--changed-since) is also recorded in a SQLite report store queried with
+`python3 -m cecelia_validation reports` (see cecelia_validation.store).
+
+--watch keeps running after the first pass and rescores a file each time
+it is saved (inotify, or mtime polling with --poll or where inotify is
+unavailable). Bursts of writes within --debounce ms are collapsed, only
+changed files are rescored and reports are replaced atomically - the
+usual .dod-validation-report.json for a file target, --report-dir for a
+directory or glob (see cecelia_validation.watch).
+
+Scoring rules (keyword tables, points, thresholds, issue messages) are
+read from cecelia_validation/rulesets/dod.json and compiled once; reports
+record the rule file's `ruleset_version` and `ruleset_sha256` (see
+cecelia_validation.rules).
+
+This script holds the DoD scoring; the command line above is
+cecelia_validation.cli.DocumentCli, shared with validate-prd.py.
 
 Exit codes:
     0 - Score >= 90 (pass)
@@ -15,83 +56,61 @@ Exit codes:
 """
 
 import sys
-import json
-import hashlib
-import re
-from datetime import datetime
-from pathlib import Path
 
+from cecelia_validation.cli import DocumentCli
+from cecelia_validation.dod import DodModel, parse_dod
+from cecelia_validation.report import assemble_report
+from cecelia_validation.rules import RuleSetError, load_ruleset
+from cecelia_validation.source import file_sha256
+from cecelia_validation.timings import phase
 
-def calculate_sha256(content: str) -> str:
-    """Calculate SHA256 hash of content"""
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+VALIDATION_VERSION = '1.0.0'
 
 
-def validate_form(content: str, lines: list) -> dict:
+# Scoring rules live in cecelia_validation/rulesets/dod.json - compiled once,
+# loaded from the on-disk artifact cache on later runs
+try:
+    RULES = load_ruleset('dod')
+except RuleSetError as e:
+    if __name__ != '__main__':
+        raise
+    print(f"Error: invalid DOD rule set: {e}", file=sys.stderr)
+    sys.exit(2)
+
+# Cache entries are invalidated whenever the rule file changes
+RULESET_VERSION = RULES.sha256
+
+
+def calculate_sha256(path) -> str:
+    """SHA256 of the file's raw bytes (same as sha256sum), read in chunks"""
+    return file_sha256(path)
+
+
+def parse(content) -> DodModel:
+    """Parse content (text or lines) into the model every check reads (one pass)"""
+    return parse_dod(content, RULES.matcher)
+
+
+def validate_form(model: DodModel) -> dict:
     """
-    Validate DoD form/structure (40 points total)
+    Validate DoD form/structure (40 points total, rules in rulesets/dod.json)
 
     Returns:
         dict with form_score and form_issues
     """
-    score = 0
-    issues = []
-
-    # Count checklist items (- [ ] or - [x])
-    checkbox_pattern = r'^- \[[ x]\]'
-    checklist_items = [line for line in lines if re.match(checkbox_pattern, line.strip())]
-    checklist_count = len(checklist_items)
-
-    # 1. Checklist count >= 5 (10 points)
-    if checklist_count >= 5:
-        score += 10
-    else:
-        issues.append(f"Too few checklist items: {checklist_count} (need ≥5) (-10分)")
-
-    # 2. Each item has [ ] format (10 points)
-    # Already checked above - if we have items, they have format
-    if checklist_count > 0:
-        score += 10
-    else:
-        issues.append("No valid checklist format found (-10分)")
-
-    # 3. Each item has Test field (10 points)
-    # Check for "Test:" in checklist items
-    items_with_test = 0
-    for i, line in enumerate(lines):
-        if re.match(checkbox_pattern, line.strip()):
-            # Look ahead for "Test:" within next 3 lines
-            for j in range(i, min(i + 3, len(lines))):
-                if 'Test:' in lines[j] or '- Test:' in lines[j]:
-                    items_with_test += 1
-                    break
-
-    # Score proportional to coverage (min 50% to get points)
-    if checklist_count > 0:
-        test_coverage = items_with_test / checklist_count
-        if test_coverage >= 0.5:
-            score += int(10 * test_coverage)
-        else:
-            issues.append(f"Test field coverage too low: {test_coverage:.0%} (need ≥50%) (-10分)")
-
-    # 4. Document length >= 20 lines (10 points)
-    non_empty_lines = [line for line in lines if line.strip() and not line.strip().startswith('---')]
-    if len(non_empty_lines) >= 20:
-        score += 10
-    else:
-        issues.append(f"Document too short: {len(non_empty_lines)} lines (need ≥20) (-10分)")
+    score, issues = RULES.score_form(model)
 
     return {
         'form_score': score,
         'form_issues': issues,
-        'checklist_count': checklist_count,
-        'items_with_test': items_with_test
+        'checklist_count': model.checklist_count,
+        'items_with_test': model.items_with_test
     }
 
 
-def validate_content(content: str, checklist_count: int) -> dict:
+def validate_content(model: DodModel) -> dict:
     """
-    Validate DoD content quality (60 points total)
+    Validate DoD content quality (60 points total, rules in rulesets/dod.json)
 
     Uses heuristics to assess:
     - DoD 条目明确性 (20分)
@@ -101,49 +120,7 @@ def validate_content(content: str, checklist_count: int) -> dict:
     Returns:
         dict with content_score and content_issues
     """
-    score = 0
-    issues = []
-
-    # 1. DoD 条目明确性 (20分)
-    # Check for clear, actionable DoD items
-    clarity_keywords = ['实现', '完成', '通过', '验证', '检查', '测试', '确保']
-    clarity_matches = sum(1 for kw in clarity_keywords if kw in content)
-    clarity_score = min(20, clarity_matches * 3)  # 3 points per keyword
-    score += clarity_score
-    if clarity_score < 20:
-        issues.append(f"DoD 条目不够明确 ({clarity_score}/20分) - 需要更明确的动作动词")
-
-    # 2. Test 字段可执行性 (20分)
-    # Check for executable test commands
-    test_keywords = ['bash', 'python', 'npm', 'git', 'grep', 'test', 'run', 'check']
-    test_matches = sum(1 for kw in test_keywords if kw in content)
-
-    # Bonus for actual command snippets (`` or ```)
-    code_blocks = len(re.findall(r'`[^`]+`', content))
-    test_score = min(20, test_matches * 2 + code_blocks)
-    score += test_score
-    if test_score < 20:
-        issues.append(f"Test 字段不够可执行 ({test_score}/20分) - 需要具体的测试命令")
-
-    # 3. 覆盖面完整性 (20分)
-    # Check for diverse coverage areas
-    coverage_keywords = {
-        '功能': ['功能', '特性', 'feature'],
-        '测试': ['测试', 'test', '单元测试'],
-        '性能': ['性能', 'performance', '时间'],
-        '文档': ['文档', 'doc', 'README'],
-        'CI': ['CI', 'DevGate', '版本', 'version'],
-    }
-
-    coverage_areas = 0
-    for area, keywords in coverage_keywords.items():
-        if any(kw in content for kw in keywords):
-            coverage_areas += 1
-
-    coverage_score = coverage_areas * 4  # 4 points per area, max 20
-    score += coverage_score
-    if coverage_score < 20:
-        issues.append(f"覆盖面不够完整 ({coverage_score}/20分) - 需要覆盖更多方面")
+    score, issues = RULES.score_content(model)
 
     return {
         'content_score': score,
@@ -151,91 +128,49 @@ def validate_content(content: str, checklist_count: int) -> dict:
     }
 
 
-def validate_dod(dod_file: str) -> dict:
+def score_dod(dod_file, content_sha256: str, content) -> dict:
     """
-    Main validation function
+    Score a DoD given as text or lines (no file access, no cache)
+
+    Shared by file validation and --changed-since, which reads git blobs.
 
     Returns:
         dict with validation report
     """
-    dod_path = Path(dod_file)
-
-    if not dod_path.exists():
-        return {
-            'error': f"DoD file not found: {dod_file}",
-            'total_score': 0
-        }
-
-    # Read file content
-    content = dod_path.read_text(encoding='utf-8')
-    lines = content.split('\n')
+    with phase('parse'):
+        model = parse(content)
 
     # Validate form (40 points)
-    form_result = validate_form(content, lines)
+    with phase('validate_form'):
+        form_result = validate_form(model)
 
     # Validate content (60 points)
-    content_result = validate_content(content, form_result['checklist_count'])
-
-    # Calculate total score
-    form_score = form_result['form_score']
-    content_score = content_result['content_score']
-    total_score = form_score + content_score
-
-    # Generate report
-    report = {
-        'dod_file': str(dod_file),
-        'form_score': form_score,
-        'content_score': content_score,
-        'total_score': total_score,
-        'passing': total_score >= 90,
-        'checklist_count': form_result['checklist_count'],
-        'items_with_test': form_result['items_with_test'],
-        'form_issues': form_result['form_issues'],
-        'content_issues': content_result['content_issues'],
-        'content_sha256': calculate_sha256(content),
-        'timestamp': datetime.now().isoformat(),
-        'validation_version': '1.0.0'
-    }
+    with phase('validate_content'):
+        content_result = validate_content(model)
+
+    return assemble_report('dod_file', dod_file, form_result, content_result, content_sha256,
+                           VALIDATION_VERSION, RULES)
+
+
+def validate_dod(dod_file: str, use_cache: bool = True) -> dict:
+    """
+    Main validation function
+
+    Unchanged content is served from the result cache (see
+    cecelia_validation.cache) when use_cache is set.
+
+    Returns:
+        dict with validation report
+    """
+    return CLI.validate_file(dod_file, use_cache)
+
 
-    return report
+CLI = DocumentCli('dod', 'DoD', VALIDATION_VERSION, RULES, score_dod, validate_dod,
+                  summary=(('Checklist Items', 'checklist_count'), ('Items with Test', 'items_with_test')))
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python validate-dod.py <dod-file>", file=sys.stderr)
-        sys.exit(2)
-
-    dod_file = sys.argv[1]
-    report = validate_dod(dod_file)
-
-    # Check for errors
-    if 'error' in report:
-        print(f"Error: {report['error']}", file=sys.stderr)
-        sys.exit(2)
-
-    # Write report to .dod-validation-report.json
-    report_file = '.dod-validation-report.json'
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
-
-    # Print summary
-    print(f"DoD Validation Report:")
-    print(f"  Form Score: {report['form_score']}/40")
-    print(f"  Content Score: {report['content_score']}/60")
-    print(f"  Total Score: {report['total_score']}/100")
-    print(f"  Checklist Items: {report['checklist_count']}")
-    print(f"  Items with Test: {report['items_with_test']}")
-    print(f"  Status: {'✅ PASS' if report['passing'] else '❌ FAIL'}")
-
-    if not report['passing']:
-        print(f"\nIssues to fix:")
-        for issue in report['form_issues'] + report['content_issues']:
-            print(f"  - {issue}")
-
-    print(f"\nReport saved to: {report_file}")
-
-    # Exit code
-    sys.exit(0 if report['passing'] else 1)
+    CLI.main()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,455 @@
+"""
+Bulk loader: OKR output.json -> Brain / Tasks APIs
+
+output.json is parsed once. The Goal is created first, then each level of
+the hierarchy (initiatives or feature sub-projects, PR Plans, Tasks) is
+submitted concurrently over one pooled keep-alive session, bounded by
+`jobs`. The project list (repository -> project_id) and the fallback goal
+are fetched once per run, not once per entity.
+
+Requests are retried with exponential backoff and jitter on connection
+errors, 429 and 5xx; other 4xx responses fail at once.
+
+Every created entity is appended to a journal next to the input, keyed by
+its position in output.json (`initiative/0`, `pr_plan/0/1`, ...). A re-run
+over the same content skips what the journal already holds and reuses the
+recorded IDs, so a partial failure resumes where it stopped instead of
+creating everything again. The journal is discarded when output.json
+changes.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_BRAIN_API = 'http://localhost:5221'
+DEFAULT_TASKS_API = 'http://localhost:5212'
+JOURNAL_VERSION = 1
+
+
+class StoreError(Exception):
+    """An entity could not be created (after retries)"""
+
+
+def journal_path(input_file) -> Path:
+    """Journal of an input file: .<name>.store-journal next to it"""
+    input_file = Path(input_file)
+    return input_file.with_name(f".{input_file.name}.store-journal")
+
+
+class Journal:
+    """
+    Append-only record of created entities (one JSON object per line)
+
+    The first line pins the input's content hash; a journal written for
+    other content is ignored and replaced.
+    """
+
+    def __init__(self, path, content_hash: str, fresh: bool = False):
+        self.path = Path(path)
+        self.content_hash = content_hash
+        self.ids = {}
+        self._lock = threading.Lock()
+        if not fresh:
+            self._load()
+        if not self.ids:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'journal': JOURNAL_VERSION, 'content_hash': content_hash}) + '\n')
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                header = json.loads(f.readline() or 'null')
+                if header != {'journal': JOURNAL_VERSION, 'content_hash': self.content_hash}:
+                    return
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn last line of an interrupted run
+                    self.ids[entry['key']] = entry['id']
+        except (OSError, ValueError, KeyError, TypeError):
+            self.ids = {}
+
+    def get(self, key: str):
+        return self.ids.get(key)
+
+    def record(self, key: str, entity_id):
+        with self._lock:
+            self.ids[key] = entity_id
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'key': key, 'id': entity_id}, ensure_ascii=False) + '\n')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class BrainClient:
+    """Pooled keep-alive session to Brain and Tasks with retries and cached lookups"""
+
+    def __init__(self, brain_api: str = None, tasks_api: str = None, jobs: int = 8,
+                 timeout: float = 10, attempts: int = 3, backoff: float = 0.5):
+        self.brain_api = (brain_api or os.environ.get('BRAIN_API', DEFAULT_BRAIN_API)).rstrip('/')
+        self.tasks_api = (tasks_api or os.environ.get('TASKS_API', DEFAULT_TASKS_API)).rstrip('/')
+        self.timeout = timeout
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self._projects = None
+        self._goal = None
+        self._lock = threading.Lock()
+
+        # Imported here - only storing needs an HTTP client
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(1, jobs))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def request(self, method: str, url: str, payload=None):
+        """JSON request with backoff on connection errors / 429 / 5xx (raises StoreError)"""
+        error = None
+        for attempt in range(self.attempts):
+            if attempt:
+                delay = self.backoff * 2 ** (attempt - 1)
+                time.sleep(delay + random.uniform(0, delay / 2))
+            try:
+                resp = self.session.request(method, url, json=payload, timeout=self.timeout)
+            except self._requests.RequestException as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+            if resp.status_code == 429 or resp.status_code >= 500:
+                error = f"HTTP {resp.status_code}"
+                continue
+            if resp.status_code >= 400:
+                raise StoreError(f"{method} {url}: HTTP {resp.status_code} {resp.text[:200]}")
+            try:
+                return resp.json()
+            except ValueError:
+                error = 'invalid JSON response'
+        raise StoreError(f"{method} {url}: {error} (after {self.attempts} attempts)")
+
+    def healthy(self) -> bool:
+        """Brain health check (one attempt)"""
+        try:
+            return self.session.get(f"{self.brain_api}/api/brain/health", timeout=self.timeout).ok
+        except self._requests.RequestException:
+            return False
+
+    def projects(self) -> list:
+        """Tasks API project list, fetched once per run"""
+        with self._lock:
+            if self._projects is None:
+                projects = self.request('GET', f"{self.tasks_api}/api/tasks/projects")
+                self._projects = projects if isinstance(projects, list) else []
+            return self._projects
+
+    def project_for(self, repository: str):
+        """First project whose repo_path contains the repository name (None if none)"""
+        if not repository:
+            return None
+        for project in self.projects():
+            repo_path = project.get('repo_path') if isinstance(project, dict) else None
+            if repo_path and repository in repo_path:
+                return project.get('id')
+        return None
+
+    def fallback_goal(self):
+        """First existing goal, fetched once per run"""
+        with self._lock:
+            if self._goal is None:
+                goals = self.request('GET', f"{self.tasks_api}/api/tasks/goals")
+                first = goals[0] if isinstance(goals, list) and goals else None
+                self._goal = (first.get('id') if isinstance(first, dict) else None) or ''
+            return self._goal or None
+
+
+def _id(response, *paths):
+    """First non-empty ID at any of the dotted paths in a response"""
+    for path in paths:
+        value = response
+        for part in path.split('.'):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value:
+            return value
+    return None
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class OkrLoader:
+    """
+    Create a validated output.json's hierarchy through a BrainClient
+
+    Each level runs concurrently; an entity whose parent failed is skipped.
+    """
+
+    def __init__(self, client: BrainClient, journal: Journal, okr_file: str, jobs: int = 8, log=print):
+        self.client = client
+        self.journal = journal
+        self.okr_file = okr_file
+        self.jobs = max(1, jobs)
+        self.log = log
+        self.created = {}   # kind -> count
+        self.reused = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def _run_level(self, kind: str, jobs: list) -> dict:
+        """
+        Create one level of entities
+
+        Args:
+            kind: Entity kind for counters and log lines
+            jobs: (key, label, create) - create() returns the new ID
+
+        Returns:
+            dict key -> ID for every entity that exists now
+        """
+        ids = {}
+        pending = []
+        for key, label, create in jobs:
+            existing = self.journal.get(key)
+            if existing is not None:
+                ids[key] = existing
+                self.reused += 1
+            else:
+                pending.append((key, label, create))
+
+        def run(job):
+            key, _, create = job
+            try:
+                entity_id = create()
+            except StoreError as e:
+                return key, None, str(e)
+            self.journal.record(key, entity_id)
+            return key, entity_id, None
+
+        if len(pending) > 1 and self.jobs > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+                results = list(executor.map(run, pending))
+        else:
+            results = [run(job) for job in pending]
+
+        # Logged in input order, whatever order the requests finished in
+        for (_, label, _), (key, entity_id, error) in zip(pending, results):
+            if error:
+                self.failed += 1
+                self.log(f"❌ {kind} {label}: {error}")
+            else:
+                ids[key] = entity_id
+                self.created[kind] = self.created.get(kind, 0) + 1
+                self.log(f"✅ {kind} created: {entity_id} ({label})")
+        return ids
+
+    def _post(self, base: str, path: str, payload: dict, *id_paths):
+        response = self.client.request('POST', f"{base}{path}", payload)
+        entity_id = _id(response, *id_paths)
+        if not entity_id:
+            raise StoreError(f"POST {path}: response has no ID")
+        return entity_id
+
+    def create_goal(self, data: dict):
+        """Goal for the objective (journaled like every other entity)"""
+        goal_id = self.journal.get('goal')
+        if goal_id is not None:
+            return goal_id
+
+        objective = data.get('objective') or 'Unknown Objective'
+        key_results = data.get('key_results') or [{}]
+        kr_title = (key_results[0] or {}).get('title') or 'Unknown KR'
+        response = self.client.request('POST', f"{self.client.brain_api}/api/brain/action/create-goal", {
+            'title': f"{objective} - {kr_title}",
+            'description': objective,
+            'status': 'active',
+            'priority': 'P0'
+        })
+        goal_id = _id(response, 'id', 'goal_id') or self.client.fallback_goal()
+        if not goal_id:
+            raise StoreError('create-goal returned no ID and no existing goal was found')
+        self.journal.record('goal', goal_id)
+        return goal_id
+
+    def _project(self, repository: str):
+        project_id = self.client.project_for(repository)
+        if project_id is None:
+            raise StoreError(f"no project found for repository: {repository}")
+        return project_id
+
+    def store_initiatives(self, data: dict, goal_id):
+        """3-layer format: initiatives -> PR Plans -> Tasks"""
+        brain, tasks = self.client.brain_api, self.client.tasks_api
+        initiatives = [i for i in data.get('initiatives') or [] if isinstance(i, dict)]
+        projects = {}
+
+        def create_initiative(idx, init):
+            def create():
+                projects[idx] = self._project(init.get('repository'))
+                return self._post(tasks, '/api/tasks/projects', {
+                    'name': init.get('title'),
+                    'parent_id': projects[idx],
+                    'description': init.get('description') or ''
+                }, 'id')
+            return create
+
+        ids = self._run_level('Initiative', [
+            (f'initiative/{i}', init.get('title'), create_initiative(i, init))
+            for i, init in enumerate(initiatives)
+        ])
+
+        def create_pr_plan(i, init, plan):
+            def create():
+                return self._post(brain, '/api/brain/pr-plans', {
+                    'initiative_id': ids[f'initiative/{i}'],
+                    'project_id': projects.get(i) or self._project(init.get('repository')),
+                    'title': plan.get('title'),
+                    'description': plan.get('description') or '',
+                    'dod': plan.get('dod'),
+                    'files': plan.get('files'),
+                    'sequence': plan.get('sequence') or 0,
+                    'depends_on': plan.get('depends_on') or [],
+                    'complexity': plan.get('complexity') or 'medium',
+                    'estimated_hours': plan.get('estimated_hours') or 0,
+                    'capability_id': init.get('capability_id'),
+                    'from_stage': init.get('from_stage'),
+                    'to_stage': init.get('to_stage'),
+                    'evidence_required': init.get('evidence_required') or ''
+                }, 'pr_plan.id')
+            return create
+
+        plan_jobs = []
+        plans = {}
+        for i, init in enumerate(initiatives):
+            for j, plan in enumerate(p for p in init.get('pr_plans') or [] if isinstance(p, dict)):
+                if f'initiative/{i}' not in ids:
+                    self.skipped += 1
+                    continue
+                plans[(i, j)] = (init, plan)
+                plan_jobs.append((f'pr_plan/{i}/{j}', plan.get('title'), create_pr_plan(i, init, plan)))
+        plan_ids = self._run_level('PR Plan', plan_jobs)
+
+        def create_task(i, j, init, plan, task):
+            def create():
+                title = task.get('title')
+                return self._post(brain, '/api/brain/action/create-task', {
+                    'title': title,
+                    'project_id': projects.get(i) or self._project(init.get('repository')),
+                    'pr_plan_id': plan_ids[f'pr_plan/{i}/{j}'],
+                    'goal_id': goal_id,
+                    'task_type': task.get('type') or 'dev',
+                    'prd_content': f"# {title}\n\n## 描述\n\n{task.get('description') or ''}"
+                                   f"\n\n## PR Plan\n\n{plan.get('title')}",
+                    'payload': {
+                        'from_okr': True,
+                        'okr_file': self.okr_file,
+                        'pr_plan_title': plan.get('title'),
+                        'repository': init.get('repository')
+                    }
+                }, 'id', 'task_id')
+            return create
+
+        task_jobs = []
+        for (i, j), (init, plan) in plans.items():
+            for k, task in enumerate(t for t in plan.get('tasks') or [] if isinstance(t, dict)):
+                if f'pr_plan/{i}/{j}' not in plan_ids:
+                    self.skipped += 1
+                    continue
+                task_jobs.append((f'task/{i}/{j}/{k}', task.get('title'), create_task(i, j, init, plan, task)))
+        self._run_level('Task', task_jobs)
+        return len(initiatives)
+
+    def store_features(self, data: dict, goal_id):
+        """2-layer format: features (sub-projects) -> one Task each"""
+        brain, tasks = self.client.brain_api, self.client.tasks_api
+        features = [
+            (f'{k}/{f}', feature)
+            for k, kr in enumerate(data.get('key_results') or []) if isinstance(kr, dict)
+            for f, feature in enumerate(kr.get('features') or []) if isinstance(feature, dict)
+        ]
+
+        def create_feature(feature):
+            def create():
+                return self._post(tasks, '/api/tasks/projects', {
+                    'name': feature.get('title'),
+                    'parent_id': self._project(feature.get('repository')),
+                    'description': feature.get('description') or ''
+                }, 'id')
+            return create
+
+        ids = self._run_level('Feature', [
+            (f'feature/{pos}', feature.get('title'), create_feature(feature)) for pos, feature in features
+        ])
+
+        def create_task(pos, feature):
+            def create():
+                title = feature.get('title')
+                return self._post(brain, '/api/brain/action/create-task', {
+                    'title': title,
+                    'project_id': ids[f'feature/{pos}'],
+                    'goal_id': goal_id,
+                    'task_type': 'dev',
+                    'prd_content': f"# {title}\n\n## 描述\n\n{feature.get('description') or ''}"
+                                   f"\n\n## Repository\n\n{feature.get('repository')}",
+                    'payload': {
+                        'from_okr': True,
+                        'okr_file': self.okr_file,
+                        'feature_title': title,
+                        'repository': feature.get('repository')
+                    }
+                }, 'id', 'task_id')
+            return create
+
+        task_jobs = []
+        for pos, feature in features:
+            if f'feature/{pos}' not in ids:
+                self.skipped += 1
+                continue
+            task_jobs.append((f'task/{pos}', feature.get('title'), create_task(pos, feature)))
+        self._run_level('Task', task_jobs)
+        return len(features)
+
+    def store(self, data: dict) -> dict:
+        """
+        Store the whole hierarchy
+
+        Returns:
+            dict: goal_id, format, top_level (initiatives / features),
+                  created (per kind), reused (from the journal), failed,
+                  skipped (under a failed parent) - the Goal is not counted
+
+        Raises:
+            StoreError: The Goal could not be created
+        """
+        goal_id = self.create_goal(data)
+        if 'initiatives' in data:
+            fmt, top_level = '3-layer', self.store_initiatives(data, goal_id)
+        else:
+            fmt, top_level = '2-layer', self.store_features(data, goal_id)
+        return {
+            'goal_id': goal_id,
+            'format': fmt,
+            'top_level': top_level,
+            'created': dict(self.created),
+            'reused': self.reused,
+            'failed': self.failed,
+            'skipped': self.skipped
+        }
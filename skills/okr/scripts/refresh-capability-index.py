@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Refresh the offline capability registry snapshot
+
+Exports every capability ID from Brain once and writes a sorted index
+file for `validate-okr.py --capability-index <file>`, so validation runs
+need no Brain round-trips.
+
+Usage:
+    python3 refresh-capability-index.py [index-file]
+
+    index-file defaults to capability-index.txt in the current directory.
+    Brain URL comes from $BRAIN_URL (default http://localhost:5221).
+
+Exit codes:
+    0 - Snapshot written (or already up to date)
+    1 - Brain unreachable or returned an invalid response
+"""
+
+import sys
+from pathlib import Path
+
+# Shared helpers live in the dev skill (skills are deployed side by side)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'dev' / 'scripts'))
+from cecelia_validation.capabilities import (  # noqa: E402
+    CapabilityIndex, brain_url, fetch_capability_ids
+)
+
+
+def main():
+    index_file = Path(sys.argv[1] if len(sys.argv) > 1 else 'capability-index.txt')
+    source = brain_url()
+
+    try:
+        ids = fetch_capability_ids(source)
+    except Exception as e:
+        print(f"❌ Error: Cannot export capabilities from {source}")
+        print(f"   {e}")
+        sys.exit(1)
+
+    index = CapabilityIndex(ids, source=source)
+
+    if index_file.exists():
+        try:
+            previous = CapabilityIndex.load(index_file)
+            if previous.version == index.version:
+                print(f"✅ Capability index up to date: {index_file} ({index.version}, {len(index)} ids)")
+                sys.exit(0)
+        except (OSError, ValueError):
+            pass
+
+    index.save(index_file)
+    print(f"✅ Capability index written: {index_file}")
+    print(f"   Version: {index.version}")
+    print(f"   Capabilities: {len(index)}")
+    print(f"   Source: {source}")
+
+
+if __name__ == '__main__':
+    main()
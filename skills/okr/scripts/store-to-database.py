@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+OKR Database Storage - store output.json in Brain
+
+Parses output.json once and creates the Goal, the initiatives (or feature
+sub-projects), PR Plans and Tasks concurrently over one keep-alive session
+(see okrstore.py). Created entities are journaled in
+.<output>.store-journal next to the input: after a partial failure, run
+the same command again and only what is missing is created.
+
+Usage:
+    python3 store-to-database.py output.json [--jobs N] [--fresh]
+
+    BRAIN_API (default http://localhost:5221) and TASKS_API (default
+    http://localhost:5212) select the services. When Brain is down the
+    input is copied to pending-tasks.json for a later retry.
+
+Exit codes:
+    0 - Every entity stored (or already stored by an earlier run)
+    1 - Partial failure (re-run to resume)
+    2 - Nothing stored (invalid input, Brain unavailable, Goal not created)
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+from okrstore import BrainClient, Journal, OkrLoader, StoreError, content_hash, journal_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Store OKR output.json in Brain')
+    parser.add_argument('output_file', nargs='?', default='output.json', help='OKR output.json')
+    parser.add_argument('--jobs', type=int, default=8, help='Concurrent requests (default: 8)')
+    parser.add_argument('--attempts', type=int, default=3, help='Attempts per request (default: 3)')
+    parser.add_argument('--backoff', type=float, default=0.5,
+                        help='First retry delay in seconds, doubled per attempt (default: 0.5)')
+    parser.add_argument('--fresh', action='store_true',
+                        help='Ignore the journal of an earlier run and create everything again')
+    args = parser.parse_args()
+
+    output_file = Path(args.output_file)
+    try:
+        raw = output_file.read_bytes()
+        data = json.loads(raw)
+    except OSError:
+        print(f"❌ Output file not found: {output_file}")
+        sys.exit(2)
+    except ValueError:
+        print(f"❌ Invalid JSON format: {output_file}")
+        sys.exit(2)
+    if not isinstance(data, dict):
+        print(f"❌ Invalid OKR format (expected an object): {output_file}")
+        sys.exit(2)
+
+    print(f"ℹ️  Reading {output_file}...")
+    print(f"ℹ️  Objective: {data.get('objective') or 'Unknown Objective'}")
+
+    with BrainClient(jobs=args.jobs, attempts=args.attempts, backoff=args.backoff) as client:
+        if not client.healthy():
+            print(f"❌ Brain service unavailable at {client.brain_api}")
+            if output_file.resolve() != Path('pending-tasks.json').resolve():
+                shutil.copyfile(output_file, 'pending-tasks.json')
+            print("⚠️  Saved to pending-tasks.json for manual processing")
+            print("\nTo retry later:")
+            print(f"  python3 {Path(__file__).name} pending-tasks.json")
+            sys.exit(2)
+
+        journal = Journal(journal_path(output_file), content_hash(raw), fresh=args.fresh)
+        if len(journal):
+            print(f"ℹ️  Resuming: {len(journal)} entities already stored ({journal.path})")
+
+        loader = OkrLoader(client, journal, str(output_file), jobs=args.jobs)
+        try:
+            summary = loader.store(data)
+        except StoreError as e:
+            print(f"❌ Failed to create Goal: {e}")
+            sys.exit(2)
+
+    created = sum(summary['created'].values())
+    print("")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("ℹ️  Storage Summary")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"  Goal ID: {summary['goal_id']}")
+    print(f"  Format: {summary['format']} ({summary['top_level']} "
+          f"{'initiatives' if summary['format'] == '3-layer' else 'features'})")
+    for kind, count in summary['created'].items():
+        print(f"  {kind}s created: {count}")
+    print(f"  Already stored: {summary['reused']}")
+    print(f"  Failed: {summary['failed']} (skipped under failed parents: {summary['skipped']})")
+    print("")
+    print("Query tasks:")
+    print(f"  curl -s {client.tasks_api}/api/tasks/tasks?goal_id={summary['goal_id']} | jq")
+
+    if summary['failed'] or summary['skipped']:
+        print(f"\n⚠️  Some entities failed - re-run to resume: python3 {Path(__file__).name} {output_file}")
+        sys.exit(1 if created or summary['reused'] else 2)
+    print("\n✅ All entities stored")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
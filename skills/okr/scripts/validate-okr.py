@@ -5,14 +5,47 @@ OKR Validation Script with Anti-Cheating (v8.0.0)
 - Validates form (structure/fields)
 - Phase 2: Validates capability binding (capability_id, stage progression)
 - Generates validation report for AI self-assessment
+- --stream: scores initiatives[] incrementally for very large files
+- --verify-report: Stop Hook verification of the completed report
+- Per-initiative Merkle state: re-runs only re-score changed initiatives
+- --timings (or CECELIA_VALIDATION_TIMINGS=1): per-phase wall/CPU time in the
+  report and the Prometheus textfile (load, hash, validate_form,
+  check_capability_exists, write_report)
+- CECELIA_VALIDATION_STORE: also record every report in the SQLite report
+  store (see cecelia_validation.store)
 """
 
 import json
 import sys
 import hashlib
+import argparse
+import time
+from array import array
 from datetime import datetime
+from functools import partial
+from itertools import accumulate, chain, repeat
 from pathlib import Path
-import requests
+
+# Shared helpers live in the dev skill (skills are deployed side by side)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'dev' / 'scripts'))
+from cecelia_validation.cache import ResultCache, cache_enabled  # noqa: E402
+from cecelia_validation.capabilities import (  # noqa: E402
+    CapabilityIndex, CapabilityLookup, brain_url, is_capability_id
+)
+from cecelia_validation.depgraph import DependencyGraph  # noqa: E402
+from cecelia_validation.merkle import IncrementalState, leaf_hash, node_hash, state_path  # noqa: E402
+from cecelia_validation.store import record_reports  # noqa: E402
+from cecelia_validation.timings import (  # noqa: E402
+    Timings, export_timings, phase, recording, timings_enabled, write_report
+)
+
+VALIDATION_VERSION = '8.0.0'
+# Bump when form scoring rules change
+RULESET_VERSION = '3'
+# Capability registry can change under us - keep 3-layer results short-lived
+FORM_CACHE_MAX_AGE = 3600
+# Files at least this large are validated with --stream automatically
+STREAM_THRESHOLD = 64 * 1024 * 1024
 
 
 def calculate_content_hash(data):
@@ -21,38 +54,53 @@ def calculate_content_hash(data):
     return hashlib.sha256(content_str.encode()).hexdigest()[:16]
 
 
-def detect_circular_dependency(pr_plans):
-    """Detect circular dependencies in PR Plans"""
-    # Build dependency graph
-    plan_map = {p.get('sequence', idx + 1): idx for idx, p in enumerate(pr_plans)}
+def analyze_pr_plans(pr_plans):
+    """Dependency analysis of one initiative's PR Plans
 
-    def has_cycle(seq, visited, rec_stack):
-        visited.add(seq)
-        rec_stack.add(seq)
+    depends_on lists the sequence numbers of PR Plans in the same
+    initiative (sequence defaults to position + 1). Iterative - safe for
+    arbitrarily long dependency chains.
 
-        if seq not in plan_map:
-            return False
-
-        plan = pr_plans[plan_map[seq]]
-        depends_on = plan.get('depends_on', [])
+    Returns:
+        dict: sequences (node id -> sequence), dangling [(sequence, dep)],
+              plus DependencyGraph.analyze() results over node ids
+    """
+    graph = DependencyGraph()
+    sequences = []
+    plan_map = {}
+    for idx, plan in enumerate(pr_plans):
+        hours = plan.get('estimated_hours')
+        is_number = isinstance(hours, (int, float)) and not isinstance(hours, bool)
+        node = graph.add_node(hours if is_number and hours > 0 else 0)
+        seq = plan.get('sequence', idx + 1)
+        sequences.append(seq)
+        plan_map[seq] = node
 
+    dangling = []
+    for node, plan in enumerate(pr_plans):
+        depends_on = plan.get('depends_on') or []
+        if not isinstance(depends_on, list):
+            depends_on = [depends_on]
         for dep in depends_on:
-            if dep not in visited:
-                if has_cycle(dep, visited, rec_stack):
-                    return True
-            elif dep in rec_stack:
-                return True
+            try:
+                target = plan_map.get(dep)
+            except TypeError:  # unhashable, e.g. a nested list
+                target = None
+            if target is None:
+                dangling.append((sequences[node], dep))
+            else:
+                graph.add_edge(node, target)
 
-        rec_stack.remove(seq)
-        return False
+    result = graph.analyze()
+    result['sequences'] = sequences
+    result['dangling'] = dangling
+    result['edges'] = graph.edge_count()
+    return result
 
-    visited = set()
-    for idx, plan in enumerate(pr_plans):
-        seq = plan.get('sequence', idx + 1)
-        if seq not in visited:
-            if has_cycle(seq, visited, set()):
-                return True
-    return False
+
+def detect_circular_dependency(pr_plans):
+    """Detect circular dependencies in PR Plans"""
+    return bool(analyze_pr_plans(pr_plans)['cycles'])
 
 
 def check_capability_exists(capability_id):
@@ -67,9 +115,11 @@ def check_capability_exists(capability_id):
                - (False, True): capability doesn't exist
                - (False, False): Brain unavailable, cannot verify
     """
+    import requests  # deferred - only needed for live Brain lookups
+
     try:
         resp = requests.get(
-            f'http://localhost:5221/api/brain/capabilities/{capability_id}',
+            f'{brain_url()}/api/brain/capabilities/{capability_id}',
             timeout=2
         )
         return (resp.status_code == 200, True)
@@ -78,122 +128,370 @@ def check_capability_exists(capability_id):
         return (False, False)
 
 
-def validate_3layer_format(data):
-    """Validate 3-layer decomposition format (Initiatives → PR Plans → Tasks)
+def check_capabilities(capability_ids, capability_index=None):
+    """Check many capabilities at once (deduplicated, concurrent, circuit-broken)
 
-    Phase 2: Now expects initiatives[] (plural) with capability binding
+    Args:
+        capability_ids: IDs to check
+        capability_index: Optional CapabilityIndex snapshot - answers locally, no network
+
+    Returns:
+        dict: capability_id -> (exists, brain_available), see check_capability_exists()
     """
-    score = 0
-    issues = []
-    suggestions = []
+    if capability_index is not None:
+        return capability_index.check_many(capability_ids)
 
-    # 1. Check initiatives array exists (5 points)
-    initiatives = data.get('initiatives', [])
-    if initiatives:
-        score += 5
+    with CapabilityLookup() as lookup:
+        return lookup.check_many(capability_ids)
+
+
+def _distributed_table(total, points):
+    """Points spread evenly over `total` items, summed for 0..total of them
+
+    table[count] accumulates in float exactly like adding points / total
+    once per item, so int() truncation matches a per-initiative running
+    total. Built in one C-level pass and shared by every check worth the
+    same points.
+    """
+    return array('d', chain((0,), accumulate(repeat(points / total, total))))
+
+
+def _rows(column, value=0):
+    """Indexes of the entries equal to value in a bytearray column"""
+    idx = column.find(value)
+    while idx != -1:
+        yield idx
+        idx = column.find(value, idx + 1)
+
+
+def initiative_hash(init):
+    """Merkle hash of one initiative: its own fields plus one leaf per pr_plan"""
+    pr_plans = init.get('pr_plans') if isinstance(init, dict) else None
+    if not isinstance(pr_plans, list):
+        return leaf_hash(init)
+    own = {key: value for key, value in init.items() if key != 'pr_plans'}
+    return node_hash([leaf_hash(own)] + [leaf_hash(plan) for plan in pr_plans])
+
+
+def score_initiative(init):
+    """Form checks of one initiative, independent of its position
+
+    Returns:
+        dict (JSON-serializable, stored in the incremental state):
+            capability_id, stages [from, to] or None, stage_ok, evidence,
+            pr_plans (count), tasks_ok (None without pr_plans),
+            graph (None without pr_plans)
+    """
+    # 2. capability_id
+    record = {'capability_id': init.get('capability_id') or None}
+
+    # 4. from_stage / to_stage, 5. from_stage < to_stage
+    from_s = init.get('from_stage')
+    to_s = init.get('to_stage')
+    if from_s and to_s:
+        record['stages'] = [from_s, to_s]
+        record['stage_ok'] = bool(from_s < to_s)
     else:
-        issues.append('Missing initiatives array')
-        suggestions.append('Add initiatives array with at least one initiative')
+        record['stages'] = None
+        record['stage_ok'] = False
 
-    # Early return if no initiatives
-    if not initiatives:
-        return {
-            'score': min(score, 40),
-            'issues': issues,
-            'suggestions': suggestions,
-            'num_pr_plans': 0,
-            'format': '3-layer'
+    # 6. evidence_required
+    record['evidence'] = bool(init.get('evidence_required'))
+
+    # 7. pr_plans have tasks
+    pr_plans = init.get('pr_plans', [])
+    record['pr_plans'] = len(pr_plans)
+    record['tasks_ok'] = all(len(pp.get('tasks', [])) > 0 for pp in pr_plans) if pr_plans else None
+
+    # 8. pr_plans dependency graph (cycles, dangling depends_on)
+    record['graph'] = None
+    if pr_plans:
+        graph = analyze_pr_plans(pr_plans)
+        seqs = graph['sequences']
+        record['graph'] = {
+            'nodes': len(seqs),
+            'edges': graph['edges'],
+            'order': [seqs[v] for v in graph['order']],
+            'critical_path': [seqs[v] for v in graph['critical_path']],
+            'critical_path_weight': graph['critical_path_weight'],
+            'cycles': [[seqs[v] for v in cycle] for cycle in graph['cycles']],
+            'dangling': [[seq, dep] for seq, dep in graph['dangling']]
         }
+    return record
+
 
-    # 2. Check each initiative has capability_id (10 points, distributed)
-    capability_score = 0
-    for idx, init in enumerate(initiatives):
-        if init.get('capability_id'):
-            capability_score += 10 / len(initiatives)
+class InitiativeScorer:
+    """Scores 3-layer initiatives one at a time (see validate_3layer_format)
+
+    Each initiative is flattened into one entry per column (bytearray
+    pass/fail flags, an array of pr_plan counts) plus capability_ids and
+    the details of failing rows, so streaming callers never need the whole
+    initiatives array in memory. result() computes every distributed
+    sub-score from column counts and builds issues for failing rows only.
+
+    With an IncrementalState, each initiative is looked up by its Merkle
+    hash and only initiatives that changed since the previous run are
+    re-scored; live capability checks are reused while fresh.
+    """
+
+    def __init__(self, state=None):
+        self.state = state
+        self.initiative_hashes = []
+        self.count = 0
+        # Columns, one entry per initiative: 1 where the check passed
+        self.has_capability = bytearray()      # 2. capability_id
+        self.has_stages = bytearray()          # 4. from_stage / to_stage
+        self.stage_progression = bytearray()   # 5. from_stage < to_stage
+        self.has_evidence = bytearray()        # 6. evidence_required
+        self.tasks_ok = bytearray()            # 7. every pr_plan has tasks
+        self.dependency_invalid = bytearray()  # 8. 1 where PR Plans can't be scheduled
+        self.pr_plans = array('q')             # pr_plans per initiative
+        # Row details kept only where needed: existence checks, issue messages
+        self.capability_refs = []  # (idx, capability_id) for existence checks
+        self.invalid_capability_ids = 0  # set but not a string (never looked up)
+        self.bad_stages = {}       # idx -> [from_stage, to_stage] with from_stage >= to_stage
+        # Dependency graph summary across all initiatives
+        self.graph_nodes = 0
+        self.graph_edges = 0
+        self.cycles = []
+        self.dangling = []
+        self.execution_order = []
+        self.critical_path = []
+        self.critical_path_hours = 0
+        # (issue, suggestion) per cycle / dangling depends_on
+        self.dependency_issues = []
+
+    def add(self, init):
+        if self.state is None:
+            self.add_record(score_initiative(init))
+            return
+
+        key = initiative_hash(init)
+        self.initiative_hashes.append(key)
+        record = self.state.lookup('initiatives', key)
+        if record is None:
+            record = score_initiative(init)
+            self.state.count('initiatives_rescored')
         else:
-            issues.append(f'Initiative {idx}: missing capability_id')
-            suggestions.append(f'Add capability_id to Initiative {idx}')
-    score += int(capability_score)
-
-    # 3. Validate capability_id exists in Brain DB (5 points, distributed)
-    exists_score = 0
-    for idx, init in enumerate(initiatives):
-        cap_id = init.get('capability_id')
+            self.state.count('initiatives_reused')
+        self.state.store('initiatives', key, record)
+        self.add_record(record)
+
+    def add_record(self, record):
+        """Fold one initiative's score_initiative() record in at the next index"""
+        idx = self.count
+        self.count += 1
+
+        # 2. capability_id
+        cap_id = record['capability_id']
+        self.has_capability.append(1 if cap_id else 0)
         if cap_id:
-            exists, brain_available = check_capability_exists(cap_id)
-            if exists:
-                exists_score += 5 / len(initiatives)
-            elif brain_available:
-                # Brain is up, but capability not found
-                issues.append(f'Initiative {idx}: capability_id "{cap_id}" not found in registry')
-                suggestions.append(f'Use existing capability or create proposal for "{cap_id}"')
-            else:
-                # Brain is down, cannot verify - give points but warn
-                exists_score += 5 / len(initiatives)
-                issues.append(f'Initiative {idx}: Brain API unavailable, could not verify capability_id "{cap_id}"')
-                suggestions.append('Ensure Brain service is running at localhost:5221')
-    score += int(exists_score)
-
-    # 4. Check from_stage / to_stage (5 points, distributed)
-    stage_fields_score = 0
-    for idx, init in enumerate(initiatives):
-        if init.get('from_stage') and init.get('to_stage'):
-            stage_fields_score += 5 / len(initiatives)
-        else:
-            issues.append(f'Initiative {idx}: missing from_stage or to_stage')
-            suggestions.append(f'Add from_stage and to_stage to Initiative {idx}')
-    score += int(stage_fields_score)
-
-    # 5. Check from_stage < to_stage (5 points, distributed)
-    stage_progression_score = 0
-    for idx, init in enumerate(initiatives):
-        from_s = init.get('from_stage')
-        to_s = init.get('to_stage')
-        if from_s and to_s:
-            if from_s < to_s:
-                stage_progression_score += 5 / len(initiatives)
+            self.capability_refs.append((idx, cap_id))
+            if not is_capability_id(cap_id):
+                self.invalid_capability_ids += 1
+
+        # 4. from_stage / to_stage, 5. from_stage < to_stage
+        stages = record['stages']
+        self.has_stages.append(1 if stages else 0)
+        self.stage_progression.append(1 if record['stage_ok'] else 0)
+        if stages and not record['stage_ok']:
+            self.bad_stages[idx] = stages
+
+        # 6. evidence_required
+        self.has_evidence.append(1 if record['evidence'] else 0)
+
+        # 7. pr_plans have tasks (tasks_ok is None exactly when there are none)
+        self.pr_plans.append(record['pr_plans'])
+        self.tasks_ok.append(1 if record['tasks_ok'] else 0)
+
+        # 8. pr_plans dependency graph (cycles, dangling depends_on)
+        self.dependency_invalid.append(0)
+        if record['graph']:
+            self._add_dependencies(idx, record['graph'])
+
+    def _add_dependencies(self, idx, graph):
+        self.graph_nodes += graph['nodes']
+        self.graph_edges += graph['edges']
+        self.execution_order.extend(f'{idx}:{seq}' for seq in graph['order'])
+
+        if len(graph['critical_path']) > len(self.critical_path):
+            self.critical_path = [f'{idx}:{seq}' for seq in graph['critical_path']]
+        self.critical_path_hours = max(self.critical_path_hours, graph['critical_path_weight'])
+
+        for cycle_seqs in graph['cycles']:
+            self.cycles.append({'initiative': idx, 'sequences': cycle_seqs})
+            self.dependency_issues.append((
+                f'Initiative {idx}: circular dependency between PR Plans {", ".join(map(str, cycle_seqs))}',
+                f'Remove one depends_on edge to break the cycle in Initiative {idx}'))
+        for seq, dep in graph['dangling']:
+            self.dangling.append({'initiative': idx, 'sequence': seq, 'depends_on': dep})
+            self.dependency_issues.append((
+                f'Initiative {idx}: PR Plan {seq} depends_on unknown sequence {dep}',
+                f'Point depends_on in Initiative {idx} at an existing PR Plan sequence'))
+
+        if graph['cycles'] or graph['dangling']:
+            self.dependency_invalid[idx] = 1
+
+    def _issues(self, exists_issues):
+        """(issue, suggestion) of every failing row, in check order"""
+        for idx in _rows(self.has_capability):
+            yield (f'Initiative {idx}: missing capability_id',
+                   f'Add capability_id to Initiative {idx}')
+        yield from exists_issues
+        for idx in _rows(self.has_stages):
+            yield (f'Initiative {idx}: missing from_stage or to_stage',
+                   f'Add from_stage and to_stage to Initiative {idx}')
+        for idx, (from_s, to_s) in self.bad_stages.items():
+            yield (f'Initiative {idx}: from_stage ({from_s}) must be < to_stage ({to_s})',
+                   f'Fix stage progression in Initiative {idx}')
+        for idx in _rows(self.has_evidence):
+            yield (f'Initiative {idx}: missing evidence_required',
+                   f'Add evidence_required to Initiative {idx}')
+        for idx in _rows(self.tasks_ok):
+            if self.pr_plans[idx]:
+                yield (f'Initiative {idx}: some pr_plans have no tasks',
+                       f'Add tasks to all pr_plans in Initiative {idx}')
             else:
-                issues.append(f'Initiative {idx}: from_stage ({from_s}) must be < to_stage ({to_s})')
-                suggestions.append(f'Fix stage progression in Initiative {idx}')
-    score += int(stage_progression_score)
-
-    # 6. Check evidence_required (5 points, distributed)
-    evidence_score = 0
-    for idx, init in enumerate(initiatives):
-        if init.get('evidence_required'):
-            evidence_score += 5 / len(initiatives)
+                yield (f'Initiative {idx}: no pr_plans defined',
+                       f'Decompose Initiative {idx} into 2-5 PR Plans')
+        yield from self.dependency_issues
+
+    def merkle_root(self, members):
+        """Root over the other top-level fields and every initiative hash"""
+        return node_hash([leaf_hash(members)] + self.initiative_hashes)
+
+    def _check_capabilities(self, capability_index=None):
+        """Existence of every referenced capability_id, reusing fresh live checks"""
+        cap_ids = {cap_id for _, cap_id in self.capability_refs if is_capability_id(cap_id)}
+        state = self.state
+        # Snapshot lookups are local - only live Brain results are worth keeping
+        if state is None or capability_index is not None:
+            return check_capabilities(cap_ids, capability_index)
+
+        source = brain_url()
+        now = time.time()
+        status = {}
+        for cap_id in cap_ids:
+            entry = state.lookup('capabilities', cap_id) if isinstance(cap_id, str) else None
+            if entry and entry.get('source') == source and now - entry['checked_at'] < FORM_CACHE_MAX_AGE:
+                status[cap_id] = (entry['exists'], True)
+                state.store('capabilities', cap_id, entry)
+        state.count('capabilities_reused', len(status))
+
+        changed = [cap_id for cap_id in cap_ids if cap_id not in status]
+        state.count('capabilities_checked', len(changed))
+        if changed:
+            checked = check_capabilities(changed)
+            for cap_id, (exists, brain_available) in checked.items():
+                # Unverified (Brain down) results are retried next run
+                if brain_available and isinstance(cap_id, str):
+                    state.store('capabilities', cap_id,
+                                {'exists': exists, 'source': source, 'checked_at': now})
+            status.update(checked)
+        return status
+
+    def result(self, capability_index=None):
+        """Final 3-layer form result (checks capability existence in one batch)"""
+        score = 0
+        issues = []
+        suggestions = []
+
+        # 1. Check initiatives array exists (5 points)
+        if self.count:
+            score += 5
         else:
-            issues.append(f'Initiative {idx}: missing evidence_required')
-            suggestions.append(f'Add evidence_required to Initiative {idx}')
-    score += int(evidence_score)
-
-    # 7. Check pr_plans have tasks (5 points, distributed)
-    pr_plans_tasks_score = 0
-    total_pr_plans = 0
-    for idx, init in enumerate(initiatives):
-        pr_plans = init.get('pr_plans', [])
-        total_pr_plans += len(pr_plans)
-        if pr_plans:
-            if all(len(pp.get('tasks', [])) > 0 for pp in pr_plans):
-                pr_plans_tasks_score += 5 / len(initiatives)
+            issues.append('Missing initiatives array')
+            suggestions.append('Add initiatives array with at least one initiative')
+            return {
+                'score': min(score, 40),
+                'issues': issues,
+                'suggestions': suggestions,
+                'num_pr_plans': 0,
+                'format': '3-layer'
+            }
+
+        n = self.count
+
+        # 3. Validate capability_id exists in Brain DB (5 points, distributed)
+        exists_count = len(self.capability_refs)
+        brain_available_all = True
+        exists_issues = []
+        with phase('check_capability_exists'):
+            capability_status = self._check_capabilities(capability_index)
+        # Only rows referencing a missing / unverified / invalid capability need a look
+        failing = {cap_id for cap_id, (exists, _) in capability_status.items() if not exists}
+        for idx, cap_id in (self.capability_refs if failing or self.invalid_capability_ids else ()):
+            if not is_capability_id(cap_id):
+                # A list / object / number can't name a capability
+                exists_count -= 1
+                exists_issues.append((f'Initiative {idx}: invalid capability_id {json.dumps(cap_id)} (must be a string)',
+                                      f'Set capability_id in Initiative {idx} to a capability ID string'))
+                continue
+            if cap_id not in failing:
+                continue
+            if capability_status[cap_id][1]:
+                # Brain is up, but capability not found
+                exists_count -= 1
+                exists_issues.append((f'Initiative {idx}: capability_id "{cap_id}" not found in registry',
+                                      f'Use existing capability or create proposal for "{cap_id}"'))
             else:
-                issues.append(f'Initiative {idx}: some pr_plans have no tasks')
-                suggestions.append(f'Add tasks to all pr_plans in Initiative {idx}')
-        else:
-            issues.append(f'Initiative {idx}: no pr_plans defined')
-            suggestions.append(f'Decompose Initiative {idx} into 2-5 PR Plans')
-    score += int(pr_plans_tasks_score)
+                # Brain is down, cannot verify - give points but warn
+                brain_available_all = False
+                exists_issues.append((f'Initiative {idx}: Brain API unavailable, could not verify capability_id "{cap_id}"',
+                                      f'Ensure Brain service is running at {brain_url()}'))
+
+        ten, five = _distributed_table(n, 10), _distributed_table(n, 5)
+        score += int(ten[self.has_capability.count(1)])        # 2.
+        score += int(five[exists_count])                       # 3.
+        score += int(five[self.has_stages.count(1)])           # 4.
+        score += int(five[self.stage_progression.count(1)])    # 5.
+        score += int(five[self.has_evidence.count(1)])         # 6.
+        score += int(five[self.tasks_ok.count(1)])             # 7.
+        # 8. Deduction (distributed) for initiatives whose PR Plans can't be scheduled
+        score = max(0, score - int(five[self.dependency_invalid.count(1)]))
+
+        for issue, suggestion in self._issues(exists_issues):
+            issues.append(issue)
+            suggestions.append(suggestion)
+
+        return {
+            'score': min(score, 40),
+            'max': 40,
+            'issues': issues,
+            'suggestions': suggestions,
+            'num_pr_plans': sum(self.pr_plans),
+            'num_initiatives': n,
+            'format': '3-layer',
+            'passed': score >= 32,  # 80% pass threshold
+            'brain_available': brain_available_all,
+            'dependency_graph': {
+                'nodes': self.graph_nodes,
+                'edges': self.graph_edges,
+                'cycles': self.cycles,
+                'dangling': self.dangling,
+                # "<initiative>:<sequence>", dependencies first
+                'execution_order': self.execution_order,
+                'critical_path': self.critical_path,
+                'critical_path_length': len(self.critical_path),
+                'critical_path_hours': self.critical_path_hours
+            }
+        }
 
-    return {
-        'score': min(score, 40),
-        'max': 40,
-        'issues': issues,
-        'suggestions': suggestions,
-        'num_pr_plans': total_pr_plans,
-        'num_initiatives': len(initiatives),
-        'format': '3-layer',
-        'passed': score >= 32  # 80% pass threshold
-    }
+
+def validate_3layer_format(data, capability_index=None, state=None):
+    """Validate 3-layer decomposition format (Initiatives → PR Plans → Tasks)
+
+    Phase 2: Now expects initiatives[] (plural) with capability binding
+
+    Args:
+        state: Optional IncrementalState - unchanged initiatives are not re-scored
+    """
+    scorer = InitiativeScorer(state)
+    for init in data.get('initiatives') or []:
+        scorer.add(init)
+    if state is not None:
+        state.root = scorer.merkle_root({k: v for k, v in data.items() if k != 'initiatives'})
+    return scorer.result(capability_index)
 
 
 def validate_2layer_format(data):
@@ -260,49 +558,336 @@ def validate_2layer_format(data):
     }
 
 
-def validate_okr_form(data):
+def validate_okr_form(data, capability_index=None, state=None):
     """Form validation (automated, 40 points max) - auto-detect format"""
     # Detect format
     # Phase 2: initiatives[] (plural) with capability binding
     has_initiatives = 'initiatives' in data
 
     if has_initiatives:
-        return validate_3layer_format(data)
+        return validate_3layer_format(data, capability_index, state)
     else:
         # Backward compatible: 2-layer format or old 3-layer format
         return validate_2layer_format(data)
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: validate-okr.py <output.json>")
-        print("\nExample:")
-        print("  python3 validate-okr.py output.json")
-        sys.exit(1)
+def validate_okr_form_cached(data, content_hash, use_cache=True, capability_index=None, state=None):
+    """validate_okr_form() backed by the content-addressed result cache
 
-    input_file = Path(sys.argv[1])
+    Results that depended on an unreachable Brain are never cached. On a
+    miss, state (if given) limits re-scoring to changed initiatives.
+    """
+    return _cached_form_result(content_hash, partial(validate_okr_form, data, capability_index, state),
+                               use_cache, capability_index)
 
-    if not input_file.exists():
-        print(f"❌ Error: {input_file} not found")
-        sys.exit(1)
 
-    # Read data
+def _cached_form_result(content_hash, compute, use_cache=True, capability_index=None):
+    """Return the cached form result for content_hash, or compute() and cache it"""
+    # Existence answers (and the issue text) depend on which registry was
+    # asked: the snapshot's IDs, else the Brain URL
+    if capability_index is not None:
+        ruleset = f"{RULESET_VERSION}+index:{capability_index.content_digest}"
+    else:
+        ruleset = f"{RULESET_VERSION}+brain:{brain_url()}"
+
+    cache = ResultCache() if use_cache and cache_enabled() else None
+    cache_key = ResultCache.make_key('okr', content_hash, VALIDATION_VERSION, ruleset)
+    if cache:
+        cached = cache.get(cache_key, max_age=FORM_CACHE_MAX_AGE)
+        if cached is not None:
+            return cached
+
+    form_result = compute()
+    if cache and form_result.get('brain_available', True):
+        cache.put(cache_key, form_result)
+    return form_result
+
+
+def validate_okr_stream(fp, use_cache=True, capability_index=None, state=None):
+    """Hash and form-validate an output.json without loading it whole
+
+    initiatives[] is parsed one element at a time: each initiative is scored
+    and folded into the canonical content hash as it arrives, then dropped.
+    Other top-level fields (2-layer documents entirely) are loaded as usual.
+    Scores, issues and content_hash are identical to the json.load path.
+
+    Args:
+        fp: Text file object of output.json
+        state: Optional IncrementalState - unchanged initiatives are not re-scored
+
+    Returns:
+        tuple: (form_result, content_hash)
+
+    Raises:
+        json.JSONDecodeError: Malformed JSON (or a duplicate initiatives key)
+    """
+    from cecelia_validation.jsonstream import CanonicalHash, iter_members
+
+    scorer = InitiativeScorer(state)
+    with CanonicalHash('initiatives') as hasher:
+        for kind, key, value in iter_members(fp, 'initiatives'):
+            hasher.update(kind, key, value)
+            if kind == 'item':
+                scorer.add(value)
+        content_hash = hasher.hexdigest()[:16]
+        members = hasher.members
+        streamed = hasher.has_array
+
+    if streamed:
+        if state is not None:
+            state.root = scorer.merkle_root(members)
+        # Capability lookups happen here - skipped entirely on a cache hit
+        compute = partial(scorer.result, capability_index)
+    else:
+        compute = partial(validate_okr_form, members, capability_index, state)
+    return _cached_form_result(content_hash, compute, use_cache, capability_index), content_hash
+
+
+def file_content_hash(path):
+    """content_hash of an output.json file, same value the report records
+
+    Files at or above STREAM_THRESHOLD are hashed incrementally, exactly
+    like validate_okr_stream does.
+    """
+    if Path(path).stat().st_size >= STREAM_THRESHOLD:
+        from cecelia_validation.jsonstream import CanonicalHash, iter_members
+
+        with open(path) as f, CanonicalHash('initiatives') as hasher:
+            for kind, key, value in iter_members(f, 'initiatives'):
+                hasher.update(kind, key, value)
+            return hasher.hexdigest()[:16]
+
+    with open(path) as f:
+        return calculate_content_hash(json.load(f))
+
+
+REPORT_FIELDS = ['form_score', 'content_score', 'content_breakdown', 'total', 'passed',
+                 'content_hash', 'timestamp']
+BREAKDOWN_FIELDS = ['title_quality', 'description_quality', 'kr_feature_mapping', 'completeness']
+BREAKDOWN_MAX = 15
+PASS_THRESHOLD = 90
+
+
+def _as_score(value):
+    """Integer score or None (bools and fractional numbers are not scores)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return None
+
+
+def _show(value):
+    """Render a report value the way `jq -r` does"""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def verify_report(input_file, report_file):
+    """Stop Hook verification of an AI-completed validation report
+
+    Structure, content_breakdown fields, content hash, score arithmetic,
+    ranges and pass threshold - everything hooks/stop-okr.sh checks except
+    the git-based ones (repository, script integrity), which the hook runs
+    before starting this process.
+
+    Args:
+        input_file: output.json
+        report_file: validation-report.json
+
+    Returns:
+        int: Exit code (0 = verified, 2 = block)
+    """
+    # Check 2: Required files exist
+    if not report_file.is_file():
+        print("❌ No validation-report.json found")
+        print("   Run: python3 ~/.claude/skills/okr/scripts/validate-okr.py output.json")
+        return 2
+
+    if not input_file.is_file():
+        print("❌ No output.json found")
+        print("   Generate OKR output first")
+        return 2
+
     try:
-        with open(input_file) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        with open(report_file) as f:
+            report = json.load(f)
+    except ValueError:
+        report = None
+    if not isinstance(report, dict):
+        report = {}
+
+    # Check 3: Report structure complete
+    for field in REPORT_FIELDS:
+        if report.get(field) is None:
+            print(f"❌ Missing field in validation report: {field}")
+            print("   Re-run: python3 validate-okr.py output.json")
+            return 2
+
+    # Check 4: Content breakdown structure
+    breakdown = report['content_breakdown']
+    if not isinstance(breakdown, dict):
+        breakdown = {}
+    for field in BREAKDOWN_FIELDS:
+        if breakdown.get(field) is None:
+            print(f"❌ Missing content breakdown field: {field}")
+            print("   AI must fill all content_breakdown fields")
+            return 2
+
+    # Check 5: Content hash integrity (CRITICAL - prevents score tampering)
+    report_hash = _show(report['content_hash'])
+    try:
+        actual_hash = file_content_hash(input_file)
+    except ValueError as e:
         print(f"❌ Error: Invalid JSON in {input_file}")
         print(f"   {e}")
-        sys.exit(1)
+        return 2
+
+    if report_hash != actual_hash:
+        print("❌ ANTI-CHEAT: Content hash mismatch!")
+        print("")
+        print(f"   Report hash:  {report_hash}")
+        print(f"   Actual hash:  {actual_hash}")
+        print("")
+        print("   This means validation-report.json is out of sync with output.json")
+        print("   Likely causes:")
+        print("   - Scores were changed without re-running validation")
+        print("   - output.json was modified after validation")
+        print("   - Old validation report was copied")
+        print("")
+        print("   Fix: Improve output.json and re-run validation")
+        print("        python3 ~/.claude/skills/okr/scripts/validate-okr.py output.json")
+        return 2
+
+    # Scores must be integers before any arithmetic
+    scores = {}
+    for field, limit in (('form_score', 40), ('content_score', 60), ('total', 100)):
+        scores[field] = _as_score(report[field])
+        if scores[field] is None:
+            print(f"❌ ANTI-CHEAT: Invalid {field}")
+            print(f"   Score: {_show(report[field])} (must be 0-{limit})")
+            return 2
+    breakdown_scores = {}
+    for field, value in breakdown.items():
+        breakdown_scores[field] = _as_score(value)
+        if breakdown_scores[field] is None:
+            print(f"❌ ANTI-CHEAT: Invalid score for {field}")
+            print("")
+            print(f"   Score: {_show(value)} (must be 0-{BREAKDOWN_MAX})")
+            print("")
+            print(f"   Fix: Adjust {field} to valid range")
+            return 2
+    form, content, total = scores['form_score'], scores['content_score'], scores['total']
+
+    # Check 7: Score calculation correctness
+    expected = form + content
+    if total != expected:
+        print("❌ ANTI-CHEAT: Score calculation error!")
+        print("")
+        print(f"   form_score ({form}) + content_score ({content}) = {expected}")
+        print(f"   But total = {total}")
+        print("")
+        print("   Fix: Update total = form_score + content_score")
+        return 2
+
+    # Check 8: Content breakdown sum matches content_score
+    breakdown_sum = sum(breakdown_scores.values())
+    if breakdown_sum != content:
+        print("❌ ANTI-CHEAT: Content breakdown sum mismatch!")
+        print("")
+        print(f"   Breakdown sum: {breakdown_sum}")
+        print(f"   Content score: {content}")
+        print("")
+        print("   The breakdown items must add up to content_score")
+        print("")
+        print("   Fix: Adjust content_breakdown or content_score")
+        return 2
+
+    # Check 9: Individual scores within valid ranges
+    for field in BREAKDOWN_FIELDS:
+        score = breakdown_scores[field]
+        if score > BREAKDOWN_MAX or score < 0:
+            print(f"❌ ANTI-CHEAT: Invalid score for {field}")
+            print("")
+            print(f"   Score: {score} (must be 0-{BREAKDOWN_MAX})")
+            print("")
+            print(f"   Fix: Adjust {field} to valid range")
+            return 2
+
+    if form > 40 or form < 0:
+        print("❌ ANTI-CHEAT: Invalid form_score")
+        print(f"   Score: {form} (must be 0-40)")
+        return 2
+
+    if content > 60 or content < 0:
+        print("❌ ANTI-CHEAT: Invalid content_score")
+        print(f"   Score: {content} (must be 0-60)")
+        return 2
 
-    # Form validation
-    form_result = validate_okr_form(data)
+    # Check 10: Passing criteria
+    if report['passed'] is not True:
+        print("❌ Validation not passed")
+        print("")
+        print(f"   Current score: {total}/100 (need >= {PASS_THRESHOLD})")
+        print("")
 
-    # Calculate content hash
-    content_hash = calculate_content_hash(data)
+        issues = report.get('issues') or []
+        if issues:
+            print("   Form issues:")
+            for issue in issues:
+                for line in _show(issue).split('\n'):
+                    print(f"     - {line}")
+            print("")
 
-    # Generate report (content_score to be filled by AI)
-    report = {
+        print("   Continue to improve output.json and re-validate")
+        return 2
+
+    if total < PASS_THRESHOLD:
+        print("❌ Score below threshold")
+        print("")
+        print(f"   Total: {total} < {PASS_THRESHOLD}")
+        print("   But passed = true (inconsistent)")
+        print("")
+        print("   Fix: Set passed = false or improve score")
+        return 2
+
+    print("")
+    print("✅ All anti-cheat checks passed")
+    print("")
+    print("   Validation Summary:")
+    print(f"   ├─ Form score:       {form}/40")
+    print(f"   ├─ Content score:    {content}/60")
+    print(f"   │  ├─ Title:         {breakdown_scores['title_quality']}/15")
+    print(f"   │  ├─ Description:   {breakdown_scores['description_quality']}/15")
+    print(f"   │  ├─ KR Mapping:    {breakdown_scores['kr_feature_mapping']}/15")
+    print(f"   │  └─ Completeness:  {breakdown_scores['completeness']}/15")
+    print(f"   ├─ Total:            {total}/100")
+    print(f"   └─ Hash:             {report_hash} (verified)")
+    print("")
+    print("✅ OKR decomposition complete and validated")
+    return 0
+
+
+def incremental_summary(state):
+    """Re-scored/reused counts and Merkle root of this run (None if nothing was scored)"""
+    if state is None or state.root is None:
+        return None
+    return {
+        'merkle_root': state.root,
+        'initiatives_rescored': state.stats.get('initiatives_rescored', 0),
+        'initiatives_reused': state.stats.get('initiatives_reused', 0),
+        'capabilities_checked': state.stats.get('capabilities_checked', 0),
+        'capabilities_reused': state.stats.get('capabilities_reused', 0)
+    }
+
+
+def build_report(form_result, content_hash, state=None, capability_index=None):
+    """Validation report of a form result (content_score to be filled by AI)
+
+    Shared by main() and the in-process API (cecelia_validation.api).
+    """
+    return {
         'form_score': form_result['score'],
         'content_score': 0,  # AI self-assessment (0-60)
         'content_breakdown': {
@@ -320,14 +905,108 @@ def main():
         'format': form_result.get('format', 'unknown'),
         'details': {
             'num_features': form_result.get('num_features', 0),
-            'num_pr_plans': form_result.get('num_pr_plans', 0)
-        }
+            'num_pr_plans': form_result.get('num_pr_plans', 0),
+            # 3-layer only: cycles, dangling depends_on, execution order, critical path
+            'dependency_graph': form_result.get('dependency_graph'),
+            # 3-layer only: what this run re-scored vs reused from the previous one
+            'incremental': incremental_summary(state)
+        },
+        # Which registry snapshot capability_ids were checked against (None = live Brain)
+        'capability_index': capability_index.describe() if capability_index is not None else None
     }
 
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: validate-okr.py <output.json>")
+        print("\nExample:")
+        print("  python3 validate-okr.py output.json")
+        sys.exit(1)
+
+    parser = argparse.ArgumentParser(description='OKR validation with anti-cheat')
+    parser.add_argument('input_file', help='OKR output.json')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always rescore (skip the content-addressed result cache)')
+    parser.add_argument('--capability-index', metavar='FILE',
+                        help='Check capability_ids against an offline registry snapshot '
+                             '(see refresh-capability-index.py) instead of the Brain API')
+    parser.add_argument('--stream', action='store_true',
+                        help='Parse initiatives[] incrementally - memory bounded by one initiative '
+                             f'(automatic for files >= {STREAM_THRESHOLD // (1024 * 1024)}MB)')
+    parser.add_argument('--verify-report', nargs='?', const='', metavar='REPORT',
+                        help='Stop Hook check: verify an AI-completed validation-report.json '
+                             'against input_file (exit 0 verified, 2 block)')
+    parser.add_argument('--timings', action='store_true',
+                        help='Record per-phase wall/CPU time in the report and the Prometheus textfile '
+                             '(also CECELIA_VALIDATION_TIMINGS=1)')
+    args = parser.parse_args()
+
+    input_file = Path(args.input_file)
+
+    if args.verify_report is not None:
+        report_file = Path(args.verify_report) if args.verify_report \
+            else input_file.parent / 'validation-report.json'
+        sys.exit(verify_report(input_file, report_file))
+
+    capability_index = None
+    if args.capability_index:
+        try:
+            capability_index = CapabilityIndex.load(args.capability_index)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: Cannot load capability index {args.capability_index}")
+            print(f"   {e}")
+            sys.exit(1)
+
+    if not input_file.exists():
+        print(f"❌ Error: {input_file} not found")
+        sys.exit(1)
+
+    stream = args.stream or input_file.stat().st_size >= STREAM_THRESHOLD
+
+    # Per-initiative Merkle state of the previous run of this file
+    state = None
+    if not args.no_cache and cache_enabled():
+        state = IncrementalState.load(state_path(input_file), f"{VALIDATION_VERSION}+{RULESET_VERSION}")
+
+    timings = Timings() if timings_enabled(args.timings) else None
+    with recording(timings):
+        try:
+            with open(input_file) as f:
+                if stream:
+                    # Parsing and hashing happen inside the streamed form validation
+                    with phase('validate_form'):
+                        form_result, content_hash = validate_okr_stream(
+                            f, use_cache=not args.no_cache, capability_index=capability_index,
+                            state=state)
+                else:
+                    with phase('load'):
+                        data = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"❌ Error: Invalid JSON in {input_file}")
+            print(f"   {e}")
+            sys.exit(1)
+
+        if not stream:
+            # Calculate content hash
+            with phase('hash'):
+                content_hash = calculate_content_hash(data)
+
+            # Form validation (served from cache when content is unchanged)
+            with phase('validate_form'):
+                form_result = validate_okr_form_cached(data, content_hash, use_cache=not args.no_cache,
+                                                       capability_index=capability_index, state=state)
+
+    if state is not None and state.dirty:
+        state.save()
+
+    report = build_report(form_result, content_hash, state, capability_index)
+
     # Save report
     report_file = input_file.parent / 'validation-report.json'
-    with open(report_file, 'w') as f:
-        json.dump(report, indent=2, fp=f)
+    write_report(report_file, report, timings, indent=2)
+    if timings:
+        export_timings('okr', report['passed'], timings)
+    record_reports('okr', [(input_file, report)], VALIDATION_VERSION, RULESET_VERSION)
 
     # Output results
     print(f"\n{'='*60}")
@@ -337,6 +1016,18 @@ def main():
     print(f"  Content score:    {report['content_score']}/60 (AI to fill)")
     print(f"  Total:            {report['total']}/100")
     print(f"  Content hash:     {content_hash}")
+    graph = report['details']['dependency_graph']
+    if graph:
+        print(f"  Critical path:    {graph['critical_path_length']} PR Plans "
+              f"({graph['critical_path_hours']}h), {len(graph['cycles'])} cycle(s)")
+    if capability_index is not None:
+        print(f"  Capability index: {capability_index.version} ({len(capability_index)} ids)")
+    incremental = report['details']['incremental']
+    if incremental:
+        print(f"  Incremental:      {incremental['initiatives_rescored']} initiative(s) re-scored, "
+              f"{incremental['initiatives_reused']} reused")
+    if timings:
+        print(f"  Timings:          {timings.summary()}")
     print(f"  Timestamp:        {report['timestamp']}")
     print(f"{'='*60}")
 
@@ -25,6 +25,46 @@ echo "Running: test-cheating-prevention.sh"
 bash "$SCRIPT_DIR/test-cheating-prevention.sh"
 echo ""
 
+# Test 4: Capability lookups against a Brain stub
+echo "Running: test-capability-lookup.sh"
+bash "$SCRIPT_DIR/test-capability-lookup.sh"
+echo ""
+
+# Test 5: Offline capability index
+echo "Running: test-capability-index.sh"
+bash "$SCRIPT_DIR/test-capability-index.sh"
+echo ""
+
+# Test 6: Streaming validation of large output.json
+echo "Running: test-okr-streaming.sh"
+bash "$SCRIPT_DIR/test-okr-streaming.sh"
+echo ""
+
+# Test 7: PR Plan dependency graph
+echo "Running: test-okr-dependency-graph.sh"
+bash "$SCRIPT_DIR/test-okr-dependency-graph.sh"
+echo ""
+
+# Test 8: Stop Hook verification in one process
+echo "Running: test-okr-verify-report.sh"
+bash "$SCRIPT_DIR/test-okr-verify-report.sh"
+echo ""
+
+# Test 9: Incremental re-validation
+echo "Running: test-okr-incremental.sh"
+bash "$SCRIPT_DIR/test-okr-incremental.sh"
+echo ""
+
+# Test 10: Bulk loader against a Brain/Tasks stub
+echo "Running: test-store-to-database.sh"
+bash "$SCRIPT_DIR/test-store-to-database.sh"
+echo ""
+
+# Test 11: Columnar initiative scoring
+echo "Running: test-okr-columnar.sh"
+bash "$SCRIPT_DIR/test-okr-columnar.sh"
+echo ""
+
 echo "======================================"
 echo "  ✅ ALL TESTS PASSED"
 echo "======================================"
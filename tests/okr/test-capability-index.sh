@@ -0,0 +1,156 @@
+#!/bin/bash
+# Test offline capability index (refresh-capability-index.py + --capability-index)
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+REFRESH_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/refresh-capability-index.py"
+TEST_DIR=$(mktemp -d)
+STUB_PID=""
+
+cleanup() {
+    [ -n "$STUB_PID" ] && kill "$STUB_PID" 2>/dev/null || true
+    rm -rf "$TEST_DIR"
+}
+trap cleanup EXIT
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Testing offline capability index ==="
+echo ""
+
+# Stub Brain exporting two capabilities
+cat > "$TEST_DIR/stub.py" << 'EOF'
+import json, sys
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({'capabilities': [{'id': 'cap-b'}, {'id': 'cap-a'}]}).encode()
+        self.send_response(200 if self.path == '/api/brain/capabilities' else 404)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+server = HTTPServer(('127.0.0.1', 0), Handler)
+with open(sys.argv[1], 'w') as f:
+    f.write(str(server.server_address[1]))
+server.serve_forever()
+EOF
+
+python3 "$TEST_DIR/stub.py" "$TEST_DIR/port" &
+STUB_PID=$!
+for _ in $(seq 1 50); do
+    [ -s "$TEST_DIR/port" ] && break
+    sleep 0.1
+done
+PORT=$(cat "$TEST_DIR/port")
+
+cd "$TEST_DIR"
+
+# Test 1: Refresh writes a sorted snapshot with a version header
+echo "Test 1: Refresh snapshot from Brain"
+BRAIN_URL="http://127.0.0.1:$PORT" python3 "$REFRESH_SCRIPT" index.txt > /dev/null
+if head -1 index.txt | grep -q '^# cecelia-capability-index v1$' && \
+   [ "$(grep -v '^#' index.txt | tr '\n' ' ')" = "cap-a cap-b " ]; then
+    echo "   ✅ PASS: Snapshot written"
+else
+    echo "   ❌ FAIL: Unexpected snapshot"
+    cat index.txt
+    exit 1
+fi
+VERSION=$(grep '^# version:' index.txt | awk '{print $3}')
+
+kill "$STUB_PID" 2>/dev/null || true
+wait "$STUB_PID" 2>/dev/null || true
+STUB_PID=""
+
+# Test 2: Validation uses the snapshot - no network needed
+echo ""
+echo "Test 2: Offline validation against snapshot"
+cat > output.json << 'EOF'
+{
+  "initiatives": [
+    {"capability_id": "cap-a", "from_stage": 1, "to_stage": 2, "evidence_required": "e",
+     "pr_plans": [{"title": "p", "tasks": [{"title": "t"}]}]},
+    {"capability_id": "cap-x", "from_stage": 1, "to_stage": 2, "evidence_required": "e",
+     "pr_plans": [{"title": "p", "tasks": [{"title": "t"}]}]}
+  ]
+}
+EOF
+BRAIN_URL="http://127.0.0.1:$PORT" python3 "$VALIDATE_SCRIPT" output.json --capability-index index.txt > /dev/null 2>&1 || true
+
+UNAVAILABLE=$(jq '[.issues[] | select(contains("Brain API unavailable"))] | length' validation-report.json)
+MISSING=$(jq -r '.issues[] | select(contains("not found in registry"))' validation-report.json)
+REPORT_VERSION=$(jq -r '.capability_index.version' validation-report.json)
+
+if [ "$UNAVAILABLE" -ne 0 ]; then
+    echo "   ❌ FAIL: Validation still contacted Brain"
+    exit 1
+fi
+if ! echo "$MISSING" | grep -q 'cap-x'; then
+    echo "   ❌ FAIL: cap-x should be reported missing"
+    exit 1
+fi
+if [ "$REPORT_VERSION" != "$VERSION" ]; then
+    echo "   ❌ FAIL: Report snapshot version $REPORT_VERSION != $VERSION"
+    exit 1
+fi
+echo "   ✅ PASS: Checked offline against snapshot $VERSION"
+
+# Test 3: Invalid snapshot is rejected
+echo ""
+echo "Test 3: Invalid snapshot rejected"
+echo "not an index" > bad.txt
+if python3 "$VALIDATE_SCRIPT" output.json --capability-index bad.txt > /dev/null 2>&1; then
+    echo "   ❌ FAIL: Invalid snapshot accepted"
+    exit 1
+fi
+echo "   ✅ PASS: Invalid snapshot rejected"
+
+# Test 4: An empty snapshot is still a snapshot - recorded, and every ID is missing
+echo ""
+echo "Test 4: Empty snapshot"
+printf '# cecelia-capability-index v1\n# version: empty0000\n' > empty.txt
+OUTPUT=$(python3 "$VALIDATE_SCRIPT" output.json --capability-index empty.txt 2>&1 || true)
+REPORT_VERSION=$(jq -r '.capability_index.version' validation-report.json)
+MISSING=$(jq '[.issues[] | select(contains("not found in registry"))] | length' validation-report.json)
+UNAVAILABLE=$(jq '[.issues[] | select(contains("Brain API unavailable"))] | length' validation-report.json)
+if [ "$REPORT_VERSION" != "empty0000" ]; then
+    echo "   ❌ FAIL: Report snapshot version $REPORT_VERSION != empty0000"
+    exit 1
+fi
+if ! echo "$OUTPUT" | grep -q 'Capability index: empty0000 (0 ids)'; then
+    echo "   ❌ FAIL: Snapshot line not printed"
+    exit 1
+fi
+if [ "$MISSING" -ne 2 ] || [ "$UNAVAILABLE" -ne 0 ]; then
+    echo "   ❌ FAIL: Expected 2 missing, 0 unavailable (got $MISSING, $UNAVAILABLE)"
+    exit 1
+fi
+echo "   ✅ PASS: Empty snapshot recorded and used"
+
+# Test 5: Cached results are keyed on the snapshot contents, not its version header
+echo ""
+echo "Test 5: Result cache keyed on snapshot contents"
+# Same (hand-edited) version header, different IDs
+printf '# cecelia-capability-index v1\n# version: v1\ncap-a\n' > edited-a.txt
+printf '# cecelia-capability-index v1\n# version: v1\ncap-a\ncap-x\n' > edited-ax.txt
+export CECELIA_VALIDATION_CACHE=1 CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+python3 "$VALIDATE_SCRIPT" output.json --capability-index edited-a.txt > /dev/null 2>&1 || true
+FIRST=$(jq '[.issues[] | select(contains("not found in registry"))] | length' validation-report.json)
+python3 "$VALIDATE_SCRIPT" output.json --capability-index edited-ax.txt > /dev/null 2>&1 || true
+SECOND=$(jq '[.issues[] | select(contains("not found in registry"))] | length' validation-report.json)
+export CECELIA_VALIDATION_CACHE=0
+if [ "$FIRST" != "1" ] || [ "$SECOND" != "0" ]; then
+    echo "   ❌ FAIL: Expected 1 then 0 missing IDs (got $FIRST, $SECOND)"
+    exit 1
+fi
+echo "   ✅ PASS: A different snapshot misses the cache"
+
+echo ""
+echo "=== All capability index tests PASSED ==="
@@ -0,0 +1,179 @@
+#!/bin/bash
+# Test validate-okr.py capability lookups against a local Brain stub
+# Tests: deduplication, concurrency, circuit breaker
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR=$(mktemp -d)
+STUB_PID=""
+
+cleanup() {
+    [ -n "$STUB_PID" ] && kill "$STUB_PID" 2>/dev/null || true
+    rm -rf "$TEST_DIR"
+}
+trap cleanup EXIT
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Testing validate-okr.py capability lookups ==="
+echo ""
+
+# Stub Brain: 0.5s per request, capabilities named cap-ok-* exist
+cat > "$TEST_DIR/stub.py" << 'EOF'
+import json, sys, time, threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+hits = []
+lock = threading.Lock()
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/_hits':
+            body = json.dumps(hits).encode()
+        else:
+            with lock:
+                hits.append(self.path)
+            time.sleep(0.5)
+            cap_id = self.path.rsplit('/', 1)[-1]
+            status = 200 if cap_id.startswith('cap-ok-') else 404
+            body = json.dumps({'id': cap_id}).encode()
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+with open(sys.argv[1], 'w') as f:
+    f.write(str(server.server_address[1]))
+server.serve_forever()
+EOF
+
+python3 "$TEST_DIR/stub.py" "$TEST_DIR/port" &
+STUB_PID=$!
+for _ in $(seq 1 50); do
+    [ -s "$TEST_DIR/port" ] && break
+    sleep 0.1
+done
+PORT=$(cat "$TEST_DIR/port")
+
+# 16 initiatives, 8 distinct capability_ids (7 exist, 1 missing)
+python3 - "$TEST_DIR/output.json" << 'EOF'
+import json, sys
+caps = [f'cap-ok-{i}' for i in range(7)] + ['cap-missing']
+initiatives = [{
+    'capability_id': caps[i % len(caps)],
+    'from_stage': 1, 'to_stage': 2,
+    'evidence_required': 'tests pass',
+    'pr_plans': [{'title': 'p', 'tasks': [{'title': 't'}]}]
+} for i in range(16)]
+json.dump({'initiatives': initiatives}, open(sys.argv[1], 'w'))
+EOF
+
+cd "$TEST_DIR"
+
+# Test 1: Deduplicated + concurrent
+echo "Test 1: Lookups deduplicated and concurrent"
+START=$(date +%s%3N)
+BRAIN_URL="http://127.0.0.1:$PORT" python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+ELAPSED=$(( $(date +%s%3N) - START ))
+HITS=$(curl -s "http://127.0.0.1:$PORT/_hits" | jq 'length')
+
+if [ "$HITS" -ne 8 ]; then
+    echo "   ❌ FAIL: Expected 8 Brain requests (one per distinct id), got $HITS"
+    exit 1
+fi
+# Sequential would take 8 x 0.5s = 4s
+if [ "$ELAPSED" -ge 3000 ]; then
+    echo "   ❌ FAIL: Lookups not concurrent (${ELAPSED}ms)"
+    exit 1
+fi
+MISSING=$(jq '[.issues[] | select(contains("not found in registry"))] | length' validation-report.json)
+if [ "$MISSING" -ne 2 ]; then
+    echo "   ❌ FAIL: Expected 2 'not found' issues, got $MISSING"
+    exit 1
+fi
+echo "   ✅ PASS: 8 requests for 16 initiatives in ${ELAPSED}ms"
+
+# Test 2: A result cached against one Brain is not served for another
+echo ""
+echo "Test 2: Result cache keyed on the Brain URL"
+export CECELIA_VALIDATION_CACHE=1 CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+BRAIN_URL="http://127.0.0.1:$PORT" python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+FIRST=$(jq '[.issues[] | select(contains("not found in registry"))] | length' validation-report.json)
+# Nothing listens on port 1 - every lookup is unavailable
+BRAIN_URL="http://127.0.0.1:1" python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+MISSING=$(jq '[.issues[] | select(contains("not found in registry"))] | length' validation-report.json)
+UNAVAILABLE=$(jq '[.issues[] | select(contains("Brain API unavailable"))] | length' validation-report.json)
+export CECELIA_VALIDATION_CACHE=0
+if [ "$FIRST" = "0" ] || [ "$MISSING" != "0" ] || [ "$UNAVAILABLE" = "0" ]; then
+    echo "   ❌ FAIL: Second Brain got the first one's result ($FIRST, $MISSING missing, $UNAVAILABLE unavailable)"
+    exit 1
+fi
+echo "   ✅ PASS: Other Brain URL misses the cache"
+
+# Test 3: Circuit breaker on unreachable Brain
+echo ""
+echo "Test 3: Unreachable Brain fails fast"
+kill "$STUB_PID" 2>/dev/null || true
+wait "$STUB_PID" 2>/dev/null || true
+STUB_PID=""
+
+START=$(date +%s%3N)
+BRAIN_URL="http://127.0.0.1:$PORT" python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+ELAPSED=$(( $(date +%s%3N) - START ))
+UNAVAILABLE=$(jq '[.issues[] | select(contains("Brain API unavailable"))] | length' validation-report.json)
+
+if [ "$UNAVAILABLE" -ne 16 ]; then
+    echo "   ❌ FAIL: Expected 16 'Brain API unavailable' issues, got $UNAVAILABLE"
+    exit 1
+fi
+if [ "$ELAPSED" -ge 2000 ]; then
+    echo "   ❌ FAIL: Unreachable Brain took ${ELAPSED}ms"
+    exit 1
+fi
+echo "   ✅ PASS: All lookups failed open in ${ELAPSED}ms"
+
+# Test 4: Non-string capability_ids are reported invalid, not looked up
+echo ""
+echo "Test 4: Non-string capability_ids"
+cat > invalid.json << 'EOF2'
+{"objective": "O", "initiatives": [
+  {"capability_id": ["x"], "from_stage": 1, "to_stage": 2, "evidence_required": "e",
+   "pr_plans": [{"title": "p", "tasks": [{"title": "t"}]}]},
+  {"capability_id": {"id": "x"}, "from_stage": 1, "to_stage": 2},
+  {"capability_id": 7, "from_stage": 1, "to_stage": 2}
+]}
+EOF2
+printf '# cecelia-capability-index v1\nx\n' > index.txt
+for mode in live index stream; do
+    case $mode in
+        live) ARGS=() ;;
+        index) ARGS=(--capability-index index.txt) ;;
+        stream) ARGS=(--stream --capability-index index.txt) ;;
+    esac
+    CODE=0
+    BRAIN_URL="http://127.0.0.1:$PORT" python3 "$VALIDATE_SCRIPT" invalid.json --no-cache "${ARGS[@]}" \
+        > out.txt 2>&1 || CODE=$?
+    INVALID=$(jq '[.issues[] | select(contains("invalid capability_id"))] | length' validation-report.json 2>/dev/null || echo none)
+    if [ "$CODE" != "1" ] || grep -q Traceback out.txt || [ "$INVALID" != "3" ]; then
+        echo "   ❌ FAIL ($mode): exit $CODE, $INVALID invalid capability_id issues"
+        cat out.txt
+        exit 1
+    fi
+done
+echo "   ✅ PASS: Reported invalid (live, --capability-index, --stream), verdict \"not passed\""
+
+echo ""
+echo "=== All capability lookup tests PASSED ==="
@@ -0,0 +1,156 @@
+#!/bin/bash
+# Test columnar initiative scoring (distributed sub-scores, failing-row issues, 100k initiatives)
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+export CECELIA_VALIDATION_CACHE=0
+export PYTHONPATH="$ENGINE_ROOT/skills/dev/scripts"
+
+echo "=== Testing columnar OKR initiative scoring ==="
+echo ""
+
+cd "$TEST_DIR"
+
+python3 - << 'PY'
+import json
+import random
+
+caps = [f"cap-{i}" for i in range(50)]
+with open('index.txt', 'w') as f:
+    f.write('# cecelia-capability-index v1\n' + '\n'.join(sorted(caps[:40])) + '\n')
+
+
+def initiative(rnd, i):
+    init = {"title": f"Initiative {i}"}
+    if rnd.random() < 0.9:
+        init["capability_id"] = rnd.choice(caps)
+    if rnd.random() < 0.9:
+        init["from_stage"] = rnd.randint(1, 4)
+    if rnd.random() < 0.9:
+        init["to_stage"] = rnd.randint(1, 4)
+    if rnd.random() < 0.9:
+        init["evidence_required"] = "demo"
+    if rnd.random() < 0.9:
+        init["pr_plans"] = [{"title": f"PR {j}", "sequence": j + 1,
+                             "tasks": [{"title": "t"}] * rnd.randint(0, 2)}
+                            for j in range(rnd.randint(1, 3))]
+    return init
+
+
+rnd = random.Random(25)
+# Sizes where float running totals land just below / above whole points
+for n in (1, 3, 6, 7, 10, 30, 49, 98, 333, 1000):
+    json.dump({"objective": "O", "initiatives": [initiative(rnd, i) for i in range(n)]},
+              open(f'small-{n}.json', 'w'))
+json.dump({"objective": "O", "initiatives": [initiative(rnd, i) for i in range(100000)]},
+          open('large.json', 'w'))
+PY
+
+# Reference: the per-initiative running totals the columns must reproduce
+cat > reference.py << 'PY'
+def reference(data, index):
+    inits = data['initiatives']
+    n = len(inits)
+    score = 5
+    totals = [0] * 6
+    shares = [10 / n] + [5 / n] * 5
+    issues = [[] for _ in range(6)]
+    for idx, init in enumerate(inits):
+        passed = [False] * 6
+        cap = init.get('capability_id')
+        if cap:
+            passed[0] = True
+            passed[1] = cap in index
+            if not passed[1]:
+                issues[1].append(f'Initiative {idx}: capability_id "{cap}" not found in registry')
+        else:
+            issues[0].append(f'Initiative {idx}: missing capability_id')
+        from_s, to_s = init.get('from_stage'), init.get('to_stage')
+        if from_s and to_s:
+            passed[2] = True
+            passed[3] = from_s < to_s
+            if not passed[3]:
+                issues[3].append(f'Initiative {idx}: from_stage ({from_s}) must be < to_stage ({to_s})')
+        else:
+            issues[2].append(f'Initiative {idx}: missing from_stage or to_stage')
+        passed[4] = bool(init.get('evidence_required'))
+        if not passed[4]:
+            issues[4].append(f'Initiative {idx}: missing evidence_required')
+        plans = init.get('pr_plans', [])
+        passed[5] = bool(plans) and all(p.get('tasks') for p in plans)
+        if not plans:
+            issues[5].append(f'Initiative {idx}: no pr_plans defined')
+        elif not passed[5]:
+            issues[5].append(f'Initiative {idx}: some pr_plans have no tasks')
+        for check in range(6):
+            if passed[check]:
+                totals[check] += shares[check]
+    score += sum(int(total) for total in totals)
+    return min(score, 40), [issue for group in issues for issue in group]
+PY
+
+# Test 1: Scores and issues match per-initiative running totals
+echo "Test 1: Distributed sub-scores match per-initiative running totals"
+RESULT=$(python3 - "$VALIDATE_SCRIPT" << 'PY'
+import json, subprocess, sys
+from cecelia_validation.capabilities import CapabilityIndex
+from reference import reference
+index = CapabilityIndex.load('index.txt')
+bad = 0
+for n in (1, 3, 6, 7, 10, 30, 49, 98, 333, 1000):
+    subprocess.run([sys.executable, sys.argv[1], f'small-{n}.json', '--capability-index', 'index.txt'],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    report = json.load(open('validation-report.json'))
+    score, issues = reference(json.load(open(f'small-{n}.json')), index)
+    if report['form_score'] != score or report['issues'] != issues:
+        bad += 1
+print(bad)
+PY
+)
+if [ "$RESULT" = "0" ]; then
+    echo "   ✅ PASS: Same form_score and issues for all document sizes"
+else
+    echo "   ❌ FAIL: $RESULT documents differ"
+    exit 1
+fi
+
+# Test 2: 100k initiatives - same result, issues only for failing rows, fast scoring
+echo ""
+echo "Test 2: 100k initiatives"
+RESULT=$(python3 << 'PY'
+import json, time
+from cecelia_validation import validate_okr
+from cecelia_validation.capabilities import CapabilityIndex
+from reference import reference
+
+data = json.load(open('large.json'))
+index = CapabilityIndex.load('index.txt')
+started = time.perf_counter()
+report = validate_okr(data, 'large.json', capability_index=index)
+elapsed = time.perf_counter() - started
+score, issues = reference(data, index)
+print(report.form_score == score, report.issues == issues, len(issues) > 0, f'{elapsed:.2f}')
+PY
+)
+read -r SAME_SCORE SAME_ISSUES HAS_ISSUES ELAPSED <<< "$RESULT"
+echo "   100k initiatives scored in ${ELAPSED}s"
+if [ "$SAME_SCORE $SAME_ISSUES $HAS_ISSUES" = "True True True" ]; then
+    echo "   ✅ PASS: Same score and issues (one per failing row and check)"
+else
+    echo "   ❌ FAIL: $RESULT"
+    exit 1
+fi
+if python3 -c "import sys; sys.exit(0 if float('$ELAPSED') < 10 else 1)"; then
+    echo "   ✅ PASS: Scored within 10s"
+else
+    echo "   ❌ FAIL: Took ${ELAPSED}s"
+    exit 1
+fi
+
+echo ""
+echo "✅ All columnar scoring tests passed"
@@ -0,0 +1,94 @@
+#!/bin/bash
+# Test PR Plan dependency-graph analysis in validate-okr.py
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Testing PR Plan dependency graph ==="
+echo ""
+
+cd "$TEST_DIR"
+printf '# cecelia-capability-index v1\ncap-a\n' > index.txt
+
+plan() {
+    # plan <sequence> <depends_on json> <hours>
+    echo "{\"title\": \"PR $1\", \"sequence\": $1, \"depends_on\": $2, \"estimated_hours\": $3, \"tasks\": [{\"title\": \"t\"}]}"
+}
+
+initiative() {
+    echo "{\"capability_id\": \"cap-a\", \"from_stage\": 1, \"to_stage\": 2, \"evidence_required\": \"e\", \"pr_plans\": [$1]}"
+}
+
+# Test 1: Diamond - execution order and critical path
+echo "Test 1: Execution order and critical path"
+echo "{\"initiatives\": [$(initiative "$(plan 1 '[]' 4), $(plan 2 '[1]' 8), $(plan 3 '[1]' 2), $(plan 4 '[2, 3]' 1)")]}" > output.json
+python3 "$VALIDATE_SCRIPT" output.json --capability-index index.txt > /dev/null 2>&1 || true
+ORDER=$(jq -c '.details.dependency_graph.execution_order' validation-report.json)
+CRITICAL=$(jq -c '.details.dependency_graph.critical_path' validation-report.json)
+HOURS=$(jq '.details.dependency_graph.critical_path_hours' validation-report.json)
+SCORE=$(jq '.form_score' validation-report.json)
+if [ "$ORDER" = '["0:1","0:2","0:3","0:4"]' ] && [ "$HOURS" = "13" ] && \
+   [ "$(jq 'length' <<< "$CRITICAL")" = "3" ] && [ "$SCORE" = "40" ]; then
+    echo "   ✅ PASS: order $ORDER, critical path $CRITICAL (${HOURS}h), score $SCORE"
+else
+    echo "   ❌ FAIL: order=$ORDER critical=$CRITICAL hours=$HOURS score=$SCORE"
+    exit 1
+fi
+
+# Test 2: Cycle and dangling reference reported and deducted
+echo ""
+echo "Test 2: Cycles and dangling depends_on"
+echo "{\"initiatives\": [$(initiative "$(plan 1 '[3]' 1), $(plan 2 '[1]' 1), $(plan 3 '[2]' 1), $(plan 4 '[9]' 1)")]}" > output.json
+python3 "$VALIDATE_SCRIPT" output.json --capability-index index.txt > /dev/null 2>&1 || true
+CYCLES=$(jq -c '.details.dependency_graph.cycles' validation-report.json)
+DANGLING=$(jq -c '.details.dependency_graph.dangling' validation-report.json)
+SCORE=$(jq '.form_score' validation-report.json)
+if [ "$CYCLES" = '[{"initiative":0,"sequences":[1,2,3]}]' ] && \
+   [ "$DANGLING" = '[{"initiative":0,"sequence":4,"depends_on":9}]' ] && \
+   jq -e '.issues | any(contains("circular dependency"))' validation-report.json > /dev/null && \
+   [ "$SCORE" = "35" ]; then
+    echo "   ✅ PASS: cycle $CYCLES, dangling $DANGLING, score $SCORE"
+else
+    echo "   ❌ FAIL: cycles=$CYCLES dangling=$DANGLING score=$SCORE"
+    exit 1
+fi
+
+# Test 3: 100k-node dependency chain (and the same chain closed into a cycle)
+echo ""
+echo "Test 3: 100k-node graphs"
+for closed in 0 1; do
+    python3 - "$closed" << 'PY'
+import json, sys
+closed = sys.argv[1] == '1'
+n = 100000
+plans = [{'title': f'PR {i}', 'sequence': i, 'depends_on': [i - 1] if i > 1 else ([n] if closed else []),
+          'estimated_hours': 1, 'tasks': [{'title': 't'}]} for i in range(1, n + 1)]
+json.dump({'initiatives': [{'capability_id': 'cap-a', 'from_stage': 1, 'to_stage': 2,
+                            'evidence_required': 'e', 'pr_plans': plans}]}, open('big.json', 'w'))
+PY
+    START=$(date +%s%3N)
+    python3 "$VALIDATE_SCRIPT" big.json --capability-index index.txt > /dev/null 2>&1 || true
+    ELAPSED=$(( $(date +%s%3N) - START ))
+    if [ "$closed" = "0" ]; then
+        RESULT=$(jq '.details.dependency_graph | [.critical_path_length, (.cycles | length), .execution_order[0], .execution_order[-1]]' -c validation-report.json)
+        EXPECTED='[100000,0,"0:1","0:100000"]'
+    else
+        RESULT=$(jq '.details.dependency_graph | [.critical_path_length, (.cycles | length), (.cycles[0].sequences | length)]' -c validation-report.json)
+        EXPECTED='[100000,1,100000]'
+    fi
+    if [ "$RESULT" = "$EXPECTED" ]; then
+        echo "   ✅ PASS: closed=$closed $RESULT in ${ELAPSED}ms"
+    else
+        echo "   ❌ FAIL: closed=$closed got $RESULT, expected $EXPECTED"
+        exit 1
+    fi
+done
+
+echo ""
+echo "=== All dependency graph tests PASSED ==="
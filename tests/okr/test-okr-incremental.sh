@@ -0,0 +1,133 @@
+#!/bin/bash
+# Test incremental OKR re-validation (per-initiative Merkle state)
+# Tests: only changed initiatives re-scored, only new capability_ids looked up,
+#        results identical to a full re-validation
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR=$(mktemp -d)
+STUB_PID=""
+
+cleanup() {
+    [ -n "$STUB_PID" ] && kill "$STUB_PID" 2>/dev/null || true
+    rm -rf "$TEST_DIR"
+}
+trap cleanup EXIT
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+
+echo "=== Testing incremental OKR re-validation ==="
+echo ""
+
+# Stub Brain: counts lookups, capabilities named cap-ok-* exist
+cat > "$TEST_DIR/stub.py" << 'EOF'
+import json, sys
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+hits = []
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/_hits':
+            status, body = 200, json.dumps(hits).encode()
+        else:
+            hits.append(self.path)
+            cap_id = self.path.rsplit('/', 1)[-1]
+            status = 200 if cap_id.startswith('cap-ok-') else 404
+            body = json.dumps({'id': cap_id}).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+with open(sys.argv[1], 'w') as f:
+    f.write(str(server.server_address[1]))
+server.serve_forever()
+EOF
+
+python3 "$TEST_DIR/stub.py" "$TEST_DIR/port" &
+STUB_PID=$!
+for _ in $(seq 1 50); do
+    [ -s "$TEST_DIR/port" ] && break
+    sleep 0.1
+done
+export BRAIN_URL="http://127.0.0.1:$(cat "$TEST_DIR/port")"
+
+# 20 initiatives, one capability_id each
+python3 - "$TEST_DIR/output.json" << 'EOF'
+import json, sys
+initiatives = [{
+    'title': f'Initiative {i}',
+    'capability_id': f'cap-ok-{i}',
+    'from_stage': 1, 'to_stage': 2,
+    'evidence_required': 'tests pass',
+    'pr_plans': [
+        {'sequence': 1, 'title': 'p1', 'tasks': [{'title': 't'}]},
+        {'sequence': 2, 'title': 'p2', 'tasks': [{'title': 't'}], 'depends_on': [1]}
+    ]
+} for i in range(20)]
+json.dump({'objective': 'Scale', 'initiatives': initiatives}, open(sys.argv[1], 'w'), indent=2)
+EOF
+
+cd "$TEST_DIR"
+
+hits() { curl -s "$BRAIN_URL/_hits" | jq 'length'; }
+incremental() { jq -r ".details.incremental.$1" validation-report.json; }
+
+# Test 1: First run scores everything
+echo "Test 1: First run scores every initiative"
+python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+if [ "$(incremental initiatives_rescored)" -ne 20 ] || [ "$(hits)" -ne 20 ]; then
+    echo "   ❌ FAIL: Expected 20 re-scored / 20 lookups, got $(incremental initiatives_rescored) / $(hits)"
+    exit 1
+fi
+echo "   ✅ PASS: 20 initiatives scored, 20 capability lookups"
+
+# Test 2: Edit one initiative (new capability_id + broken pr_plan dependency)
+echo ""
+echo "Test 2: Editing one initiative re-scores only that subtree"
+python3 - << 'EOF'
+import json
+doc = json.load(open('output.json'))
+doc['initiatives'][7]['capability_id'] = 'cap-new'
+doc['initiatives'][7]['pr_plans'][1]['depends_on'] = [9]
+json.dump(doc, open('output.json', 'w'), indent=2)
+EOF
+python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+if [ "$(incremental initiatives_rescored)" -ne 1 ] || [ "$(incremental initiatives_reused)" -ne 19 ]; then
+    echo "   ❌ FAIL: Expected 1 re-scored / 19 reused, got $(incremental initiatives_rescored) / $(incremental initiatives_reused)"
+    exit 1
+fi
+if [ "$(hits)" -ne 21 ]; then
+    echo "   ❌ FAIL: Expected only cap-new to be looked up (21 total), got $(hits)"
+    exit 1
+fi
+echo "   ✅ PASS: 1 re-scored, 19 reused, 1 new capability lookup"
+
+# Test 3: Same result as a full re-validation
+echo ""
+echo "Test 3: Incremental result equals full re-validation"
+jq 'del(.timestamp, .details.incremental)' validation-report.json > incremental.json
+python3 "$VALIDATE_SCRIPT" output.json --no-cache > /dev/null 2>&1 || true
+jq 'del(.timestamp, .details.incremental)' validation-report.json > full.json
+if ! cmp -s incremental.json full.json; then
+    echo "   ❌ FAIL: Incremental report differs from full re-validation"
+    diff incremental.json full.json | head -20
+    exit 1
+fi
+if ! jq -e '.issues | any(contains("Initiative 7: PR Plan 2 depends_on unknown sequence 9"))' full.json > /dev/null; then
+    echo "   ❌ FAIL: Edited initiative's issue missing"
+    exit 1
+fi
+echo "   ✅ PASS: Reports identical (content_hash still whole-document)"
+
+echo ""
+echo "=== All incremental validation tests PASSED ==="
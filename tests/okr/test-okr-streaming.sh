@@ -0,0 +1,108 @@
+#!/bin/bash
+# Test streaming OKR validation (validate-okr.py --stream)
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Testing streaming OKR validation ==="
+echo ""
+
+cd "$TEST_DIR"
+
+# Large 3-layer decomposition: keys out of sort order, some broken initiatives
+python3 - << 'PY'
+import json
+caps = [f"cap-{i}" for i in range(20)]
+with open('index.txt', 'w') as f:
+    f.write('# cecelia-capability-index v1\n' + '\n'.join(sorted(caps[:15])) + '\n')
+with open('output.json', 'w') as f:
+    f.write('{"objective": "Scale platform", "initiatives": [')
+    for i in range(8000):
+        if i:
+            f.write(', ')
+        json.dump({
+            "title": f"Initiative {i} " + "x" * 100,
+            "capability_id": caps[i % 20],
+            "from_stage": 1 if i % 97 else 3,
+            "to_stage": 2,
+            "evidence_required": "" if i % 101 == 0 else "demo " * 10,
+            "pr_plans": [{"title": f"PR {j}", "description": "d" * 200,
+                          "tasks": [{"title": "t", "description": "y" * 80}] * 3} for j in range(3)]
+        }, f)
+    f.write('], "alignment": {"kr": [1, 2.5, null]}}')
+PY
+
+# Test 1: Streaming report is identical to the json.load report
+echo "Test 1: --stream matches full load"
+python3 "$VALIDATE_SCRIPT" output.json --capability-index index.txt > /dev/null 2>&1 || true
+FULL=$(jq -c 'del(.timestamp)' validation-report.json)
+python3 "$VALIDATE_SCRIPT" output.json --capability-index index.txt --stream > /dev/null 2>&1 || true
+STREAMED=$(jq -c 'del(.timestamp)' validation-report.json)
+if [ "$FULL" = "$STREAMED" ] && [ "$(jq '.issues | length' validation-report.json)" -gt 0 ]; then
+    echo "   ✅ PASS: Same score, issues and content_hash"
+else
+    echo "   ❌ FAIL: Streaming report differs"
+    exit 1
+fi
+
+# Test 2: Peak memory stays well below a full load
+echo ""
+echo "Test 2: Bounded peak memory"
+read -r FULL_RSS STREAM_RSS << EOF2
+$(python3 - "$VALIDATE_SCRIPT" << 'PY'
+import resource, subprocess, sys
+
+def peak(extra):
+    # Fresh interpreter per run so ru_maxrss is per-mode
+    code = ("import resource, subprocess, sys; "
+            "subprocess.run(sys.argv[1:], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL); "
+            "print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)")
+    cmd = [sys.executable, '-c', code, sys.executable, sys.argv[1], 'output.json',
+           '--capability-index', 'index.txt'] + extra
+    return int(subprocess.run(cmd, capture_output=True, text=True).stdout)
+
+print(peak([]), peak(['--stream']))
+PY
+)
+EOF2
+if [ "$STREAM_RSS" -lt $((FULL_RSS * 2 / 3)) ]; then
+    echo "   ✅ PASS: Peak RSS ${STREAM_RSS}KB streamed vs ${FULL_RSS}KB loaded"
+else
+    echo "   ❌ FAIL: Streaming peak RSS ${STREAM_RSS}KB not below ${FULL_RSS}KB loaded"
+    exit 1
+fi
+
+# Test 3: 2-layer documents stream too (no initiatives array)
+echo ""
+echo "Test 3: 2-layer format"
+echo '{"key_results": [{"features": [{"title": "f", "description": "d", "repository": "r"}]}], "objective": "o"}' > two.json
+python3 "$VALIDATE_SCRIPT" two.json > /dev/null 2>&1 || true
+FULL=$(jq -c 'del(.timestamp)' validation-report.json)
+python3 "$VALIDATE_SCRIPT" two.json --stream > /dev/null 2>&1 || true
+STREAMED=$(jq -c 'del(.timestamp)' validation-report.json)
+if [ "$FULL" = "$STREAMED" ]; then
+    echo "   ✅ PASS: 2-layer report identical"
+else
+    echo "   ❌ FAIL: 2-layer streaming report differs"
+    exit 1
+fi
+
+# Test 4: Malformed JSON is rejected
+echo ""
+echo "Test 4: Malformed JSON rejected"
+echo '{"initiatives": [{"capability_id": "cap-1"},, ]}' > bad.json
+if python3 "$VALIDATE_SCRIPT" bad.json --stream 2>&1 | grep -q "Invalid JSON"; then
+    echo "   ✅ PASS: Invalid JSON reported"
+else
+    echo "   ❌ FAIL: Malformed JSON not reported"
+    exit 1
+fi
+
+echo ""
+echo "=== All streaming OKR tests PASSED ==="
@@ -0,0 +1,103 @@
+#!/bin/bash
+# Test validate-okr.py --verify-report (Stop Hook checks in one process)
+
+set -e
+
+ENGINE_ROOT="$( cd "$( dirname "${BASH_SOURCE[0]}" )/../.." && pwd )"
+VALIDATE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+STOP_HOOK="$ENGINE_ROOT/hooks/stop-okr.sh"
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Testing validate-okr.py --verify-report ==="
+echo ""
+
+cd "$TEST_DIR"
+git init -q
+
+cat > output.json << 'EOF'
+{
+  "objective": "Test",
+  "key_results": [
+    {"title": "KR1", "features": [{"title": "实现A", "description": "详细描述超过50字，确保通过验证机制的基本要求。", "repository": "test"}]},
+    {"title": "KR2", "features": [{"title": "实现B", "description": "另一个详细描述超过50字，确保通过验证。", "repository": "test"}]}
+  ]
+}
+EOF
+
+python3 "$VALIDATE_SCRIPT" output.json > /dev/null 2>&1 || true
+cp validation-report.json fresh.json
+
+PASSING='.content_score = 52 | .content_breakdown = {"title_quality": 14, "description_quality": 13, "kr_feature_mapping": 14, "completeness": 11} | .total = 92 | .passed = true'
+
+# expect <name> <exit code> <output pattern> <jq filter>
+expect() {
+    jq "$4" fresh.json > validation-report.json
+    local code=0
+    python3 "$VALIDATE_SCRIPT" output.json --verify-report > out.txt 2>&1 || code=$?
+    if [ "$code" -eq "$2" ] && grep -q -- "$3" out.txt; then
+        echo "   ✅ PASS: $1"
+    else
+        echo "   ❌ FAIL: $1 (exit $code)"
+        cat out.txt
+        exit 1
+    fi
+}
+
+expect "valid report verified" 0 "All anti-cheat checks passed" "$PASSING"
+expect "fresh report blocked as not passed" 2 "Validation not passed" "."
+expect "missing field" 2 "Missing field in validation report: timestamp" "$PASSING | del(.timestamp)"
+expect "missing breakdown field" 2 "Missing content breakdown field: completeness" \
+    "$PASSING | del(.content_breakdown.completeness)"
+expect "hash mismatch" 2 "Content hash mismatch" "$PASSING | .content_hash = \"0000000000000000\""
+expect "total arithmetic" 2 "Score calculation error" "$PASSING | .total = 99"
+expect "breakdown sum" 2 "Content breakdown sum mismatch" "$PASSING | .content_breakdown.completeness = 1"
+expect "breakdown range" 2 "Invalid score for title_quality" \
+    "$PASSING | .content_breakdown.title_quality = 16 | .content_breakdown.completeness = 9"
+expect "non-integer score" 2 "Invalid form_score" "$PASSING | .form_score = \"40\""
+expect "passed below threshold" 2 "Score below threshold" \
+    "$PASSING | .content_score = 40 | .content_breakdown = {\"title_quality\": 10, \"description_quality\": 10, \"kr_feature_mapping\": 10, \"completeness\": 10} | .total = 80"
+
+# Hook: git pre-checks in shell, the rest delegated to --verify-report
+jq "$PASSING" fresh.json > validation-report.json
+if bash "$STOP_HOOK" > hook.txt 2>&1 && grep -q "OKR decomposition complete and validated" hook.txt; then
+    echo "   ✅ PASS: stop-okr.sh delegates to --verify-report"
+else
+    echo "   ❌ FAIL: stop-okr.sh should pass a valid report"
+    cat hook.txt
+    exit 1
+fi
+
+# Hook: edits to the shared cecelia_validation package count as tampering
+mkdir -p engine/hooks engine/skills/okr engine/skills/dev/scripts
+cp "$STOP_HOOK" engine/hooks/
+cp -r "$ENGINE_ROOT/skills/okr/scripts" engine/skills/okr/
+cp -r "$ENGINE_ROOT/skills/dev/scripts/cecelia_validation" engine/skills/dev/scripts/
+find engine -name __pycache__ -prune -exec rm -rf {} +
+git add -A > /dev/null && git -c user.email=t@t -c user.name=t commit -qm engine
+for edit in "cecelia_validation/depgraph.py" "cecelia_validation/rulesets/dod.json" "cecelia_validation/evil.py"; do
+    echo "# edited" >> "engine/skills/dev/scripts/$edit"
+    HOME="$TEST_DIR/nohome" bash engine/hooks/stop-okr.sh > hook.txt 2>&1 && CODE=0 || CODE=$?
+    git checkout -q -- engine && git clean -qfd engine
+    if [ "$CODE" = "2" ] && grep -q "ANTI-CHEAT: Validation code has been modified" hook.txt; then
+        echo "   ✅ PASS: stop-okr.sh blocks an edit to $edit"
+    else
+        echo "   ❌ FAIL: stop-okr.sh should block an edit to $edit (exit $CODE)"
+        cat hook.txt
+        exit 1
+    fi
+done
+# Twice: bytecode written by the first run is not a change
+if HOME="$TEST_DIR/nohome" bash engine/hooks/stop-okr.sh > /dev/null 2>&1 &&
+        HOME="$TEST_DIR/nohome" bash engine/hooks/stop-okr.sh > hook.txt 2>&1; then
+    echo "   ✅ PASS: unmodified package passes"
+else
+    echo "   ❌ FAIL: unmodified package should pass"
+    cat hook.txt
+    exit 1
+fi
+
+echo ""
+echo "✅ All --verify-report tests passed"
@@ -0,0 +1,205 @@
+#!/usr/bin/env bash
+# Test: store-to-database.py against a local Brain + Tasks API stub
+# Tests: one parse, cached project lookup, concurrency, backoff, resumable journal
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+STORE_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/store-to-database.py"
+TEST_DIR="$(mktemp -d)"
+STUB_PID=""
+
+cleanup() {
+    [ -n "$STUB_PID" ] && kill "$STUB_PID" 2>/dev/null || true
+    rm -rf "$TEST_DIR"
+}
+trap cleanup EXIT
+cd "$TEST_DIR"
+
+echo "=== Test: store-to-database.py ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+# Stub Brain + Tasks on one port: 0.1s per POST, failures injected by title
+cat > stub.py << 'EOF'
+import itertools, json, sys, threading, time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+log, failures = [], {}
+ids = itertools.count(1)
+lock = threading.Lock()
+PROJECTS = [{'id': 'proj-engine', 'repo_path': '/repos/cecelia-engine'},
+            {'id': 'proj-core', 'repo_path': '/repos/cecelia-core'}]
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/_log':
+            return self.reply(200, log)
+        with lock:
+            log.append({'method': 'GET', 'path': self.path})
+        if self.path == '/api/brain/health':
+            return self.reply(200, {'status': 'ok'})
+        if self.path == '/api/tasks/projects':
+            return self.reply(200, PROJECTS)
+        self.reply(404, {})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if self.path == '/_fail':
+            failures.clear()
+            failures.update(body)
+            return self.reply(200, {})
+        title = body.get('title') or body.get('name')
+        with lock:
+            log.append({'method': 'POST', 'path': self.path, 'body': body})
+            status = failures.get(title)
+            if status and status[1] != 0:
+                status[1] -= 1
+                return self.reply(status[0], {'error': 'injected'})
+            n = next(ids)
+        time.sleep(0.1)
+        if self.path == '/api/brain/action/create-goal':
+            self.reply(200, {'id': 'goal-1'})
+        elif self.path == '/api/tasks/projects':
+            self.reply(200, {'id': f'sub-{n}'})
+        elif self.path == '/api/brain/pr-plans':
+            self.reply(200, {'pr_plan': {'id': f'plan-{n}'}})
+        elif self.path == '/api/brain/action/create-task':
+            self.reply(200, {'task_id': f'task-{n}'})
+        else:
+            self.reply(404, {})
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+with open(sys.argv[1], 'w') as f:
+    f.write(str(server.server_address[1]))
+server.serve_forever()
+EOF
+
+python3 stub.py port &
+STUB_PID=$!
+for _ in $(seq 1 50); do
+    [ -s port ] && break
+    sleep 0.1
+done
+STUB="http://127.0.0.1:$(cat port)"
+export BRAIN_API="$STUB" TASKS_API="$STUB"
+
+posts() { curl -s "$STUB/_log" | jq "[.[] | select(.method == \"POST\" and .path == \"$1\")] | length"; }
+fail() { curl -s -X POST -H 'Content-Type: application/json' -d "$1" "$STUB/_fail" > /dev/null; }
+store() { python3 "$STORE_SCRIPT" "$@" --backoff 0.01; }
+
+# 4 initiatives (one in cecelia-core) x 2 PR Plans x 3 Tasks
+gen_okr() {
+    python3 - "$1" "$2" << 'EOF'
+import json, sys
+path, tag = sys.argv[1], sys.argv[2]
+json.dump({'objective': f'O {tag}', 'key_results': [{'title': 'KR1'}], 'initiatives': [{
+    'title': f'I{i} {tag}', 'repository': 'cecelia-core' if i == 3 else 'cecelia-engine',
+    'capability_id': f'cap-{i}', 'from_stage': 1, 'to_stage': 2, 'evidence_required': 'e',
+    'pr_plans': [{'title': f'P{i}.{j} {tag}', 'sequence': j + 1, 'dod': ['d'], 'files': ['f'],
+                  'tasks': [{'title': f'T{i}.{j}.{k} {tag}'} for k in range(3)]} for j in range(2)]
+} for i in range(4)]}, open(path, 'w'), ensure_ascii=False)
+EOF
+}
+
+# 1. Full hierarchy, concurrently, one project lookup
+gen_okr output.json a
+START=$(date +%s%3N)
+store output.json > run1.log && status=0 || status=$?
+ELAPSED=$(( $(date +%s%3N) - START ))
+check "stored successfully" "$status" "0"
+check "initiatives created" "$(posts /api/tasks/projects)" "4"
+check "PR Plans created" "$(posts /api/brain/pr-plans)" "8"
+check "tasks created" "$(posts /api/brain/action/create-task)" "24"
+check "project list fetched once" "$(curl -s "$STUB/_log" | jq '[.[] | select(.method == "GET" and .path == "/api/tasks/projects")] | length')" "1"
+# Serial would take 37 x 0.1s
+check "requests concurrent (<2s)" "$([ "$ELAPSED" -lt 2000 ] && echo yes || echo "no: ${ELAPSED}ms")" "yes"
+
+LOG=$(curl -s "$STUB/_log")
+check "repository mapped to project" "$(echo "$LOG" | jq -r '.[] | select(.path == "/api/tasks/projects" and .method == "POST" and .body.name == "I3 a") | .body.parent_id')" "proj-core"
+check "PR Plans linked to created initiatives" "$(echo "$LOG" | jq '[.[] | select(.path == "/api/brain/pr-plans") | .body.initiative_id | startswith("sub-")] | all')" "true"
+check "capability fields passed through" "$(echo "$LOG" | jq -c '[.[] | select(.path == "/api/brain/pr-plans" and .body.title == "P2.1 a") | .body | .capability_id, .from_stage, .to_stage][]' | paste -sd,)" '"cap-2",1,2'
+check "tasks linked to PR Plan and Goal" "$(echo "$LOG" | jq '[.[] | select(.path == "/api/brain/action/create-task") | .body | (.pr_plan_id | startswith("plan-")) and .goal_id == "goal-1"] | all')" "true"
+
+# 2. Re-run: everything already stored
+store output.json > run2.log && status=0 || status=$?
+check "re-run exits 0" "$status" "0"
+check "re-run creates nothing" "$(posts /api/brain/action/create-task)" "24"
+check "re-run reports reuse" "$(grep -c 'Already stored: 36' run2.log)" "1"
+
+# 3. Transient 503s are retried with backoff
+gen_okr flaky.json b
+fail '{"T1.1.1 b": [503, 2]}'
+store flaky.json > flaky.log && status=0 || status=$?
+check "transient failures retried" "$status" "0"
+check "three attempts for the flaky task" "$(curl -s "$STUB/_log" | jq '[.[] | select(.body.title == "T1.1.1 b")] | length')" "3"
+
+# 4. Partial failure resumes from the journal
+gen_okr partial.json c
+fail '{"P0.1 c": [503, -1], "T2.0.2 c": [400, -1]}'
+store partial.json > partial.log && status=0 || status=$?
+check "partial failure exits 1" "$status" "1"
+check "4xx not retried" "$(curl -s "$STUB/_log" | jq '[.[] | select(.body.title == "T2.0.2 c")] | length')" "1"
+check "tasks under failed PR Plan skipped" "$(grep -c 'skipped under failed parents: 3' partial.log)" "1"
+check "journal written" "$([ -s .partial.json.store-journal ] && echo yes || echo no)" "yes"
+
+fail '{}'
+PLANS_BEFORE=$(posts /api/brain/pr-plans)
+TASKS_BEFORE=$(posts /api/brain/action/create-task)
+GOALS_BEFORE=$(posts /api/brain/action/create-goal)
+store partial.json > resume.log && status=0 || status=$?
+check "resume exits 0" "$status" "0"
+check "resume creates only the missing PR Plan" "$(( $(posts /api/brain/pr-plans) - PLANS_BEFORE ))" "1"
+check "resume creates only the missing tasks" "$(( $(posts /api/brain/action/create-task) - TASKS_BEFORE ))" "4"
+check "resume reuses the Goal" "$(( $(posts /api/brain/action/create-goal) - GOALS_BEFORE ))" "0"
+check "resume reuses journaled entities" "$(grep -c 'Already stored: 31' resume.log)" "1"
+
+# 5. 2-layer format
+cat > two.json << 'EOF'
+{"objective": "O", "key_results": [{"title": "KR", "features": [
+  {"title": "F1", "description": "d", "repository": "cecelia-engine"},
+  {"title": "F2", "description": "d", "repository": "unknown-repo"}]}]}
+EOF
+store two.json > two.log && status=0 || status=$?
+check "2-layer: unknown repository is a partial failure" "$status" "1"
+check "2-layer: task attached to feature sub-project" \
+    "$(curl -s "$STUB/_log" | jq -r '.[] | select(.path == "/api/brain/action/create-task" and .body.title == "F1") | .body.project_id | startswith("sub-")')" "true"
+
+# 6. Errors
+echo '{broken' > bad.json
+set +e
+store bad.json > /dev/null 2>&1
+check "invalid JSON exits 2" "$?" "2"
+BRAIN_API="http://127.0.0.1:1" store output.json > down.log 2>&1
+check "Brain down exits 2" "$?" "2"
+check "input kept as pending-tasks.json" "$(cmp -s output.json pending-tasks.json && echo same || echo differs)" "same"
+set -e
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All store-to-database tests passed"
+else
+    exit 1
+fi
@@ -72,7 +72,7 @@ python3 /home/xx/perfect21/cecelia/engine/skills/dev/scripts/validate-prd.py tes
 
 # Test 1: Valid case should pass
 echo "Test 1: Valid PRD and report"
-if bash /home/xx/perfect21/cecelia/engine/skills/dev/scripts/anti-cheat-prd.sh test.md 2>&1 | grep -q "All 10 layers passed"; then
+if bash /home/xx/perfect21/cecelia/engine/skills/dev/scripts/anti-cheat-prd.sh test.md 2>&1 | grep -q "All 11 layers passed"; then
     echo "✅ PASS: Anti-cheat passes valid case"
 else
     echo "❌ FAIL: Anti-cheat should pass valid case" >&2
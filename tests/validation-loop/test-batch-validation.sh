@@ -0,0 +1,115 @@
+#!/usr/bin/env bash
+# Test: --batch mode for validate-dod.py / validate-prd.py
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+VALIDATE_DOD="$ENGINE_ROOT/skills/dev/scripts/validate-dod.py"
+VALIDATE_PRD="$ENGINE_ROOT/skills/dev/scripts/validate-prd.py"
+
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+echo "=== Test: Batch Validation ==="
+echo ""
+
+mkdir -p wt1 wt2 wt3
+cat > wt1/.dod-good.md << 'EOF'
+---
+id: test
+---
+
+# DoD: Test Feature
+
+- [ ] **功能实现完成**
+  - Test: `bash test-feature.sh` 通过测试
+- [ ] **测试覆盖**
+  - Test: `npm run test` 所有单元测试通过
+- [ ] **性能达标**
+  - Test: `time python benchmark.py` 执行时间 <5秒
+- [ ] **文档完成**
+  - Test: `grep -q "Feature" README.md` 验证 doc
+- [ ] **CI 通过**
+  - Test: `gh run list --limit 1` DevGate version 检查
+- [ ] **代码质量**
+  - Test: `bash scripts/check.sh` 确保 git 状态干净
+
+此 DoD 确保功能完整交付。
+EOF
+printf -- '---\nid: bad\n---\n\n- [ ] Done\n' > wt2/.dod-bad.md
+printf -- '---\nid: other\n---\n\n- [ ] 实现 feature\n  - Test: `bash run.sh`\n' > wt3/.dod-other.md
+
+# Test 1: Batch scores match single-file scores
+echo "Test 1: Batch scores match single-file path"
+python3 "$VALIDATE_DOD" --batch . --jobs 2 > /dev/null || true
+
+if [[ ! -f ".dod-validation-batch.json" ]]; then
+    echo "❌ FAIL: Aggregate report not created" >&2
+    exit 1
+fi
+
+for f in wt1/.dod-good.md wt2/.dod-bad.md wt3/.dod-other.md; do
+    python3 "$VALIDATE_DOD" "$f" > /dev/null || true
+    SINGLE=$(jq -r '.total_score' .dod-validation-report.json)
+    BATCH=$(jq -r --arg f "$f" '.files[] | select(.file == $f) | .total_score' .dod-validation-batch.json)
+    if [[ "$SINGLE" != "$BATCH" ]]; then
+        echo "❌ FAIL: $f single=$SINGLE batch=$BATCH" >&2
+        exit 1
+    fi
+done
+echo "✅ PASS: Scores identical"
+
+# Test 2: One report per file
+echo ""
+echo "Test 2: Per-file reports"
+COUNT=$(ls .dod-validation-reports/*.json | wc -l)
+if [[ "$COUNT" -eq 3 ]] && [[ "$(jq -r '.file_count' .dod-validation-batch.json)" -eq 3 ]]; then
+    echo "✅ PASS: 3 per-file reports written"
+else
+    echo "❌ FAIL: Expected 3 per-file reports, got $COUNT" >&2
+    exit 1
+fi
+
+# Test 3: Report names never collide
+echo ""
+echo "Test 3: Unique report names"
+mkdir -p names/a/b names/a__b
+cp wt1/.dod-*.md names/a/b/.dod-x.md
+cp wt1/.dod-*.md names/a__b/.dod-x.md
+cp wt1/.dod-*.md names/.dod-a_x.md
+python3 "$VALIDATE_DOD" --batch names --report-dir names-reports > /dev/null || true
+NAMES=$(ls -A names-reports | sort | paste -sd' ')
+UNIQUE=$(PYTHONPATH="$ENGINE_ROOT/skills/dev/scripts" python3 -c "
+import os
+from cecelia_validation.batch import report_name
+paths = ['a/b.md', 'a__b.md', 'a_/b.md', 'a/_b.md', 'a_u/b.md', 'x/a.md', os.path.abspath('/x/a.md')]
+print(len({report_name(p) for p in paths}) == len(paths))")
+if [[ "$NAMES" == "names__.dod-a_ux.md.json names__a__b__.dod-x.md.json names__a_u_ub__.dod-x.md.json" ]] && \
+   [[ "$UNIQUE" == "True" ]]; then
+    echo "✅ PASS: One report per file ($NAMES)"
+else
+    echo "❌ FAIL: Report names collide: $NAMES (unique: $UNIQUE)" >&2
+    exit 1
+fi
+
+# Test 4: Exit codes
+echo ""
+echo "Test 3: Exit codes"
+set +e
+python3 "$VALIDATE_DOD" --batch 'wt1/.dod-*.md' > /dev/null
+GOOD_EXIT=$?
+python3 "$VALIDATE_DOD" --batch . > /dev/null
+MIXED_EXIT=$?
+python3 "$VALIDATE_PRD" --batch . > /dev/null 2>&1
+EMPTY_EXIT=$?
+set -e
+if [[ $GOOD_EXIT -eq 0 ]] && [[ $MIXED_EXIT -eq 1 ]] && [[ $EMPTY_EXIT -eq 2 ]]; then
+    echo "✅ PASS: 0 all pass / 1 any fail / 2 no files"
+else
+    echo "❌ FAIL: exit codes good=$GOOD_EXIT mixed=$MIXED_EXIT empty=$EMPTY_EXIT" >&2
+    exit 1
+fi
+
+echo ""
+echo "✅ All batch validation tests passed"
@@ -0,0 +1,81 @@
+#!/usr/bin/env bash
+# Test: benchmark corpus generator and regression gate (scripts/bench/)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+BENCH_DIR="$ENGINE_ROOT/scripts/bench"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+echo "=== Test: Benchmark Gate ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$BENCH_DIR/corpus.py" "$@" > /dev/null; }
+
+# 1. Deterministic corpus
+for kind in dod prd okr; do
+    gen "$kind" 64K -o "a.$kind"
+    gen "$kind" 64K -o "b.$kind"
+    gen "$kind" 64K -o "c.$kind" --seed 1
+    check "$kind corpus is deterministic" "$(cmp -s "a.$kind" "b.$kind" && echo same || echo differs)" "same"
+    check "$kind corpus depends on the seed" "$(cmp -s "a.$kind" "c.$kind" && echo same || echo differs)" "differs"
+    size=$(wc -c < "a.$kind")
+    check "$kind corpus reaches the target size" "$([ "$size" -ge 65536 ] && [ "$size" -lt 81920 ] && echo ok || echo "$size")" "ok"
+done
+
+# 2. OKR graph: exact pr_plan count, acyclic, capability IDs from the offline pool
+gen okr-graph 2k -o graph.json
+check "okr-graph has 2000 pr_plans" "$(jq '[.initiatives[].pr_plans[]] | length' graph.json)" "2000"
+check "okr-graph depends_on points backwards only" \
+    "$(jq '[.initiatives[].pr_plans[] | select(.depends_on) | .sequence as $s | .depends_on[] | select(. >= $s)] | length' graph.json)" "0"
+
+# 3. Smoke run records every phase separately
+python3 "$BENCH_DIR/bench.py" run --profile smoke --repeat 1 --corpus-dir corpus -o results.json > run.log
+check "smoke run records all cases" "$(jq -c '.cases | keys' results.json)" '["dod-1K","okr-1K","okr-graph-100","prd-1K"]'
+check "DoD phases timed separately" "$(jq -c '.cases["dod-1K"].phases | keys' results.json)" '["hash","validate_dod"]'
+check "PRD phases timed separately" "$(jq -c '.cases["prd-1K"].phases | keys' results.json)" '["hash","validate_prd"]'
+check "OKR phases timed separately" "$(jq -c '.cases["okr-graph-100"].phases | keys' results.json)" '["hash","validate_okr_form"]'
+check "normalized timings recorded" "$(jq '[.cases[].phases[].normalized | numbers] | length' results.json)" "8"
+
+# 4. Gate: identical results pass, a slower phase fails, missing/foreign baselines error
+set +e
+python3 "$BENCH_DIR/bench.py" compare results.json --baseline results.json > same.log 2>&1
+check "gate passes against itself" "$?" "0"
+
+jq '.cases["prd-1K"].phases.validate_prd.best /= 10' results.json > faster-baseline.json
+python3 "$BENCH_DIR/bench.py" compare results.json --baseline faster-baseline.json --min-delta 0 > slow.log 2>&1
+check "gate fails on a slowed phase" "$?" "1"
+check "regressed phase reported" "$(grep -c 'prd-1K .*validate_prd.*❌' slow.log)" "1"
+
+python3 "$BENCH_DIR/bench.py" compare results.json --baseline faster-baseline.json --threshold 20 > loose.log 2>&1
+check "threshold is configurable" "$?" "0"
+
+python3 "$BENCH_DIR/bench.py" compare results.json --baseline missing.json > missing.log 2>&1
+check "missing baseline is an error" "$?" "2"
+
+jq '.seed = 7' results.json > other-seed.json
+python3 "$BENCH_DIR/bench.py" compare results.json --baseline other-seed.json > seed.log 2>&1
+check "baseline from another corpus is an error" "$?" "2"
+set -e
+
+# 5. Committed baseline is a valid results document
+check "quick baseline covers 12 cases" "$(jq '.cases | length' "$BENCH_DIR/baselines/quick.json")" "12"
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All benchmark gate tests passed"
+else
+    exit 1
+fi
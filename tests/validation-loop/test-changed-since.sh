@@ -0,0 +1,104 @@
+#!/usr/bin/env bash
+# Test: --changed-since <ref> (git object store input, blob-id result cache)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+
+echo "=== Test: --changed-since ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$ENGINE_ROOT/scripts/bench/corpus.py" "$@" > /dev/null; }
+dod() { python3 "$SCRIPTS_DIR/validate-dod.py" "$@"; }
+
+# Repository: main has three DoDs, the feature branch edits/adds/deletes some
+mkdir "$TEST_DIR/repo" && cd "$TEST_DIR/repo"
+git init -q -b main
+git config user.email test@example.com
+git config user.name test
+mkdir -p docs/a docs/b
+gen dod 4K -o docs/a/.dod-keep.md --seed 1
+gen dod 4K -o docs/a/.dod-edit.md --seed 2
+gen dod 4K -o docs/b/.dod-gone.md --seed 3
+echo "readme" > README.md
+git add -A && git commit -q -m base
+
+git checkout -q -b feature
+gen dod 4K -o docs/a/.dod-edit.md --seed 4
+gen dod 2K -o docs/b/.dod-new.md --seed 5
+gen prd 4K -o docs/b/.prd-new.md --seed 6
+git rm -q docs/b/.dod-gone.md
+echo "changed" >> README.md
+git add -A && git commit -q -m feature
+
+# The working tree must not matter - content comes from the object store
+echo "not the committed content" > docs/a/.dod-edit.md
+
+# 1. Only changed DoDs are validated
+dod --changed-since main > run1.log || true
+check "changed DoDs listed" "$(jq -c '[.files[].file]' .dod-validation-batch.json)" \
+    '["docs/a/.dod-edit.md","docs/b/.dod-new.md"]'
+check "every new blob scored" "$(jq '.blobs_scored' .dod-validation-batch.json)" "2"
+check "base is the merge-base" "$(jq -r '.base' .dod-validation-batch.json)" "$(git rev-parse main)"
+
+# 2. Scores equal file-mode validation of the committed content
+for path in docs/a/.dod-edit.md docs/b/.dod-new.md; do
+    mkdir -p "$TEST_DIR/show"
+    git show "HEAD:$path" > "$TEST_DIR/show/.dod-x.md"
+    report=$(jq -r --arg p "$path" '.files[] | select(.file == $p) | .report_file' .dod-validation-batch.json)
+    expected=$(cd "$TEST_DIR/show" && python3 "$SCRIPTS_DIR/validate-dod.py" .dod-x.md --no-cache > /dev/null || true; \
+        jq -c '[.total_score, .content_sha256, .form_issues, .content_issues]' .dod-validation-report.json)
+    check "$path scored from HEAD blob" "$(jq -c '[.total_score, .content_sha256, .form_issues, .content_issues]' "$report")" "$expected"
+    check "$path report records blob id" "$(jq -r '.git_blob' "$report")" "$(git rev-parse "HEAD:$path")"
+done
+
+# 3. Re-run: every blob already seen
+dod --changed-since main > run2.log || true
+check "re-run scores nothing" "$(jq '.blobs_scored' .dod-validation-batch.json)" "0"
+check "re-run reuses both blobs" "$(jq '.blobs_reused' .dod-validation-batch.json)" "2"
+
+# 4. Same content at a new path is not scored again
+git show HEAD:docs/b/.dod-new.md > docs/b/.dod-copy.md
+git add docs/b/.dod-copy.md && git commit -q -m copy
+dod --changed-since main > run3.log || true
+check "copied blob reused" "$(jq -c '[.file_count, .blobs_scored, .blobs_reused]' .dod-validation-batch.json)" "[3,0,3]"
+
+# 5. PRD validator
+python3 "$SCRIPTS_DIR/validate-prd.py" --changed-since main > prd.log || true
+check "PRD changes validated" "$(jq -c '[.files[].file]' .prd-validation-batch.json)" '["docs/b/.prd-new.md"]'
+
+# 6. Nothing changed / errors
+set +e
+dod --changed-since HEAD > none.log 2>&1
+check "no changes exits 0" "$?" "0"
+check "no changes reported" "$(grep -c 'No DoD files changed since HEAD' none.log)" "1"
+
+dod --changed-since no-such-ref > badref.log 2>&1
+check "unknown ref exits 2" "$?" "2"
+check "unknown ref named" "$(grep -c 'unknown revision: no-such-ref' badref.log)" "1"
+
+(cd "$TEST_DIR" && mkdir plain && cd plain && dod --changed-since main > ../nogit.log 2>&1)
+check "outside a repository exits 2" "$?" "2"
+set -e
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All --changed-since tests passed"
+else
+    exit 1
+fi
@@ -0,0 +1,55 @@
+#!/usr/bin/env bash
+# Test: single-pass DoD model (cecelia_validation/dod.py)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+
+echo "=== Test: DoD Model ==="
+echo ""
+
+if python3 - "$SCRIPTS_DIR" << 'EOF'
+import sys
+sys.path.insert(0, sys.argv[1])
+from cecelia_validation.dod import parse_dod
+
+content = '\n'.join([
+    '---',
+    'id: feature-x',
+    'version: 1.2',
+    '---',
+    '',
+    '- [ ] 实现功能 A',
+    '  - Test: `bash a.sh`',
+    '- [x] 完成文档',
+    '  说明',
+    '  说明',
+    '  - Test: too far away',
+    '- [ ] 多行 `code',
+    '  span` 结束',
+    '```bash',
+    'npm test',
+    '```',
+])
+model = parse_dod(content)
+
+checks = {
+    'frontmatter parsed': model.frontmatter == {'id': 'feature-x', 'version': '1.2'},
+    'three items': model.checklist_count == 3,
+    'checked state': [i.checked for i in model.items] == [False, True, False],
+    'Test attached within 3 lines only': [i.test for i in model.items] == ['`bash a.sh`', None, None],
+    'code spans cross lines': model.code_spans == 3,
+    'non-empty lines exclude ---': model.non_empty_lines == 13,
+}
+
+for name, ok in checks.items():
+    print(f"{'✅ PASS' if ok else '❌ FAIL'}: {name}")
+sys.exit(0 if all(checks.values()) else 1)
+EOF
+then
+    echo ""
+    echo "✅ All DoD model tests passed"
+else
+    exit 1
+fi
@@ -0,0 +1,93 @@
+#!/usr/bin/env bash
+# Test: history subcommand (score every historical version through one cat-file pipe)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+
+echo "=== Test: history ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$ENGINE_ROOT/scripts/bench/corpus.py" "$@" > /dev/null; }
+history() { PYTHONPATH="$SCRIPTS_DIR" python3 -m cecelia_validation history "$@"; }
+
+# Repository: DoD edited four times (the third commit reverts to the first
+# content), PRD added in commit 2, an unrelated file in every commit
+mkdir "$TEST_DIR/repo" && cd "$TEST_DIR/repo"
+git init -q -b main
+git config user.email test@example.com
+git config user.name test
+mkdir docs
+for seed in 1 2 1 3; do
+    gen dod 4K -o docs/.dod-h.md --seed "$seed"
+    [ "$seed" = 2 ] && gen prd 4K -o docs/.prd-h.md --seed 7
+    echo "$seed" >> notes.txt
+    git add -A && git commit -q -m "seed $seed"
+done
+
+# 1. CSV: one row per (commit, file), oldest first
+history docs/.dod-h.md docs/.prd-h.md -o series.csv 2> run1.log
+check "CSV header" "$(head -1 series.csv)" \
+    "commit,committed_at,file,blob,total_score,form_score,content_score,passing,error"
+check "one row per revision" "$(tail -n +2 series.csv | wc -l | tr -d ' ')" "5"
+check "oldest commit first" "$(sed -n 2p series.csv | cut -d, -f1)" "$(git rev-list --reverse HEAD | head -1)"
+check "distinct blobs scored once" "$(grep -c '5 revision(s), 4 distinct blob(s), 4 scored, 0 from cache' run1.log)" "1"
+
+# 2. Scores equal file-mode validation of the same revision
+for rev in HEAD~2 HEAD; do
+    mkdir -p "$TEST_DIR/show"
+    git show "$rev:docs/.dod-h.md" > "$TEST_DIR/show/.dod-x.md"
+    expected=$(cd "$TEST_DIR/show" && python3 "$SCRIPTS_DIR/validate-dod.py" .dod-x.md --no-cache > /dev/null || true; \
+        jq -r '.total_score' .dod-validation-report.json)
+    actual=$(grep "^$(git rev-parse "$rev"),.*docs/.dod-h.md," series.csv | cut -d, -f5)
+    check "$rev scored from its blob" "$actual" "$expected"
+done
+
+# 3. NDJSON, cached re-run, in-process workers: same series
+history docs/.dod-h.md docs/.prd-h.md --format ndjson -o series.ndjson 2> run2.log
+check "NDJSON rows" "$(jq -s 'length' series.ndjson)" "5"
+check "NDJSON matches CSV" "$(jq -r '.total_score' series.ndjson | paste -sd,)" "$(tail -n +2 series.csv | cut -d, -f5 | paste -sd,)"
+check "re-run reads every blob from cache" "$(grep -c '0 scored, 4 from cache' run2.log)" "1"
+
+history docs/.dod-h.md docs/.prd-h.md --no-cache --jobs 1 -o nocache.csv 2> /dev/null
+check "--no-cache --jobs 1 same series" "$(cmp -s series.csv nocache.csv && echo same || echo differs)" "same"
+
+# 4. --rev walks an older history
+history docs/.dod-h.md --rev HEAD~1 -o old.csv 2> /dev/null
+check "--rev HEAD~1" "$(tail -n +2 old.csv | wc -l | tr -d ' ')" "3"
+
+# 5. Other file names need --kind
+history notes.txt -o notes.csv 2> notes.log
+check "unknown kind warned" "$(grep -c 'notes.txt is not a .dod-\*.md' notes.log)" "1"
+check "unknown kind has no rows" "$(wc -l < notes.csv | tr -d ' ')" "1"
+
+# 6. Errors
+set +e
+history docs/.dod-h.md --rev no-such-rev > /dev/null 2> badrev.log
+check "unknown revision exits 2" "$?" "2"
+
+(cd "$TEST_DIR" && mkdir plain && cd plain && history x.dod-a.md > /dev/null 2>&1)
+check "outside a repository exits 2" "$?" "2"
+set -e
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All history tests passed"
+else
+    exit 1
+fi
@@ -0,0 +1,107 @@
+#!/usr/bin/env bash
+# Test: validator startup import budget
+#
+# Validators run in Stop hooks on every agent stop, so interpreter start +
+# imports dominate their cost. Fails when a validator imports a heavy
+# module it doesn't need, or when import time beyond a bare interpreter
+# exceeds the budget.
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+BUDGET_MS="${IMPORT_BUDGET_MS:-60}"
+
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Test: Validator Import Budget (${BUDGET_MS}ms) ==="
+echo ""
+
+printf -- '---\nid: t\n---\n\n- [ ] 实现\n  - Test: `bash t.sh`\n' > .dod-t.md
+printf -- '---\nid: t\n---\n\n## 需求来源\n\n用户需求\n' > .prd-t.md
+echo '{"objective": "o", "key_results": [{"features": []}, {"features": []}]}' > output.json
+
+# Warm bytecode caches so the budget measures imports, not compilation
+python3 "$ENGINE_ROOT/skills/dev/scripts/validate-dod.py" .dod-t.md > /dev/null 2>&1 || true
+python3 "$ENGINE_ROOT/skills/dev/scripts/validate-prd.py" .prd-t.md > /dev/null 2>&1 || true
+python3 "$ENGINE_ROOT/skills/okr/scripts/validate-okr.py" output.json > /dev/null 2>&1 || true
+
+if python3 - "$ENGINE_ROOT" "$BUDGET_MS" << 'EOF'
+import subprocess
+import sys
+
+engine_root, budget_ms = sys.argv[1], float(sys.argv[2])
+HEAVY = ('requests', 'urllib3', 'multiprocessing', 'concurrent.futures.process', 'ssl')
+
+
+def import_times(args):
+    """Self time (us) per module from -X importtime, best of 3 runs"""
+    best = None
+    for _ in range(3):
+        err = subprocess.run([sys.executable, '-X', 'importtime'] + args,
+                             capture_output=True, text=True).stderr
+        times = {}
+        for line in err.splitlines():
+            parts = line.split('|')
+            if line.startswith('import time:') and len(parts) == 3 and parts[0].split(':')[1].strip().isdigit():
+                times[parts[2].strip()] = int(parts[0].split(':')[1])
+        if best is None or sum(times.values()) < sum(best.values()):
+            best = times
+    return best
+
+
+baseline = import_times(['-c', 'pass'])
+cases = {
+    'validate-dod.py': [f'{engine_root}/skills/dev/scripts/validate-dod.py', '.dod-t.md'],
+    'validate-prd.py': [f'{engine_root}/skills/dev/scripts/validate-prd.py', '.prd-t.md'],
+    'validate-okr.py (2-layer)': [f'{engine_root}/skills/okr/scripts/validate-okr.py', 'output.json'],
+}
+
+failed = False
+for name, args in cases.items():
+    times = import_times(args)
+    extra = {mod: us for mod, us in times.items() if mod not in baseline}
+    total_ms = sum(extra.values()) / 1000
+    heavy = sorted(mod for mod in extra if mod.split('.')[0] in HEAVY or mod in HEAVY)
+
+    if heavy:
+        print(f"❌ FAIL: {name} imports heavy modules: {', '.join(heavy[:5])}")
+        failed = True
+    elif total_ms > budget_ms:
+        top = sorted(extra.items(), key=lambda kv: -kv[1])[:5]
+        print(f"❌ FAIL: {name} imports take {total_ms:.1f}ms > {budget_ms:.0f}ms")
+        print(f"   Slowest: {', '.join(f'{m} {us / 1000:.1f}ms' for m, us in top)}")
+        failed = True
+    else:
+        print(f"✅ PASS: {name} {total_ms:.1f}ms")
+
+sys.exit(1 if failed else 0)
+EOF
+then
+    :
+else
+    exit 1
+fi
+
+# Zipapp bundle: one entry point, same scores as the scripts
+echo ""
+echo "Zipapp entry point"
+bash "$ENGINE_ROOT/scripts/build-validators-zipapp.sh" "$TEST_DIR/cecelia-validate.pyz" > /dev/null
+python3 "$ENGINE_ROOT/skills/dev/scripts/validate-dod.py" .dod-t.md > /dev/null 2>&1 || true
+SCRIPT_SCORE=$(jq -r '.total_score' .dod-validation-report.json)
+python3 cecelia-validate.pyz dod .dod-t.md > /dev/null 2>&1 || true
+ZIPAPP_SCORE=$(jq -r '.total_score' .dod-validation-report.json)
+rm -f validation-report.json
+python3 cecelia-validate.pyz okr output.json > /dev/null 2>&1 || true
+if [[ "$SCRIPT_SCORE" == "$ZIPAPP_SCORE" ]] && [[ -f validation-report.json ]]; then
+    echo "✅ PASS: cecelia-validate.pyz runs dod/okr (score $ZIPAPP_SCORE)"
+else
+    echo "❌ FAIL: zipapp score $ZIPAPP_SCORE != script score $SCRIPT_SCORE" >&2
+    exit 1
+fi
+
+echo ""
+echo "✅ All import budget tests passed"
@@ -0,0 +1,147 @@
+#!/usr/bin/env bash
+# Test: in-process validator API (cecelia_validation.validate_dod/prd/okr/many)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+OKR_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+export PYTHONPATH="$SCRIPTS_DIR"
+unset CECELIA_VALIDATION_STORE CECELIA_VALIDATION_TIMINGS
+
+echo "=== Test: Validator Library ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$ENGINE_ROOT/scripts/bench/corpus.py" "$@" > /dev/null; }
+# Two report files equal apart from the timestamp
+same_as() { python3 -c "
+import json, sys
+a, b = (json.load(open(p)) for p in sys.argv[1:3])
+for r in (a, b):
+    r.pop('timestamp', None)
+print('same' if a == b else 'differs')" "$1" "$2"; }
+
+gen dod 8K -o .dod-a.md --seed 1
+gen prd 8K -o .prd-a.md --seed 2
+printf -- '---\r\nid: t\r\n---\r\n- [ ] 实现\r\n  - Test: `bash t.sh`\r\n' > .dod-crlf.md
+python3 - << 'EOF'
+import json
+json.dump({'objective': 'O', 'key_results': [{'title': 'KR'}], 'initiatives': [
+    {'title': f'I{i}', 'capability_id': f'cap-{i}', 'from_stage': 1, 'to_stage': 2,
+     'evidence_required': 'e', 'pr_plans': [{'title': 'P', 'sequence': 1, 'tasks': [{'title': 'T'}]}]}
+    for i in range(3)]}, open('output.json', 'w'))
+open('caps.idx', 'w').write('# cecelia-capability-index v1\ncap-0\ncap-1\n')
+open('empty.idx', 'w').write('# cecelia-capability-index v1\n')
+EOF
+
+# 1. Same reports as the scripts
+for doc in .dod-a.md .dod-crlf.md; do
+    python3 "$SCRIPTS_DIR/validate-dod.py" "$doc" --no-cache > /dev/null || true
+    cp .dod-validation-report.json "script-$doc.json"
+done
+python3 "$SCRIPTS_DIR/validate-prd.py" .prd-a.md --no-cache > /dev/null || true
+cp .prd-validation-report.json script-prd.json
+python3 "$OKR_SCRIPT" output.json --no-cache --capability-index caps.idx > /dev/null || true
+cp validation-report.json script-okr.json
+python3 "$OKR_SCRIPT" output.json --no-cache --capability-index empty.idx > /dev/null || true
+cp validation-report.json script-okr-empty.json
+rm -f .dod-validation-report.json .prd-validation-report.json validation-report.json
+rm -rf cache
+
+python3 - << 'EOF'
+import json
+from cecelia_validation import validate_dod, validate_prd, validate_okr
+from cecelia_validation.capabilities import CapabilityIndex
+
+for name in ('.dod-a.md', '.dod-crlf.md'):
+    json.dump(validate_dod(open(name, 'rb').read(), name).to_dict(), open(f'api-{name}.json', 'w'))
+json.dump(validate_prd(open('.prd-a.md', encoding='utf-8').read(), '.prd-a.md').to_dict(),
+          open('api-prd.json', 'w'))
+index = CapabilityIndex.load('caps.idx')
+json.dump(validate_okr(open('output.json').read(), capability_index=index).to_dict(),
+          open('api-okr.json', 'w'))
+# An empty snapshot is still a snapshot - every ID missing, not unverified
+empty = CapabilityIndex.load('empty.idx')
+json.dump(validate_okr(open('output.json').read(), capability_index=empty).to_dict(),
+          open('api-okr-empty.json', 'w'))
+EOF
+check "DoD report identical" "$(same_as script-.dod-a.md.json api-.dod-a.md.json)" "same"
+check "CRLF bytes hashed and scored like the file" "$(same_as script-.dod-crlf.md.json api-.dod-crlf.md.json)" "same"
+check "PRD report identical" "$(same_as script-prd.json api-prd.json)" "same"
+check "OKR report identical" "$(same_as script-okr.json api-okr.json)" "same"
+check "OKR report identical with an empty snapshot" "$(same_as script-okr-empty.json api-okr-empty.json)" "same"
+
+# 2. No I/O: no report files, no result cache (only the one-time rule-set load)
+check "no report files written" "$(ls -A | grep -c 'validation-report')" "0"
+check "no result cache entries" "$(find cache -maxdepth 1 -name '*.json' 2>/dev/null | wc -l | tr -d ' ')" "0"
+
+# 3. Typed reports
+check "typed fields" "$(python3 -c "
+from cecelia_validation import validate_dod
+r = validate_dod(open('.dod-a.md').read(), '.dod-a.md')
+print(type(r).__name__, r.kind, r.total_score == r.form_score + r.content_score,
+      r.passing == (r.total_score >= 90), r.issues == r.form_issues + r.content_issues,
+      len(r.content_hash), r.ruleset == r.data['ruleset_sha256'])")" "ValidationReport dod True True True 64 True"
+check "OKR capability_ids unverified without a snapshot" "$(python3 -c "
+from cecelia_validation import validate_okr
+r = validate_okr(open('output.json').read())
+print(sum('could not verify' in i for i in r.issues), r.data['capability_index'])")" "3 None"
+check "invalid OKR raises ValueError" "$(python3 -c "
+from cecelia_validation import validate_okr
+try:
+    validate_okr('[1, 2]')
+except ValueError as e:
+    print('ValueError')")" "ValueError"
+
+# 4. Bulk API: mixed documents, in order, errors as reports
+mkdir many
+for seed in $(seq 1 20); do gen dod 4K -o "many/.dod-$seed.md" --seed "$seed"; done
+check "validate_many mixed kinds, in order" "$(python3 -c "
+from cecelia_validation import validate_many
+reports = list(validate_many(['.dod-a.md', '.prd-a.md', 'output.json', 'missing/.dod-x.md', 'notes.txt']))
+print(','.join(r.kind + ':' + ('error' if r.error else str(r.total_score > 0)) for r in reports))")" \
+    "dod:True,prd:True,okr:True,dod:error,:error"
+check "kind= applies to (name, content) pairs" "$(python3 -c "
+from cecelia_validation import validate_many
+print(next(validate_many([('inline', '- [ ] 实现')], kind='dod')).total_score > 0)")" "True"
+
+# 20 documents in one process vs one script per document
+START=$(date +%s%3N)
+python3 -c "
+import glob
+from cecelia_validation import validate_many
+assert all(not r.error for r in validate_many(sorted(glob.glob('many/.dod-*.md'))))"
+IN_PROCESS=$(( $(date +%s%3N) - START ))
+START=$(date +%s%3N)
+for f in many/.dod-*.md; do python3 "$SCRIPTS_DIR/validate-dod.py" "$f" --no-cache > /dev/null || true; done
+SUBPROCESS=$(( $(date +%s%3N) - START ))
+echo "   in-process: ${IN_PROCESS}ms, one subprocess per document: ${SUBPROCESS}ms"
+check "bulk API faster than a subprocess per document" \
+    "$([ $((IN_PROCESS * 3)) -lt "$SUBPROCESS" ] && echo yes || echo no)" "yes"
+
+# 5. Importing the package stays cheap - the API loads on first use
+check "package import does not load the API" "$(python3 -c "
+import sys, cecelia_validation
+print('cecelia_validation.api' in sys.modules)")" "False"
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All validator library tests passed"
+else
+    exit 1
+fi
@@ -0,0 +1,64 @@
+#!/usr/bin/env bash
+# Test: PRD section index (cecelia_validation/prd.py) and per-section risk scoring
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+
+echo "=== Test: PRD Section Index ==="
+echo ""
+
+if python3 - "$SCRIPTS_DIR" << 'EOF'
+import sys
+import importlib.util
+sys.path.insert(0, sys.argv[1])
+
+spec = importlib.util.spec_from_file_location('validate_prd', sys.argv[1] + '/validate-prd.py')
+vp = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(vp)
+
+content = '\n'.join([
+    '# PRD',
+    '## 需求来源',
+    '风险 边界 异常 失败',
+    '## 风险评估',
+    '| 风险 | 影响 |',
+    '### 细节',
+    '缓解 应对 限制 假设',
+    '## 成功标准',
+    '**边界条件**',
+    '超时',
+    '## 技术方案',
+])
+index = vp.build_index(content)
+risk = index.text('风险评估')
+boundary = index.text('边界条件')
+
+checks = {
+    'present sections found': all(index.has(s) for s in ('需求来源', '风险评估', '成功标准', '边界条件', '技术方案')),
+    'missing sections absent': not index.has('功能描述') and not index.has('涉及文件'),
+    'section includes its subsections': risk.startswith('## 风险评估') and '缓解 应对' in risk,
+    'section ends at next same-level heading': '## 成功标准' not in risk,
+    'bold section ends at next heading': boundary == '**边界条件**\n超时\n',
+    'non-empty lines counted': index.non_empty_lines == 11,
+}
+
+# Same risk keywords outside the risk sections do not score
+outside = content.replace('## 风险评估', '## 其他').replace('**边界条件**', '**其他**')
+inside = vp.validate_content(vp.build_index(content))
+moved = vp.validate_content(vp.build_index(outside))
+risk_issue = [i for i in moved['content_issues'] if i.startswith('风险识别不完整')]
+checks['risk scored inside risk sections'] = not any(i.startswith('风险识别不完整') for i in inside['content_issues'])
+checks['risk outside risk sections not scored'] = len(risk_issue) == 1 and '(0/15分)' in risk_issue[0]
+
+for name, ok in checks.items():
+    print(f"{'✅ PASS' if ok else '❌ FAIL'}: {name}")
+sys.exit(0 if all(checks.values()) else 1)
+EOF
+then
+    echo ""
+    echo "✅ All PRD section index tests passed"
+else
+    exit 1
+fi
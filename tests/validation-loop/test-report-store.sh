@@ -0,0 +1,140 @@
+#!/usr/bin/env bash
+# Test: SQLite report store (CECELIA_VALIDATION_STORE) and the reports query CLI
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+OKR_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+unset CECELIA_VALIDATION_STORE
+DB="$TEST_DIR/reports.sqlite3"
+
+echo "=== Test: Report Store ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$ENGINE_ROOT/scripts/bench/corpus.py" "$@" > /dev/null; }
+reports() { PYTHONPATH="$SCRIPTS_DIR" python3 -m cecelia_validation reports --db "$DB" "$@"; }
+sql() { python3 -c "import sqlite3, sys; print(sqlite3.connect(sys.argv[1]).execute(sys.argv[2]).fetchone()[0])" "$DB" "$1"; }
+
+gen dod 4K -o .dod-a.md --seed 1
+gen prd 4K -o .prd-a.md --seed 2
+mkdir batch
+for seed in 3 4 5; do gen dod 2K -o "batch/.dod-$seed.md" --seed "$seed"; done
+# Two short DoDs: the same issue with different numbers
+printf -- '- [ ] 实现\n- [ ] 完成\n' > .dod-short1.md
+printf -- '- [ ] 实现\n- [ ] 完成\n- [ ] 测试\n' > .dod-short2.md
+cat > output.json << 'EOF'
+{"objective": "o", "key_results": [{"features": []}, {"features": []}]}
+EOF
+
+# 1. Off by default
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md > /dev/null || true
+check "no database by default" "$([ -e "$DB" ] && echo exists || echo none)" "none"
+
+# 2. Every validator and mode records its reports
+export CECELIA_VALIDATION_STORE="$DB"
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md > /dev/null || true
+python3 "$SCRIPTS_DIR/validate-prd.py" .prd-a.md --timings > /dev/null || true
+python3 "$SCRIPTS_DIR/validate-dod.py" --batch batch --jobs 1 > /dev/null || true
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-short1.md > /dev/null || true
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-short2.md > /dev/null || true
+python3 "$OKR_SCRIPT" output.json > /dev/null || true
+check "reports per validator" "$(reports --json stats | jq -sc 'map({(.validator): .reports}) | add')" \
+    '{"dod":6,"okr":1,"prd":1}'
+check "WAL mode" "$(sql 'PRAGMA journal_mode')" "wal"
+check "timings stored" "$(sql "SELECT COUNT(*) FROM reports WHERE timings IS NOT NULL AND validator = 'prd'")" "1"
+check "rule-set version stored" "$(sql "SELECT COUNT(*) FROM reports WHERE ruleset_version IS NULL")" "0"
+check "rule-set version is the same kind for every validator" \
+    "$(sql "SELECT COUNT(*) FROM reports WHERE length(ruleset_version) = 64")" "0"
+check "DoD/PRD rule file hash stored" \
+    "$(sql "SELECT COUNT(*) FROM reports WHERE ruleset_sha256 = json_extract(report, '$.ruleset_sha256')")" "7"
+check "OKR has no rule file hash" "$(sql "SELECT COUNT(*) FROM reports WHERE validator = 'okr' AND ruleset_sha256 IS NULL")" "1"
+check "report file unchanged" "$(jq -r '.dod_file' .dod-validation-report.json)" ".dod-short2.md"
+
+# 3. Queries
+check "lowest score first" "$(reports --json lowest --since 1d --limit 1 | jq -r '.validator')" "okr"
+check "--validator filter" "$(reports --json lowest --validator dod --limit 2 | jq -r '.file' | xargs -n1 basename | paste -sd,)" \
+    ".dod-short1.md,.dod-short2.md"
+check "issues normalized across documents" \
+    "$(reports --json issues --since 7d --validator dod | jq -r 'select(.pattern | startswith("Too few checklist items")) | .reports')" "2"
+check "lowest in window equals a full scan" \
+    "$(reports --json lowest --since 7d --limit 100 | jq -s 'map(.total_score) | join(",")')" \
+    "\"$(sql "SELECT group_concat(total_score) FROM (SELECT total_score FROM reports NOT INDEXED ORDER BY total_score)")\""
+
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md > /dev/null || true
+check "file history" "$(reports --json file .dod-a.md | jq -s 'length')" "2"
+check "runs of a content hash" "$(reports --json hash "$(jq -r '.content_sha256' .dod-validation-report.json)" | jq -s 'length')" "2"
+check "table output has a header" "$(reports stats | head -1 | cut -f1-3)" "$(printf 'validator\treports\tpassing')"
+
+# 4. Import existing report files
+python3 "$SCRIPTS_DIR/validate-prd.py" .prd-a.md > /dev/null || true
+cp .prd-validation-report.json old-report.json
+rm -f "$DB"*
+reports import old-report.json .dod-validation-reports 2> import.log && imported=0 || imported=$?
+check "import records valid reports" "$(reports --json stats | jq -r '.validator + ":" + (.reports | tostring)')" "prd:1"
+check "import exits 2 on unreadable files" "$imported" "2"
+
+# 5. Store problems never fail a validation
+CECELIA_VALIDATION_STORE=/dev/null/reports.sqlite3 python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md > ok.log 2> warn.log \
+    && status=0 || status=$?
+check "validation exit code unaffected" "$status" "$(jq -r 'if .passing then 0 else 1 end' .dod-validation-report.json)"
+check "store problem warned" "$(grep -c 'Warning: cannot record reports' warn.log)" "1"
+
+# 6. Concurrent batches are all recorded
+rm -f "$DB"*
+for i in 1 2 3 4; do
+    python3 "$SCRIPTS_DIR/validate-dod.py" --batch batch --jobs 1 --report-dir "r$i" > /dev/null 2>&1 &
+done
+wait
+check "concurrent runs all recorded" "$(sql 'SELECT COUNT(*) FROM reports')" "12"
+
+# 7. A v1 database (rule file hash stored as ruleset_version) is migrated
+rm -f "$DB"*
+python3 - "$DB" << 'EOF'
+import json, sqlite3, sys
+db = sqlite3.connect(sys.argv[1])
+db.execute('CREATE TABLE reports (id INTEGER PRIMARY KEY, validator TEXT NOT NULL, file TEXT, '
+           'content_hash TEXT, git_blob TEXT, validation_version TEXT, ruleset_version TEXT, '
+           'total_score NUMERIC, form_score NUMERIC, content_score NUMERIC, passing INTEGER, '
+           'error TEXT, recorded_at REAL NOT NULL, cwd TEXT, timings TEXT, report TEXT NOT NULL)')
+db.execute("INSERT INTO reports (validator, ruleset_version, recorded_at, report) VALUES (?, ?, 0, ?)",
+           ('dod', 'a' * 64, json.dumps({'ruleset_version': '1', 'ruleset_sha256': 'a' * 64})))
+db.execute("INSERT INTO reports (validator, ruleset_version, recorded_at, report) VALUES ('okr', '3', 0, '{}')")
+db.execute('PRAGMA user_version = 1')
+db.commit()
+EOF
+reports stats > /dev/null
+check "v1 rows split into version and hash" \
+    "$(sql "SELECT group_concat(validator || ':' || ruleset_version || ':' || coalesce(substr(ruleset_sha256, 1, 4), '-')) FROM reports")" \
+    "dod:1:aaaa,okr:3:-"
+check "schema version bumped" "$(sql 'PRAGMA user_version')" "2"
+
+# 8. Errors
+set +e
+reports lowest --since soon > /dev/null 2>&1
+check "bad --since exits 2" "$?" "2"
+PYTHONPATH="$SCRIPTS_DIR" python3 -m cecelia_validation reports --db "$TEST_DIR/missing.db" stats > /dev/null 2>&1
+check "missing database exits 2" "$?" "2"
+set -e
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All report store tests passed"
+else
+    exit 1
+fi
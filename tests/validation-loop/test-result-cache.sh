@@ -0,0 +1,125 @@
+#!/usr/bin/env bash
+# Test: content-addressed result cache for the validators
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+VALIDATE_DOD="$SCRIPTS_DIR/validate-dod.py"
+
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+
+echo "=== Test: Validation Result Cache ==="
+echo ""
+
+cat > .dod-test.md << 'EOF'
+---
+id: test
+---
+
+- [ ] 实现功能
+  - Test: `bash run.sh`
+EOF
+
+# Test 1: First run populates the cache, second run is served from it
+echo "Test 1: Cache populated and reused"
+python3 "$VALIDATE_DOD" .dod-test.md > /dev/null || true
+FIRST=$(jq -c 'del(.timestamp)' .dod-validation-report.json)
+ENTRIES=$(ls "$CECELIA_VALIDATION_CACHE_DIR"/*.json | wc -l)
+python3 "$VALIDATE_DOD" .dod-test.md > /dev/null || true
+SECOND=$(jq -c 'del(.timestamp)' .dod-validation-report.json)
+
+if [[ "$ENTRIES" -eq 1 ]] && [[ "$FIRST" == "$SECOND" ]]; then
+    echo "✅ PASS: 1 cache entry, identical report on rerun"
+else
+    echo "❌ FAIL: entries=$ENTRIES, reports differ: $FIRST vs $SECOND" >&2
+    exit 1
+fi
+
+# Test 2: Changed content misses the cache and is rescored
+echo ""
+echo "Test 2: Changed content rescored"
+echo "- [ ] 测试 README 文档" >> .dod-test.md
+python3 "$VALIDATE_DOD" .dod-test.md > /dev/null || true
+REPORT_SHA=$(jq -r '.content_sha256' .dod-validation-report.json)
+ACTUAL_SHA=$(sha256sum .dod-test.md | awk '{print $1}')
+ENTRIES=$(ls "$CECELIA_VALIDATION_CACHE_DIR"/*.json | wc -l)
+if [[ "$REPORT_SHA" == "$ACTUAL_SHA" ]] && [[ "$ENTRIES" -eq 2 ]]; then
+    echo "✅ PASS: New hash, new cache entry"
+else
+    echo "❌ FAIL: sha=$REPORT_SHA actual=$ACTUAL_SHA entries=$ENTRIES" >&2
+    exit 1
+fi
+
+# Test 3: --no-cache and CECELIA_VALIDATION_CACHE=0 bypass the cache
+echo ""
+echo "Test 3: Cache bypass"
+echo "- [ ] 性能 check" >> .dod-test.md
+python3 "$VALIDATE_DOD" --no-cache .dod-test.md > /dev/null || true
+CECELIA_VALIDATION_CACHE=0 python3 "$VALIDATE_DOD" .dod-test.md > /dev/null || true
+ENTRIES=$(ls "$CECELIA_VALIDATION_CACHE_DIR"/*.json | wc -l)
+if [[ "$ENTRIES" -eq 2 ]]; then
+    echo "✅ PASS: No entries written when disabled"
+else
+    echo "❌ FAIL: Expected 2 entries, got $ENTRIES" >&2
+    exit 1
+fi
+
+# Test 4: LRU cap and age eviction
+echo ""
+echo "Test 4: LRU and age eviction"
+if PYTHONPATH="$SCRIPTS_DIR" python3 - "$TEST_DIR/lru" << 'EOF'
+import os, sys, time
+from cecelia_validation.cache import ResultCache
+
+cache = ResultCache(sys.argv[1], max_entries=2, max_age=60)
+for i in range(3):
+    cache.put(f'k{i}', {'n': i})
+    os.utime(cache._path(f'k{i}'), (time.time() - 30 + i, time.time() - 30 + i))
+    if i == 1:
+        cache.get('k0')  # k0 becomes most recently used
+
+cache.put('k3', {'n': 3})
+assert cache.get('k1') is None, 'least recently used entry should be evicted'
+assert cache.get('k0') == {'n': 0}
+
+os.utime(cache._path('k0'), (time.time() - 120, time.time() - 120))
+assert cache.get('k0') is None, 'expired entry should be dropped'
+EOF
+then
+    echo "✅ PASS: LRU entry and expired entry evicted"
+else
+    echo "❌ FAIL: Eviction incorrect" >&2
+    exit 1
+fi
+
+# Test 5: Eviction pass amortized over writes (shared across cache instances)
+echo ""
+echo "Test 5: Eviction amortized over writes"
+if PYTHONPATH="$SCRIPTS_DIR" python3 - "$TEST_DIR/amortized" << 'EOF'
+import sys
+from cecelia_validation.cache import ResultCache
+
+passes = []
+for i in range(500):
+    # A new instance per write, like one validator process per document
+    cache = ResultCache(sys.argv[1], max_entries=200)
+    cache.evict = lambda cache=cache: passes.append(1) or ResultCache.evict(cache)
+    cache.put(f'k{i}', {'n': i})
+assert len(passes) == 50, f'expected 50 eviction passes, got {len(passes)}'
+entries = len(list(cache.cache_dir.glob('*.json')))
+assert entries <= 200 + cache.evict_every, f'{entries} entries above the soft cap'
+EOF
+then
+    echo "✅ PASS: 50 eviction passes for 500 writes, size cap held"
+else
+    echo "❌ FAIL: Eviction not amortized" >&2
+    exit 1
+fi
+
+echo ""
+echo "✅ All result cache tests passed"
@@ -0,0 +1,107 @@
+#!/usr/bin/env bash
+# Test: declarative rule sets (cecelia_validation/rulesets) and the compiled artifact cache
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+unset CECELIA_VALIDATION_CACHE CECELIA_VALIDATION_STORE
+
+echo "=== Test: Rule Sets ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$ENGINE_ROOT/scripts/bench/corpus.py" "$@" > /dev/null; }
+artifacts() { find cache/rulesets -name "$1-*.marshal" 2>/dev/null | wc -l | tr -d ' '; }
+
+gen dod 4K -o .dod-a.md --seed 1
+gen prd 4K -o .prd-a.md --seed 2
+DOD_SHA=$(sha256sum "$SCRIPTS_DIR/cecelia_validation/rulesets/dod.json" | cut -d' ' -f1)
+PRD_SHA=$(sha256sum "$SCRIPTS_DIR/cecelia_validation/rulesets/prd.json" | cut -d' ' -f1)
+
+# 1. Rule-set hash in every report
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md > /dev/null || true
+python3 "$SCRIPTS_DIR/validate-prd.py" .prd-a.md > /dev/null || true
+check "DoD report records the rule-file hash" "$(jq -r '.ruleset_sha256' .dod-validation-report.json)" "$DOD_SHA"
+check "PRD report records the rule-file hash" "$(jq -r '.ruleset_sha256' .prd-validation-report.json)" "$PRD_SHA"
+check "rule-set version recorded" "$(jq -r '.ruleset_version' .prd-validation-report.json)" "1"
+mkdir batch && cp .dod-a.md batch/
+python3 "$SCRIPTS_DIR/validate-dod.py" --batch batch --jobs 1 --report-dir r > /dev/null || true
+check "batch reports record the hash" "$(jq -r '.ruleset_sha256' r/*.json)" "$DOD_SHA"
+
+# 2. Compiled once, then loaded from the artifact
+check "compiled DoD artifact cached" "$(artifacts dod)" "1"
+check "compiled PRD artifact cached" "$(artifacts prd)" "1"
+ARTIFACT=$(find cache/rulesets -name 'dod-*.marshal')
+check "artifact keyed by the rule-file hash" "$(basename "$ARTIFACT" | cut -d- -f2 | cut -d. -f1)" "${DOD_SHA:0:16}"
+BEFORE=$(stat -c %Y "$ARTIFACT")
+sleep 1
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md --no-cache > /dev/null || true
+check "artifact reused, not rebuilt" "$(stat -c %Y "$ARTIFACT")" "$BEFORE"
+
+# A corrupt artifact is rebuilt, scores unchanged
+SCORE=$(jq '.total_score' .dod-validation-report.json)
+echo garbage > "$ARTIFACT"
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md --no-cache > /dev/null || true
+check "corrupt artifact rebuilt" "$(jq '.total_score' .dod-validation-report.json)" "$SCORE"
+
+# 3. Tuning the rule file: new hash, new artifact, new score - no code edits
+cp -r "$SCRIPTS_DIR" tuned
+python3 - tuned/cecelia_validation/rulesets/dod.json << 'EOF'
+import json, sys
+rules = json.load(open(sys.argv[1]))
+rules['version'] = '2'
+rules['form'][0]['min'] = 1000
+json.dump(rules, open(sys.argv[1], 'w'), ensure_ascii=False, indent=2)
+EOF
+python3 tuned/validate-dod.py .dod-a.md > /dev/null || true
+check "tuned rules change the score" "$(jq '.total_score' .dod-validation-report.json)" "$((SCORE - 10))"
+check "tuned issue rendered from the template" \
+    "$(jq -r '.form_issues[0]' .dod-validation-report.json | grep -c 'need ≥1000) (-10分)')" "1"
+check "tuned rules get their own artifact" "$(artifacts dod)" "2"
+check "tuned hash recorded" "$(jq -r '.ruleset_sha256' .dod-validation-report.json)" \
+    "$(sha256sum tuned/cecelia_validation/rulesets/dod.json | cut -d' ' -f1)"
+
+# Cached results of the old rules are not reused
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-a.md > /dev/null || true
+check "result cache keyed by rule set" "$(jq '.total_score' .dod-validation-report.json)" "$SCORE"
+
+# 4. Invalid rule files are rejected with a message
+python3 - tuned/cecelia_validation/rulesets/dod.json << 'EOF'
+import json, sys
+rules = json.load(open(sys.argv[1]))
+rules['content'][0]['issue'] = '{nonexistent}'
+json.dump(rules, open(sys.argv[1], 'w'), ensure_ascii=False)
+EOF
+set +e
+python3 tuned/validate-dod.py .dod-a.md > /dev/null 2> bad.log
+status=$?
+set -e
+check "invalid rule file exits 2" "$status" "2"
+check "template error reported" "$(grep -c 'bad issue template' bad.log)" "1"
+
+# 5. Without the cache nothing is written
+rm -rf cache
+CECELIA_VALIDATION_CACHE=0 python3 "$SCRIPTS_DIR/validate-prd.py" .prd-a.md > /dev/null || true
+check "CECELIA_VALIDATION_CACHE=0 compiles in memory" "$([ -d cache ] && echo written || echo none)" "none"
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All rule set tests passed"
+else
+    exit 1
+fi
@@ -0,0 +1,86 @@
+#!/usr/bin/env bash
+# Test: chunked hashing and lazy line reading (cecelia_validation/source.py)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE=0
+
+echo "=== Test: Streaming Read ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+cat > lf.md << 'EOF'
+---
+id: test
+---
+
+# DoD
+
+- [ ] 实现功能 A 并验证返回值
+  - Test: `bash tests/test_a.sh`
+- [x] 添加测试用例覆盖边界情况
+  - Test: `npm test`
+EOF
+sed 's/$/\r/' lf.md > .dod-crlf.md
+
+# Test 1: CRLF document - hash is sha256sum of the raw bytes, scores match LF
+python3 "$SCRIPTS_DIR/validate-dod.py" lf.md > /dev/null 2>&1 || true
+LF_SCORE=$(jq -r '.total_score' .dod-validation-report.json)
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-crlf.md > /dev/null 2>&1 || true
+check "CRLF hash equals sha256sum" "$(jq -r '.content_sha256' .dod-validation-report.json)" \
+    "$(sha256sum .dod-crlf.md | awk '{print $1}')"
+check "CRLF scores like LF" "$(jq -r '.total_score' .dod-validation-report.json)" "$LF_SCORE"
+
+# Test 2: anti-cheat Layer 8 accepts a report of a document with CRLF lines
+{ head -1 lf.md; tail -n +2 lf.md | sed 's/$/\r/'; } > .dod-mixed.md
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-mixed.md > /dev/null 2>&1 || true
+python3 "$SCRIPTS_DIR/validate-dod.py" --verify .dod-mixed.md > out.txt 2>&1 || true
+grep -A1 "Layer 8: SHA256 hash match" out.txt | grep -q "✅ PASS" \
+    && check "CRLF lines pass SHA256 layer" ok ok || check "CRLF lines pass SHA256 layer" failed ok
+
+# Test 3: a 40MB document with pasted logs stays far below its own size in memory
+python3 - << 'EOF'
+line = '2026-01-01 12:00:00 INFO worker-3 processed request id=abcdef status=200 日志\n'
+with open('.dod-big.md', 'w') as f:
+    f.write('---\nid: big\n---\n\n- [ ] 实现功能并验证\n  - Test: `bash t.sh`\n\n```\n')
+    f.write(line * (40 * 1024 * 1024 // len(line.encode())))
+    f.write('```\n')
+EOF
+RSS_MB=$(python3 - "$SCRIPTS_DIR" << 'EOF'
+import resource, runpy, sys
+sys.path.insert(0, sys.argv[1])
+sys.argv = ['validate-dod.py', '.dod-big.md']
+try:
+    runpy.run_path(sys.path[0] + '/validate-dod.py', run_name='__main__')
+except SystemExit:
+    pass
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024)
+EOF
+)
+RSS_MB=$(echo "$RSS_MB" | tail -1)
+[ "$RSS_MB" -lt 40 ] && check "40MB document peak RSS < 40MB (${RSS_MB}MB)" ok ok \
+    || check "40MB document peak RSS < 40MB (${RSS_MB}MB)" too-high ok
+check "large document hash equals sha256sum" "$(jq -r '.content_sha256' .dod-validation-report.json)" \
+    "$(sha256sum .dod-big.md | awk '{print $1}')"
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All streaming read tests passed"
+else
+    exit 1
+fi
@@ -0,0 +1,90 @@
+#!/usr/bin/env bash
+# Test: --timings per-phase instrumentation and Prometheus textfile export
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+OKR_SCRIPT="$ENGINE_ROOT/skills/okr/scripts/validate-okr.py"
+TEST_DIR="$(mktemp -d)"
+trap 'rm -rf "$TEST_DIR"' EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+export CECELIA_VALIDATION_TEXTFILE="$TEST_DIR/metrics/cecelia_validation.prom"
+unset CECELIA_VALIDATION_TIMINGS
+
+echo "=== Test: Timings ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+metric() { grep -F "$1" "$CECELIA_VALIDATION_TEXTFILE" | awk '{print $2}'; }
+
+python3 "$ENGINE_ROOT/scripts/bench/corpus.py" dod 16K -o .dod-t.md > /dev/null
+python3 "$ENGINE_ROOT/scripts/bench/corpus.py" prd 16K -o .prd-t.md > /dev/null
+
+# 1. Off by default - no timings block, no textfile
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-t.md > /dev/null || true
+check "no timings block by default" "$(jq 'has("timings")' .dod-validation-report.json)" "false"
+check "no textfile by default" "$([ -e "$CECELIA_VALIDATION_TEXTFILE" ] && echo exists || echo none)" "none"
+
+# 2. --timings records every DoD phase (wall + CPU)
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-t.md --no-cache --timings > dod.log || true
+check "DoD phases recorded" "$(jq -c '.timings.phases | keys_unsorted' .dod-validation-report.json)" \
+    '["hash","parse","validate_form","validate_content","write_report"]'
+check "wall and CPU time per phase" "$(jq '[.timings.phases[] | select(.wall_ms >= 0 and .cpu_ms >= 0 and .calls == 1)] | length' .dod-validation-report.json)" "5"
+check "timings printed" "$(grep -c '^Timings: hash' dod.log)" "1"
+
+# 3. Environment switch (PRD)
+CECELIA_VALIDATION_TIMINGS=1 python3 "$SCRIPTS_DIR/validate-prd.py" .prd-t.md --no-cache > /dev/null || true
+check "CECELIA_VALIDATION_TIMINGS=1 enables timings" "$(jq '.timings.phases | has("validate_content")' .prd-validation-report.json)" "true"
+
+# 4. Report with timings still passes the anti-cheat verification
+python3 "$SCRIPTS_DIR/validate-dod.py" --verify .dod-t.md > /dev/null 2>&1 && verified=0 || verified=$?
+dod_passing=$(jq -r '.passing' .dod-validation-report.json)
+check "--verify accepts a timed report" "$verified" "$([ "$dod_passing" = true ] && echo 0 || echo 2)"
+
+# 5. OKR: capability lookups timed inside validate_form
+cat > caps.txt << 'EOF'
+# cecelia-capability-index v1
+cap-a
+EOF
+cat > output.json << 'EOF'
+{"objective": "o", "initiatives": [{"title": "i", "capability_id": "cap-a", "from_stage": 1, "to_stage": 2,
+  "evidence_required": "e", "pr_plans": [{"sequence": 1, "title": "p", "tasks": [{"title": "t"}]}]}]}
+EOF
+python3 "$OKR_SCRIPT" output.json --no-cache --capability-index caps.txt --timings > okr.log || true
+check "OKR phases recorded" "$(jq -c '.timings.phases | keys_unsorted' validation-report.json)" \
+    '["load","hash","check_capability_exists","validate_form","write_report"]'
+
+# 6. Prometheus textfile: cumulative counters and histograms
+check "runs counted per validator/result" "$(metric 'cecelia_validation_runs_total{validator="okr",result="fail"}')" "1"
+check "histogram count per phase" "$(metric 'cecelia_validation_phase_seconds_count{validator="dod",phase="parse"}')" "1"
+check "+Inf bucket equals count" "$(metric 'cecelia_validation_phase_seconds_bucket{validator="dod",phase="parse",le="+Inf"}')" "1"
+check "CPU counter exported" "$(grep -c '^cecelia_validation_phase_cpu_seconds_total{validator="prd",phase="parse"}' "$CECELIA_VALIDATION_TEXTFILE")" "1"
+check "TYPE lines present" "$(grep -c '^# TYPE' "$CECELIA_VALIDATION_TEXTFILE")" "3"
+
+# 7. Concurrent runs are all counted (flock + atomic replace)
+for i in 1 2 3 4 5 6; do
+    python3 "$SCRIPTS_DIR/validate-dod.py" .dod-t.md --no-cache --timings > /dev/null 2>&1 &
+done
+wait
+runs=$(grep '^cecelia_validation_runs_total{validator="dod"' "$CECELIA_VALIDATION_TEXTFILE" | awk '{s += $2} END {print s}')
+check "concurrent runs all counted" "$runs" "7"
+check "no temp files left" "$(ls -A "$(dirname "$CECELIA_VALIDATION_TEXTFILE")" | grep -c '\.tmp$' || true)" "0"
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All timings tests passed"
+else
+    exit 1
+fi
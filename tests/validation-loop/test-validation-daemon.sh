@@ -0,0 +1,198 @@
+#!/usr/bin/env bash
+# Test: validation daemon + thin client (validate-daemon.py / validate-client.py)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+CLIENT="$SCRIPTS_DIR/validate-client.py"
+DAEMON="$SCRIPTS_DIR/validate-daemon.py"
+
+TEST_DIR="$(mktemp -d)"
+export CECELIA_VALIDATION_SOCKET="$TEST_DIR/validate.sock"
+export CECELIA_VALIDATION_CACHE=0
+
+cleanup() {
+    python3 "$DAEMON" stop > /dev/null 2>&1 || true
+    rm -rf "$TEST_DIR"
+}
+trap cleanup EXIT
+cd "$TEST_DIR"
+
+echo "=== Test: Validation Daemon ==="
+echo ""
+
+cat > .dod-test.md << 'MD'
+---
+id: test
+---
+
+- [ ] 实现功能
+  - Test: `bash run.sh`
+MD
+
+# Reference: direct script run
+set +e
+python3 "$SCRIPTS_DIR/validate-dod.py" .dod-test.md > direct.out 2>&1
+DIRECT_EXIT=$?
+set -e
+DIRECT_REPORT=$(jq -c 'del(.timestamp)' .dod-validation-report.json)
+rm -f .dod-validation-report.json
+
+# Test 1: Client without a daemon falls back to in-process
+echo "Test 1: Fallback without daemon"
+set +e
+python3 "$CLIENT" dod .dod-test.md > fallback.out 2>&1
+FALLBACK_EXIT=$?
+set -e
+if [[ "$FALLBACK_EXIT" -eq "$DIRECT_EXIT" ]] && \
+   [[ "$(jq -c 'del(.timestamp)' .dod-validation-report.json)" == "$DIRECT_REPORT" ]] && \
+   diff -q direct.out fallback.out > /dev/null; then
+    echo "✅ PASS: Fallback matches direct run (exit $FALLBACK_EXIT)"
+else
+    echo "❌ FAIL: Fallback differs from direct run (exit $FALLBACK_EXIT vs $DIRECT_EXIT)" >&2
+    exit 1
+fi
+rm -f .dod-validation-report.json
+
+# Test 2: Daemon starts and answers ping
+echo ""
+echo "Test 2: Daemon start/status"
+python3 "$DAEMON" start > /dev/null
+if python3 "$DAEMON" status > /dev/null && [[ -S "$CECELIA_VALIDATION_SOCKET" ]]; then
+    MODE=$(stat -c '%a' "$CECELIA_VALIDATION_SOCKET")
+    if [[ "$MODE" != "600" ]]; then
+        echo "❌ FAIL: Socket mode $MODE, expected 600" >&2
+        exit 1
+    fi
+    echo "✅ PASS: Daemon running, socket mode 600"
+else
+    echo "❌ FAIL: Daemon did not start" >&2
+    exit 1
+fi
+
+# Test 3: Client via daemon matches direct run (output, exit code, report in cwd)
+echo ""
+echo "Test 3: Daemon result matches direct run"
+set +e
+python3 "$CLIENT" dod .dod-test.md > daemon.out 2>&1
+DAEMON_EXIT=$?
+set -e
+if [[ "$DAEMON_EXIT" -eq "$DIRECT_EXIT" ]] && \
+   [[ "$(jq -c 'del(.timestamp)' .dod-validation-report.json)" == "$DIRECT_REPORT" ]] && \
+   diff -q direct.out daemon.out > /dev/null; then
+    echo "✅ PASS: Daemon matches direct run (exit $DAEMON_EXIT)"
+else
+    echo "❌ FAIL: Daemon differs from direct run (exit $DAEMON_EXIT vs $DIRECT_EXIT)" >&2
+    diff direct.out daemon.out || true
+    exit 1
+fi
+
+# Test 4: Error exit code is relayed
+echo ""
+echo "Test 4: Missing file exits 2 via daemon"
+set +e
+python3 "$CLIENT" dod missing.md > /dev/null 2>&1
+MISSING_EXIT=$?
+set -e
+if [[ "$MISSING_EXIT" -eq 2 ]]; then
+    echo "✅ PASS: Exit code 2 relayed"
+else
+    echo "❌ FAIL: Expected exit 2, got $MISSING_EXIT" >&2
+    exit 1
+fi
+
+# Test 5: --watch / --batch are refused by the daemon and run in the client
+echo ""
+echo "Test 5: Long-running modes stay out of the daemon"
+REFUSED=$(PYTHONPATH="$SCRIPTS_DIR" python3 -c "
+import os
+from cecelia_validation.daemon import request
+print(','.join(str('error' in request({'validator': 'dod', 'argv': argv, 'cwd': os.getcwd()}, timeout=5))
+               for argv in (['--watch', '.dod-test.md'], ['--batch=.'], ['.dod-test.md'])))")
+python3 "$CLIENT" dod --watch .dod-test.md > watch.out 2>&1 &
+WATCH_PID=$!
+for _ in $(seq 1 100); do grep -q Watching watch.out && break; sleep 0.05; done
+START=$(date +%s%3N)
+python3 "$CLIENT" dod .dod-test.md > /dev/null 2>&1 || true
+ELAPSED=$(( $(date +%s%3N) - START ))
+kill "$WATCH_PID" 2>/dev/null || true
+wait "$WATCH_PID" 2>/dev/null || true
+if [[ "$REFUSED" == "True,True,False" ]] && grep -q Watching watch.out && [[ "$ELAPSED" -lt 5000 ]]; then
+    echo "✅ PASS: --watch/--batch refused, client watches in-process, daemon answered in ${ELAPSED}ms"
+else
+    echo "❌ FAIL: refused=$REFUSED, request during watch took ${ELAPSED}ms" >&2
+    cat watch.out >&2
+    exit 1
+fi
+
+# Test 6: Rule file and package changes reach a warm daemon
+echo ""
+echo "Test 6: Warm daemon reloads changed rules and package code"
+mkdir copy
+cp -r "$SCRIPTS_DIR/validate-dod.py" "$SCRIPTS_DIR/validate-client.py" "$SCRIPTS_DIR/validate-daemon.py" \
+    "$SCRIPTS_DIR/cecelia_validation" copy/
+export CECELIA_VALIDATION_SOCKET="$TEST_DIR/copy.sock"
+python3 copy/validate-daemon.py start > /dev/null
+python3 copy/validate-client.py dod .dod-test.md > /dev/null 2>&1 || true
+BEFORE=$(jq -r '.ruleset_sha256' .dod-validation-report.json)
+sed -i 's/"min": 5/"min": 1/' copy/cecelia_validation/rulesets/dod.json
+sed -i 's/^PASS_SCORE = 90$/PASS_SCORE = 0/' copy/cecelia_validation/report.py
+sed -i 's/{self.label} Validation Report:/{self.label} Validation Report (edited):/' copy/cecelia_validation/cli.py
+python3 copy/validate-client.py dod .dod-test.md > reload.out 2>&1 || true
+AFTER=$(jq -c '[.ruleset_sha256, .passing]' .dod-validation-report.json)
+python3 copy/validate-dod.py .dod-test.md > /dev/null 2>&1 || true
+EXPECTED=$(jq -c '[.ruleset_sha256, .passing]' .dod-validation-report.json)
+python3 copy/validate-daemon.py stop > /dev/null
+export CECELIA_VALIDATION_SOCKET="$TEST_DIR/validate.sock"
+if [[ "$AFTER" == "$EXPECTED" ]] && [[ "$AFTER" != "[\"$BEFORE\",false]" ]] && \
+   grep -q 'Validation Report (edited):' reload.out && \
+   [[ "$AFTER" == *"$(sha256sum copy/cecelia_validation/rulesets/dod.json | cut -d' ' -f1)"* ]]; then
+    echo "✅ PASS: Daemon report uses the edited rule file and package code"
+else
+    echo "❌ FAIL: Daemon served stale rules/code: $AFTER, expected $EXPECTED" >&2
+    exit 1
+fi
+rm -f .dod-validation-report.json
+
+# Test 7: Stopped daemon - client falls back again
+echo ""
+echo "Test 7: Fallback after stop"
+python3 "$DAEMON" stop > /dev/null
+for _ in $(seq 1 50); do
+    [[ -S "$CECELIA_VALIDATION_SOCKET" ]] || break
+    sleep 0.1
+done
+rm -f .dod-validation-report.json
+set +e
+python3 "$CLIENT" dod .dod-test.md > /dev/null 2>&1
+STOPPED_EXIT=$?
+set -e
+if [[ "$STOPPED_EXIT" -eq "$DIRECT_EXIT" ]] && [[ -f .dod-validation-report.json ]] && \
+   ! python3 "$DAEMON" status > /dev/null 2>&1; then
+    echo "✅ PASS: Daemon stopped, client still validates"
+else
+    echo "❌ FAIL: Fallback after stop failed" >&2
+    exit 1
+fi
+
+# Test 8: Client and daemon share one endpoint definition; the client stays light
+echo ""
+echo "Test 8: Shared endpoint, light client"
+if PYTHONPATH="$SCRIPTS_DIR" python3 << 'EOF'
+import sys
+from cecelia_validation import client
+assert 'cecelia_validation.daemon' not in sys.modules and 'cecelia_validation.cli' not in sys.modules
+from cecelia_validation import daemon, endpoint
+assert client.socket_path is daemon.socket_path is endpoint.socket_path
+assert client.forwarded_env is daemon.forwarded_env is endpoint.forwarded_env
+EOF
+then
+    echo "✅ PASS: Socket path and forwarded env come from endpoint.py"
+else
+    echo "❌ FAIL: Client duplicates the daemon endpoint or imports the daemon" >&2
+    exit 1
+fi
+
+echo ""
+echo "✅ All validation daemon tests passed"
@@ -0,0 +1,134 @@
+#!/usr/bin/env bash
+# Test: --watch (inotify / polling, debounced rescoring, atomic reports)
+
+set -e
+
+ENGINE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+SCRIPTS_DIR="$ENGINE_ROOT/skills/dev/scripts"
+TEST_DIR="$(mktemp -d)"
+WATCH_PID=""
+
+cleanup() {
+    [ -n "$WATCH_PID" ] && kill "$WATCH_PID" 2>/dev/null || true
+    rm -rf "$TEST_DIR"
+}
+trap cleanup EXIT
+cd "$TEST_DIR"
+
+export CECELIA_VALIDATION_CACHE_DIR="$TEST_DIR/cache"
+unset CECELIA_VALIDATION_STORE
+
+echo "=== Test: Watch Mode ==="
+echo ""
+
+FAILED=0
+check() {
+    if [ "$2" = "$3" ]; then
+        echo "✅ PASS: $1"
+    else
+        echo "❌ FAIL: $1 (expected $3, got $2)"
+        FAILED=1
+    fi
+}
+
+gen() { python3 "$ENGINE_ROOT/scripts/bench/corpus.py" "$@" > /dev/null; }
+start() {
+    python3 "$@" > watch.log 2>&1 &
+    WATCH_PID=$!
+    wait_for "grep -q Watching watch.log"
+}
+stop() {
+    kill "$WATCH_PID"
+    wait "$WATCH_PID" && status=0 || status=$?
+    WATCH_PID=""
+}
+# Poll a condition for up to 5s
+wait_for() {
+    for _ in $(seq 1 100); do
+        eval "$1" && return 0
+        sleep 0.05
+    done
+    return 1
+}
+rescores() { grep -c "$1:" watch.log || true; }
+report_sha() { jq -r '.content_sha256' "$1" 2>/dev/null; }
+
+gen dod 4K -o .dod-a.md --seed 1
+printf -- '---\nid: t\n---\n- [ ] 实现\n' > .dod-short.md
+
+# 1. File target: initial score, then rescore on save
+start "$SCRIPTS_DIR/validate-dod.py" --watch .dod-short.md --debounce 100
+check "initial report written" "$(report_sha .dod-validation-report.json)" "$(sha256sum .dod-short.md | cut -d' ' -f1)"
+check "inotify used" "$(grep -c 'via inotify' watch.log)" "1"
+
+cat .dod-a.md > .dod-short.md
+START=$(date +%s%3N)
+wait_for '[ "$(report_sha .dod-validation-report.json)" = "$(sha256sum .dod-short.md | cut -d" " -f1)" ]' \
+    && rescored=yes || rescored=no
+LATENCY=$(( $(date +%s%3N) - START ))
+check "save rescored" "$rescored" "yes"
+echo "   save -> report: ${LATENCY}ms"
+check "feedback within the debounce window (<1s)" "$([ "$LATENCY" -lt 1000 ] && echo yes || echo no)" "yes"
+check "report matches a full run" "$(jq '.total_score' .dod-validation-report.json)" \
+    "$(cd "$(mktemp -d)" && python3 "$SCRIPTS_DIR/validate-dod.py" "$TEST_DIR/.dod-short.md" > /dev/null; jq '.total_score' .dod-validation-report.json)"
+
+# 2. A burst of writes is one rescore
+BEFORE=$(rescores .dod-short.md)
+for i in $(seq 1 20); do echo "- [ ] 检查 $i" >> .dod-short.md; done
+wait_for '[ "$(report_sha .dod-validation-report.json)" = "$(sha256sum .dod-short.md | cut -d" " -f1)" ]' || true
+sleep 0.3
+check "burst of 20 writes collapsed into one rescore" "$(( $(rescores .dod-short.md) - BEFORE ))" "1"
+
+# 3. Saving unchanged content does not rewrite the report
+BEFORE=$(rescores .dod-short.md)
+touch .dod-short.md
+sleep 0.5
+check "unchanged save not rescored" "$(( $(rescores .dod-short.md) - BEFORE ))" "0"
+
+# 4. Editor-style save (write a temp file, rename over the original)
+printf -- '---\nid: t\n---\n- [ ] 实现\n- [ ] 完成\n' > .dod-short.md.swp
+mv .dod-short.md.swp .dod-short.md
+wait_for '[ "$(report_sha .dod-validation-report.json)" = "$(sha256sum .dod-short.md | cut -d" " -f1)" ]' \
+    && renamed=yes || renamed=no
+check "rename-over save picked up" "$renamed" "yes"
+check "no temp report files left" "$(ls -A | grep -c '\.tmp$' || true)" "0"
+
+stop
+check "SIGTERM exits 0" "$status" "0"
+
+# 5. Directory target: per-file reports, only changed files rescored, new files picked up
+mkdir docs
+gen dod 2K -o docs/.dod-1.md --seed 2
+gen dod 2K -o docs/.dod-2.md --seed 3
+start "$SCRIPTS_DIR/validate-dod.py" --watch docs --report-dir reports --debounce 100
+check "initial per-file reports" "$(ls reports | wc -l | tr -d ' ')" "2"
+echo "- [ ] 验证 文档" >> docs/.dod-1.md
+wait_for '[ "$(report_sha reports/docs__.dod-1.md.json)" = "$(sha256sum docs/.dod-1.md | cut -d" " -f1)" ]' || true
+sleep 0.3
+check "changed file rescored" "$(rescores docs/.dod-1.md)" "2"
+check "unchanged file not rescored" "$(rescores docs/.dod-2.md)" "1"
+mkdir docs/sub
+gen dod 2K -o docs/sub/.dod-3.md --seed 4
+wait_for '[ -s reports/docs__sub__.dod-3.md.json ]' && created=yes || created=no
+check "new file in a new subdirectory picked up" "$created" "yes"
+echo "notes" > docs/notes.md
+sleep 0.3
+check "non-matching files ignored" "$(grep -c 'notes.md' watch.log || true)" "0"
+stop
+
+# 6. Polling fallback, PRD validator
+gen prd 4K -o .prd-a.md --seed 5
+start "$SCRIPTS_DIR/validate-prd.py" --watch .prd-a.md --poll --debounce 100
+check "polling used with --poll" "$(grep -c 'via polling' watch.log)" "1"
+echo "## 风险评估" >> .prd-a.md
+wait_for '[ "$(report_sha .prd-validation-report.json)" = "$(sha256sum .prd-a.md | cut -d" " -f1)" ]' \
+    && polled=yes || polled=no
+check "polling detects the save" "$polled" "yes"
+stop
+
+echo ""
+if [ "$FAILED" -eq 0 ]; then
+    echo "✅ All watch mode tests passed"
+else
+    exit 1
+fi